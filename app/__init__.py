@@ -22,9 +22,49 @@ def create_app():
               security='Bearer Auth'
               )
 
+    # 요청 단위 DB 세션 정리 (teardown)
+    from app.models import database
+    database.init_app(app)
+
+    # 첫 요청 전에 커넥션 풀 채우기
+    if app.config.get('DB_POOL_WARM_UP'):
+        try:
+            database.warm_up_pool()
+        except Exception as e:
+            print(f"Failed to warm up connection pool: {e}")
+
+    # 제목 검색 전략 설정 (알 수 없는 값이면 시작 시 실패)
+    from app.models.title_search import configure_title_search
+    configure_title_search(app.config['TITLE_SEARCH_STRATEGY'], app.config['TITLE_RELEVANCE_MAX_CANDIDATES'])
+
+    # 응답 JSON 직렬화 (orjson이 있으면 사용)
+    from app.views.serializer import init_api
+    init_api(api, app.config['JSON_SERIALIZER'])
+
     # 인증 미드웨어 추가    
     from app.middlewares.auth_guard import AuthGuard
     AuthGuard.init_app(app)
+
+    # refresh token 폐기 여부 캐시 설정
+    from app.models.refresh_token_cache import refresh_token_cache
+    refresh_token_cache.configure(
+        backend=app.config['REFRESH_TOKEN_CACHE_BACKEND'],
+        ttl_seconds=app.config['REFRESH_TOKEN_CACHE_TTL_SECONDS'],
+        max_entries=app.config['REFRESH_TOKEN_CACHE_MAX_ENTRIES'],
+        redis_options={
+            'host': app.config['REDIS_DB_URL'],
+            'port': app.config['REDIS_DB_PORT'],
+            'password': app.config['REDIS_DB_PASSWORD'],
+        },
+    )
+
+    # 응답 압축 미들웨어 추가 (gzip, brotli 설치 시 br)
+    from app.middlewares.compression import Compression
+    Compression.init_app(app)
+
+    # CLI 명령어 등록 (flask --app run <명령어>)
+    from app import commands
+    commands.init_app(app)
         
     # 라우트 추가
     from app.routes import auth_route, application_route, job_route, bookmark_route, meta_route
@@ -34,6 +74,88 @@ def create_app():
     api.add_namespace(bookmark_route.bookmark, path='/bookmarks')
     api.add_namespace(meta_route.meta, path='/metas')
 
+    # 코드 테이블 캐시 적재 (실패 시 첫 /metas 요청에서 다시 시도)
+    from app.models.code_cache import code_table_cache
+    db = database.SessionLocal()
+    try:
+        code_table_cache.load(db)
+    except Exception as e:
+        print(f"Failed to load code tables: {e}")
+    finally:
+        db.close()
+
+    # 채용 공고 검색 인덱스 적재 (변경분은 백그라운드 스레드에서 변경 로그를 읽어 반영)
+    if app.config.get('POSTING_INDEX_ENABLED'):
+        from app.models.posting_index import posting_index
+        posting_index.configure(
+            database.SessionLocal,
+            refresh_interval_seconds=app.config['POSTING_INDEX_REFRESH_SECONDS'],
+            change_retention_seconds=app.config['POSTING_CHANGE_RETENTION_SECONDS'],
+        )
+        db = database.SessionLocal()
+        try:
+            posting_index.load(db)
+        except Exception as e:
+            print(f"Failed to load posting index: {e}")
+        finally:
+            db.close()
+        posting_index.start()
+
+    # 채용 공고 조회수 write-behind 카운터 시작 (종료 시 남은 조회수 반영)
+    from app.models.view_counter import view_counter
+    view_counter.configure(
+        database.SessionLocal,
+        backend=app.config['VIEW_COUNTER_BACKEND'],
+        flush_seconds=app.config['VIEW_COUNTER_FLUSH_SECONDS'],
+        flush_threshold=app.config['VIEW_COUNTER_FLUSH_THRESHOLD'],
+        redis_options={
+            'host': app.config['REDIS_DB_URL'],
+            'port': app.config['REDIS_DB_PORT'],
+            'password': app.config['REDIS_DB_PASSWORD'],
+        },
+    )
+    view_counter.start()
+
+    # 감사 로그 writer 시작 (async 모드, 종료 시 남은 로그 저장)
+    from app.models.audit_log_writer import audit_log_writer
+    audit_log_writer.configure(
+        database.SessionLocal,
+        mode=app.config['AUDIT_LOG_MODE'],
+        max_queue_size=app.config['AUDIT_LOG_QUEUE_SIZE'],
+        batch_size=app.config['AUDIT_LOG_BATCH_SIZE'],
+        flush_seconds=app.config['AUDIT_LOG_FLUSH_SECONDS'],
+        put_timeout=app.config['AUDIT_LOG_PUT_TIMEOUT'],
+    )
+    audit_log_writer.start()
+
+    # 만료된 Login 정리 (LOGIN_SWEEPER_ENABLED인 경우 주기적으로 실행)
+    from app.models.login_sweeper import login_sweeper
+    login_sweeper.configure(
+        database.SessionLocal,
+        interval_seconds=app.config['LOGIN_SWEEP_INTERVAL_SECONDS'],
+        batch_size=app.config['LOGIN_SWEEP_BATCH_SIZE'],
+        max_sessions_per_user=app.config['LOGIN_MAX_SESSIONS_PER_USER'],
+    )
+    if app.config.get('LOGIN_SWEEPER_ENABLED'):
+        login_sweeper.start()
+
+    # 마감된 채용 공고 상태 변경 (POSTING_EXPIRER_ENABLED인 경우 시작 직후와 주기마다 실행)
+    from app.models.posting_expirer import posting_expirer
+    posting_expirer.configure(
+        database.SessionLocal,
+        interval_seconds=app.config['POSTING_EXPIRE_INTERVAL_SECONDS'],
+        batch_size=app.config['POSTING_EXPIRE_BATCH_SIZE'],
+    )
+    if app.config.get('POSTING_EXPIRER_ENABLED'):
+        posting_expirer.start()
+
+    # 사용자별 북마크 집합 캐시 크기/재적재 주기 설정
+    from app.models.bookmark_cache import bookmark_cache
+    bookmark_cache.configure(
+        max_users=app.config['BOOKMARK_CACHE_MAX_USERS'],
+        ttl_seconds=app.config['BOOKMARK_CACHE_TTL_SECONDS'],
+    )
+
     # print(app.url_map)
 
     return app
\ No newline at end of file
@@ -0,0 +1,89 @@
+# commands.py
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from .models.database import SessionLocal
+
+@click.command("backfill-login-jti")
+@click.option("--batch-size", default=1000, show_default=True, help="한 번에 처리할 Login 행 수")
+@with_appcontext
+def backfill_login_jti_command(batch_size):
+    """refresh_jti가 비어 있는 기존 Login 행에 refresh token의 jti를 채웁니다."""
+    from .models.login import backfill_login_refresh_jti
+
+    db = SessionLocal()
+    try:
+        result = backfill_login_refresh_jti(db, batch_size)
+    finally:
+        db.close()
+
+    if not result["success"]:
+        raise click.ClickException(f"Failed to backfill Login.refresh_jti: {result['error']} (updated: {result['updated']})")
+    click.echo(f"Login.refresh_jti backfilled: {result['updated']} updated, {result['skipped']} skipped")
+
+@click.command("sweep-logins")
+@click.option("--batch-size", type=int, default=None, help="한 번에 삭제할 Login 행 수 (기본값: LOGIN_SWEEP_BATCH_SIZE)")
+@click.option("--max-sessions", type=int, default=None, help="사용자별 최대 세션 수, 0이면 제한 없음 (기본값: LOGIN_MAX_SESSIONS_PER_USER)")
+@with_appcontext
+def sweep_logins_command(batch_size, max_sessions):
+    """만료된 Login 행과 사용자별 최대 세션 수를 넘는 오래된 Login 행을 삭제합니다."""
+    from .models.login_sweeper import LoginSweeper
+
+    sweeper = LoginSweeper()
+    sweeper.configure(
+        SessionLocal,
+        batch_size=batch_size if batch_size is not None else current_app.config['LOGIN_SWEEP_BATCH_SIZE'],
+        max_sessions_per_user=max_sessions if max_sessions is not None else current_app.config['LOGIN_MAX_SESSIONS_PER_USER'],
+    )
+    try:
+        result = sweeper.run_once()
+    except RuntimeError as e:
+        raise click.ClickException(f"Failed to sweep logins: {e}")
+    click.echo(f"Login swept: {result['expired_deleted']} expired, {result['over_limit_deleted']} over session limit")
+
+@click.command("expire-postings")
+@click.option("--batch-size", type=int, default=None, help="한 번에 변경할 JobPosting 행 수 (기본값: POSTING_EXPIRE_BATCH_SIZE)")
+@with_appcontext
+def expire_postings_command(batch_size):
+    """마감일자가 지난 채용 공고를 POSTER_STATUS_INACTIVE로 변경합니다."""
+    from .models.posting_expirer import PostingExpirer
+
+    expirer = PostingExpirer()
+    expirer.configure(
+        SessionLocal,
+        batch_size=batch_size if batch_size is not None else current_app.config['POSTING_EXPIRE_BATCH_SIZE'],
+    )
+    try:
+        result = expirer.run_once()
+    except RuntimeError as e:
+        raise click.ClickException(f"Failed to expire postings: {e}")
+    click.echo(f"JobPosting expired: {result['expired']}")
+
+@click.command("check-query-plans")
+@with_appcontext
+def check_query_plans_command():
+    """주요 조회 쿼리의 실행 계획(EXPLAIN)을 확인해 테이블 전체를 읽는 쿼리가 있으면 실패합니다. (MySQL 전용)"""
+    from .models.query_plan import check_query_plans
+
+    db = SessionLocal()
+    try:
+        result = check_query_plans(db)
+    finally:
+        db.close()
+
+    if result.get("error"):
+        raise click.ClickException(result["error"])
+    for name, plan in result["plans"].items():
+        for row in plan:
+            click.echo(f"{name}: table={row.get('table')} type={row.get('type')} key={row.get('key')} rows={row.get('rows')} extra={row.get('Extra')}")
+    if not result["success"]:
+        raise click.ClickException(f"Full table scan in: {', '.join(result['full_scans'])}")
+    click.echo(f"All {len(result['plans'])} queries use an index")
+
+def init_app(app):
+    """Flask CLI 명령어를 등록합니다. (flask --app run <명령어>)"""
+    app.cli.add_command(backfill_login_jti_command)
+    app.cli.add_command(sweep_logins_command)
+    app.cli.add_command(expire_postings_command)
+    app.cli.add_command(check_query_plans_command)
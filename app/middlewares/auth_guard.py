@@ -3,8 +3,8 @@ from flask import request, jsonify, current_app, g
 from flask_jwt_extended import JWTManager, verify_jwt_in_request, jwt_required, create_access_token, create_refresh_token, get_jwt_identity, get_jwt
 from datetime import timedelta
 from ..views.response import JsonResponse, fail
-from ..models.database import get_db
-from ..models.login import Login, get_login_by_user_id, create_login, delete_login
+from ..models.database import get_db_session
+from ..models.login import Login, lookup_refresh_login, create_login, delete_login
 from ..utils.util import now_korea
 from functools import wraps
 from werkzeug.datastructures import Headers
@@ -24,12 +24,16 @@ class AuthGuard:
         'auth_refresh_token' : ['POST'],
         'job_applications' : ['GET'],
         'job_application': ['GET'],
+        'job_facets': ['GET'],
         'meta_get_salary_table': ['GET'],
         'meta_get_education_table': ['GET'],
         'meta_get_job_table': ['GET'],
         'meta_get_loc_table': ['GET'],
         'meta_get_job_name': ['GET'],
         'meta_get_loc_data': ['GET'],
+        'meta_get_job_name_batch': ['GET'],
+        'meta_get_loc_data_batch': ['GET'],
+        'meta_get_loc_tree': ['GET'],
     }
 
     test = False
@@ -44,16 +48,16 @@ class AuthGuard:
             """토큰이 폐기되었는지 확인하는 콜백 함수"""
             token_type = jwt_payload.get("type", "access")  # 기본값으로 access
             jti = jwt_payload["jti"]
-            db = next(get_db())
 
             if token_type == "access":
                 # Access token의 경우 DB에서 추가 검증 없이 pass
                 return False
 
             if token_type == "refresh":
-                # Refresh token의 경우 DB에서 JTI를 검증
-                token = get_login_by_user_id(db, jwt_payload["sub"])
-                return token is None or token['login']['refresh_token'] != jti
+                db = get_db_session(primary=True, identity=jwt_payload["sub"])  # 방금 로그인/로그아웃한 상태를 반영해야 하므로 primary에서 확인
+                # Refresh token의 경우 JTI를 검증 (refresh_token_cache에 없을 때만 refresh_jti 유니크 인덱스로 DB 조회)
+                user_id, _ = lookup_refresh_login(db, jti)
+                return user_id is None or user_id != jwt_payload["sub"]
 
             return True  # 알 수 없는 토큰 타입의 경우 기본적으로 거부
 
@@ -76,12 +80,7 @@ class AuthGuard:
                 return
 
             # Authorization 헤더 확인 및 수정
-            auth_header = request.headers.get('Authorization')
-            if auth_header and not auth_header.startswith('Bearer '):
-                # 원본 헤더를 수정할 수 없으므로, 새로운 헤더를 만들어 저장
-                modified_auth_header = f"Bearer {auth_header}"
-                request.headers = Headers(request.headers)
-                request.headers['Authorization'] = modified_auth_header
+            AuthGuard.normalize_authorization_header()
 
             try:
                 verify_jwt_in_request()
@@ -108,6 +107,29 @@ class AuthGuard:
                     }
                 )
 
+    @staticmethod
+    def normalize_authorization_header():
+        """'Bearer ' 없이 토큰만 전달된 Authorization 헤더에 'Bearer '를 붙이는 메서드"""
+        auth_header = request.headers.get('Authorization')
+        if auth_header and not auth_header.startswith('Bearer '):
+            # 원본 헤더를 수정할 수 없으므로, 새로운 헤더를 만들어 저장
+            modified_auth_header = f"Bearer {auth_header}"
+            request.headers = Headers(request.headers)
+            request.headers['Authorization'] = modified_auth_header
+
+    @staticmethod
+    def get_optional_identity():
+        """
+        인증이 필요 없는 엔드포인트에서 로그인한 사용자의 ID를 반환하는 메서드
+        토큰이 없거나 유효하지 않으면 None을 반환합니다. (요청을 거부하지 않음)
+        """
+        AuthGuard.normalize_authorization_header()
+        try:
+            verify_jwt_in_request(optional=True)
+            return get_jwt_identity()
+        except Exception:
+            return None
+
     @staticmethod
     def create_refresh_token(user_id, login_device_info=None, login_ip=None):
         """리프레시 토큰을 생성하고 데이터베이스에 저장하는 메서드"""
@@ -122,7 +144,7 @@ class AuthGuard:
             additional_claims={"type": "refresh", "iat": current_time}
         )
         
-        db = next(get_db())
+        db = get_db_session(primary=True, identity=user_id)
         create_result = create_login(db, user_id, refresh_token, expiration_time, login_device_info, login_ip)
         
         if create_result['success']:
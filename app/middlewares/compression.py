@@ -0,0 +1,118 @@
+# middlewares/compression.py
+import gzip
+import threading
+import zlib
+from collections import OrderedDict
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 사용
+    brotli = None
+
+ENCODING_BROTLI = "br"
+ENCODING_GZIP = "gzip"
+
+# 압축할 응답의 mimetype
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/javascript",
+    "text/html",
+    "text/css",
+    "text/plain",
+    "text/javascript",
+}
+
+class Compression:
+    """
+    Accept-Encoding에 따라 응답을 brotli(설치된 경우) 또는 gzip으로 압축하는 미들웨어
+
+    ETag가 있는 응답(코드 테이블 등)과 CACHED_ENDPOINTS(swagger 명세)는 내용이 바뀌지 않는 한
+    압축 결과를 재사용하므로, 데이터 버전마다 한 번만 (높은 압축률로) 압축합니다.
+    """
+    # ETag가 없어도 압축 결과를 캐시할 엔드포인트 (프로세스가 살아있는 동안 내용이 바뀌지 않음)
+    CACHED_ENDPOINTS = {"specs"}
+
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    @staticmethod
+    def init_app(app):
+        """Flask 애플리케이션에 응답 압축을 등록하는 메서드"""
+        if not app.config.get('COMPRESSION_ENABLED', True):
+            return
+
+        min_size = app.config.get('COMPRESSION_MIN_SIZE', 500)
+        gzip_level = app.config.get('COMPRESSION_GZIP_LEVEL', 6)
+        brotli_quality = app.config.get('COMPRESSION_BROTLI_QUALITY', 4)
+        cache_size = app.config.get('COMPRESSION_CACHE_SIZE', 256)
+        encodings = [ENCODING_BROTLI, ENCODING_GZIP] if brotli is not None else [ENCODING_GZIP]
+
+        @app.after_request
+        def compress(response):
+            if (response.status_code < 200 or response.status_code >= 300 or response.status_code == 204
+                    or response.direct_passthrough or response.is_streamed
+                    or 'Content-Encoding' in response.headers
+                    or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+                return response
+
+            response.vary.add('Accept-Encoding')
+
+            encoding = request.accept_encodings.best_match(encodings)
+            if encoding is None:
+                return response
+
+            body = response.get_data()
+            if len(body) < min_size:
+                return response
+
+            etag, is_weak = response.get_etag()
+            if etag is not None:
+                # ETag는 URL마다만 유일하므로(예: /metas/job?page=1 과 /metas/job/batch?ids=1) 경로와 쿼리도 키에 포함
+                cache_key = (request.full_path, etag, encoding)
+            elif request.endpoint in Compression.CACHED_ENDPOINTS:
+                cache_key = (request.endpoint, zlib.crc32(body), len(body), encoding)
+            else:
+                cache_key = None
+
+            if cache_key is not None:
+                compressed = Compression._get_cached(cache_key)
+                if compressed is None:
+                    # 한 번만 압축하므로 최대 압축률 사용
+                    compressed = Compression._compress(body, encoding, level=9, quality=11)
+                    Compression._set_cached(cache_key, compressed, cache_size)
+            else:
+                compressed = Compression._compress(body, encoding, level=gzip_level, quality=brotli_quality)
+
+            if len(compressed) >= len(body):
+                return response
+
+            response.set_data(compressed)
+            response.headers['Content-Encoding'] = encoding
+            if etag is not None:
+                # 압축된 표현은 원본과 바이트가 다르므로 weak ETag로 표시 (If-None-Match는 weak 비교라 304는 그대로 동작)
+                response.set_etag(etag, weak=True)
+            return response
+
+    @staticmethod
+    def _compress(body: bytes, encoding: str, level: int, quality: int) -> bytes:
+        if encoding == ENCODING_BROTLI:
+            return brotli.compress(body, quality=quality)
+        return gzip.compress(body, compresslevel=level, mtime=0)
+
+    @staticmethod
+    def _get_cached(key):
+        with Compression._cache_lock:
+            compressed = Compression._cache.get(key)
+            if compressed is not None:
+                Compression._cache.move_to_end(key)
+            return compressed
+
+    @staticmethod
+    def _set_cached(key, compressed: bytes, cache_size: int):
+        with Compression._cache_lock:
+            Compression._cache[key] = compressed
+            Compression._cache.move_to_end(key)
+            while len(Compression._cache) > cache_size:
+                Compression._cache.popitem(last=False)
@@ -15,6 +15,12 @@ MySQL_DB_NAME = os.getenv('MySQL_DB_NAME')
 
 SQLALCHEMY_DATABASE_URI = f"mysql+pymysql://{MySQL_DB_USER}:{MySQL_DB_PASSWORD}@{MySQL_DB_URL}:{MySQL_DB_PORT}/{MySQL_DB_NAME}?charset=utf8mb4"
 
+# 읽기 전용 replica (설정하지 않으면 모든 쿼리를 primary로 보냄)
+MySQL_REPLICA_DB_URL = os.getenv('MySQL_REPLICA_DB_URL')
+MySQL_REPLICA_DB_PORT = int(os.getenv('MySQL_REPLICA_DB_PORT', str(MySQL_DB_PORT)))
+
+SQLALCHEMY_REPLICA_DATABASE_URI = f"mysql+pymysql://{MySQL_DB_USER}:{MySQL_DB_PASSWORD}@{MySQL_REPLICA_DB_URL}:{MySQL_REPLICA_DB_PORT}/{MySQL_DB_NAME}?charset=utf8mb4" if MySQL_REPLICA_DB_URL else None
+
 # Base 클래스 생성
 Base = declarative_base()
 
@@ -0,0 +1,155 @@
+# models/audit_log_writer.py
+
+import atexit
+import queue
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy import insert
+
+AUDIT_LOG_MODE_ASYNC = "async"
+AUDIT_LOG_MODE_SYNC = "sync"
+AUDIT_LOG_MODES = (AUDIT_LOG_MODE_ASYNC, AUDIT_LOG_MODE_SYNC)
+
+class AuditLogWriter:
+    """
+    감사 로그(LoginLog, UserApplicatedLog 등) 행을 요청 처리와 분리해 일괄 INSERT 하는 writer
+
+    async 모드에서는 write()가 행을 크기가 제한된 큐에 넣고 바로 반환하며,
+    백그라운드 스레드가 최대 batch_size개씩 모아 테이블별로 INSERT 한 번(executemany)으로 저장합니다.
+    큐가 가득 차면 put_timeout만큼 기다린 뒤 호출한 스레드에서 직접 저장합니다. (backpressure)
+    sync 모드(또는 start 전)에서는 write()가 바로 저장합니다.
+    """
+    def __init__(self, max_queue_size: int = 10000, batch_size: int = 500, flush_seconds: float = 1, put_timeout: float = 0.5):
+        self.mode = AUDIT_LOG_MODE_SYNC
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.put_timeout = put_timeout
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._session_factory = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def configure(self, session_factory: Callable, mode: str = AUDIT_LOG_MODE_ASYNC, max_queue_size: Optional[int] = None, batch_size: Optional[int] = None, flush_seconds: Optional[float] = None, put_timeout: Optional[float] = None):
+        """
+        저장에 사용할 세션 팩토리와 동작 방식을 설정합니다.
+        :param mode: async | sync
+        """
+        if mode not in AUDIT_LOG_MODES:
+            raise ValueError(f"Invalid audit log mode: {mode}, Value should be one of {list(AUDIT_LOG_MODES)}.")
+        self.mode = mode
+        self._session_factory = session_factory
+        if max_queue_size is not None and self._thread is None:
+            self._queue = queue.Queue(maxsize=max_queue_size)
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if flush_seconds is not None:
+            self.flush_seconds = flush_seconds
+        if put_timeout is not None:
+            self.put_timeout = put_timeout
+
+    def start(self):
+        """async 모드이면 백그라운드 스레드를 시작하고, 종료 시 남은 로그 저장을 등록합니다."""
+        if self.mode != AUDIT_LOG_MODE_ASYNC or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """백그라운드 스레드를 멈추고 큐에 남은 로그를 모두 저장합니다."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=self.flush_seconds + 5)
+            self._thread = None
+        self.flush()
+
+    def write(self, model, row: dict):
+        """model 테이블에 저장할 행 하나를 기록합니다."""
+        if self._thread is None:
+            self._insert({model: [row]})
+            return
+        try:
+            self._queue.put((model, row), timeout=self.put_timeout)
+        except queue.Full:
+            # 큐가 가득 차면 요청 스레드에서 직접 저장 (로그를 버리지 않고 요청 속도를 늦춤)
+            self._insert({model: [row]})
+
+    def pending(self) -> int:
+        """아직 저장되지 않은 로그 수 (근사값)"""
+        return self._queue.qsize()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                item = self._queue.get(timeout=self.flush_seconds)
+            except queue.Empty:
+                continue
+            try:
+                self._insert(self._drain([item]))
+            except Exception as e:
+                print(f"Failed to write audit logs: {e}")
+
+    def _drain(self, items: list) -> dict:
+        """큐에서 최대 batch_size개를 꺼내 테이블별로 묶습니다."""
+        while len(items) < self.batch_size:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        rows_by_model = {}
+        for model, row in items:
+            rows_by_model.setdefault(model, []).append(row)
+        return rows_by_model
+
+    def flush(self) -> int:
+        """
+        큐에 남은 로그를 호출한 스레드에서 모두 저장합니다.
+        :return: 저장한 행 수
+        """
+        written = 0
+        while True:
+            rows_by_model = self._drain([])
+            if not rows_by_model:
+                return written
+            self._insert(rows_by_model)
+            written += sum(len(rows) for rows in rows_by_model.values())
+
+    def _insert(self, rows_by_model: dict):
+        """
+        테이블마다 INSERT 한 번(executemany)으로 저장하고 한 번 커밋합니다.
+        일괄 저장이 실패하면(외래 키 위반 행 등) 한 행씩 다시 저장해, 잘못된 행 때문에 같은 배치의 다른 로그가 유실되지 않게 합니다.
+        """
+        if self._session_factory is None:
+            raise RuntimeError("AuditLogWriter is not configured.")
+        db = self._session_factory()
+        try:
+            for model, rows in rows_by_model.items():
+                db.execute(insert(model), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            if sum(len(rows) for rows in rows_by_model.values()) == 1:
+                raise
+            self._insert_each(db, rows_by_model)
+        finally:
+            db.close()
+
+    def _insert_each(self, db, rows_by_model: dict):
+        """행마다 따로 커밋해 저장하고, 저장하지 못한 행은 건너뜁니다."""
+        failed = 0
+        error = None
+        for model, rows in rows_by_model.items():
+            for row in rows:
+                try:
+                    db.execute(insert(model), [row])
+                    db.commit()
+                except Exception as e:
+                    db.rollback()
+                    failed += 1
+                    error = e
+        if failed:
+            print(f"Failed to write {failed} audit log rows: {error}")
+
+audit_log_writer = AuditLogWriter()
@@ -0,0 +1,80 @@
+# models/bookmark_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+class BookmarkSetCache:
+    """
+    사용자별 북마크한 poster_id 집합을 프로세스 메모리에 보관하는 LRU 캐시
+
+    처음 조회할 때 UserBookmark에서 한 번 적재하고, 이후 북마크 등록/해제 시 캐시된 집합을 직접 갱신합니다.
+    최대 max_users명까지만 보관하며(가장 오래 사용하지 않은 사용자부터 제거),
+    다른 프로세스(노드)에서의 변경은 ttl_seconds가 지나 다시 적재할 때 반영됩니다.
+    """
+    def __init__(self, max_users: int = 10000, ttl_seconds: float = 300):
+        self.max_users = max_users
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # user_id -> (적재 시각, poster_id 집합)
+        # 적재 도중 등록/해제가 일어난 경우 적재 결과를 버리기 위한 세대 번호
+        self._generation = 0
+
+    def configure(self, max_users: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        if max_users is not None:
+            self.max_users = max_users
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds
+        with self._lock:
+            self._evict()
+
+    def get(self, db: Session, user_id: str) -> frozenset:
+        """user_id가 북마크한 poster_id 집합을 반환합니다. (없거나 만료되었으면 DB에서 적재)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and now - entry[0] < self.ttl_seconds:
+                self._entries.move_to_end(user_id)
+                return entry[1]
+            generation = self._generation
+
+        from .user_bookmark import UserBookmark
+        poster_ids = frozenset(
+            poster_id for (poster_id,) in db.query(UserBookmark.poster_id).filter(UserBookmark.user_id == user_id)
+        )
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[user_id] = (now, poster_ids)
+                self._entries.move_to_end(user_id)
+                self._evict()
+        return poster_ids
+
+    def apply(self, user_id: str, poster_id: str, bookmarked: bool):
+        """커밋된 북마크 등록/해제를 캐시된 집합에 반영합니다. (캐시되지 않은 사용자는 다음 조회 시 적재)"""
+        with self._lock:
+            self._generation += 1
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return
+            loaded_at, poster_ids = entry
+            poster_ids = poster_ids | {poster_id} if bookmarked else poster_ids - {poster_id}
+            self._entries[user_id] = (loaded_at, poster_ids)
+
+    def invalidate(self, user_id: Optional[str] = None):
+        """user_id(지정하지 않으면 전체)의 캐시를 버립니다."""
+        with self._lock:
+            self._generation += 1
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def _evict(self):
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+
+bookmark_cache = BookmarkSetCache()
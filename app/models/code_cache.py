@@ -0,0 +1,171 @@
+# models/code_cache.py
+
+import hashlib
+import json
+import re
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+# 테이블 이름 -> (모델 모듈, 모델 클래스, 키 컬럼, 목록 응답 키, 없을 때 메시지)
+CODE_TABLES = {
+    "sal": ("sal_code", "SalCode", "sal_code", "sal_codes", "SalCode not found"),
+    "edu": ("edu_code", "EduCode", "edu_code", "edu_codes", "EduCode not found"),
+    "job": ("job_code", "JobCode", "job_code", "job_codes", "JobCode not found"),
+    "loc": ("loc_code", "LocCode", "loc_code", "loc_codes", "LocCode not found"),
+}
+
+_ETAG_SAFE_VARIANT = re.compile(r"[0-9A-Za-z,._-]{1,64}")
+
+class CodeTableCache:
+    """
+    SalCode, EduCode, JobCode, LocCode 테이블을 프로세스 메모리에 적재해 두는 캐시
+
+    적재한 스냅샷은 수정하지 않고 reload 시 통째로 교체하며, 테이블마다 내용의 해시(version)를 가지고 있어
+    응답의 강한 ETag로 사용합니다. 코드 테이블이 변경되면 invalidate를 호출해 다음 조회 시 다시 적재합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    def load(self, db: Session):
+        """DB에서 코드 테이블을 모두 읽어 새 스냅샷으로 교체합니다."""
+        import importlib
+
+        snapshot = {}
+        for table, (module_name, class_name, key, list_key, not_found) in CODE_TABLES.items():
+            model = getattr(importlib.import_module(f"{__package__}.{module_name}"), class_name)
+            rows = tuple(row.to_dict() for row in db.query(model).order_by(getattr(model, key)).all())
+            digest = hashlib.sha256(json.dumps(rows, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+            snapshot[table] = {
+                "rows": rows,
+                "by_id": {row[key]: row for row in rows},
+                "version": digest[:32],
+            }
+        snapshot["loc"].update(self._build_loc_hierarchy(snapshot["loc"]["rows"]))
+        with self._lock:
+            self._snapshot = snapshot
+
+    reload = load
+
+    @staticmethod
+    def _build_loc_hierarchy(rows: tuple) -> dict:
+        """
+        LocCode.loc_mcode/loc_mname으로 1차 지역 -> 하위 지역 트리와 1차 지역별 하위 코드 목록을 만듭니다.
+        1차 지역 자체의 코드(loc_code == loc_mcode, 예: 서울전체)도 하위 코드 목록에 포함됩니다.
+        """
+        tree = {}
+        for row in rows:
+            mcode = row["loc_mcode"] if row["loc_mcode"] is not None else row["loc_code"]
+            node = tree.get(mcode)
+            if node is None:
+                node = tree[mcode] = {"loc_mcode": mcode, "loc_mname": row["loc_mname"] or row["loc_name"], "children": []}
+            node["children"].append({"loc_code": row["loc_code"], "loc_name": row["loc_name"]})
+        return {
+            "tree": tuple(tree.values()),
+            "descendants": {mcode: tuple(child["loc_code"] for child in node["children"]) for mcode, node in tree.items()},
+        }
+
+    def get_loc_tree(self) -> list:
+        """1차 지역(loc_mcode)별 하위 지역 트리 전체를 반환합니다."""
+        return [
+            {**node, "children": [dict(child) for child in node["children"]]}
+            for node in self._table("loc")["tree"]
+        ]
+
+    def expand_loc_codes(self, loc_codes: list) -> list:
+        """1차 지역 코드를 자신과 모든 하위 지역 코드로 확장합니다. (그 외 코드는 그대로)"""
+        descendants = self._table("loc")["descendants"]
+        expanded = []
+        for code in loc_codes:
+            expanded.extend(descendants.get(code, (code,)))
+        return list(dict.fromkeys(expanded))
+
+    def invalidate(self):
+        """스냅샷을 버리고, 다음 조회 시 다시 적재하도록 합니다."""
+        with self._lock:
+            self._snapshot = None
+
+    def ensure_loaded(self, loader: Callable[[], Session]):
+        """스냅샷이 없으면 loader가 반환한 세션으로 적재합니다."""
+        if self._snapshot is None:
+            self.load(loader())
+
+    def _table(self, table: str) -> dict:
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise ValueError("Code tables are not loaded.")
+        return snapshot[table]
+
+    def etag(self, table: str, variant: Optional[str] = None) -> str:
+        """테이블 내용과 응답 종류(variant, 예: 페이지 번호)에 대한 강한 ETag를 반환합니다."""
+        version = self._table(table)["version"]
+        if variant is None:
+            return f'"{table}-{version}"'
+        variant = str(variant)
+        # 쿼리 파라미터 값이 그대로 들어오므로, ETag에 쓸 수 없는 문자가 있으면 해시로 대체
+        if not _ETAG_SAFE_VARIANT.fullmatch(variant):
+            variant = hashlib.sha256(variant.encode("utf-8")).hexdigest()[:16]
+        return f'"{table}-{version}-{variant}"'
+
+    def get_page(self, table: str, page: int = 1, item_counts: int = 20) -> dict:
+        """get_*_codes와 동일한 형태로 한 페이지를 반환합니다."""
+        list_key = CODE_TABLES[table][3]
+        rows = self._table(table)["rows"]
+        total_count = len(rows)
+        offset = (page - 1) * item_counts
+        items = rows[offset:offset + item_counts] if offset >= 0 else ()
+        return {
+            "success": True,
+            "data": {
+                list_key: [dict(row) for row in items],
+                "total_count": total_count,
+                "current_page": page,
+                "total_page": (total_count + item_counts - 1) // item_counts,
+                "has_next": offset + len(items) < total_count,
+            },
+        }
+
+    def get_by_id(self, table: str, code: int) -> dict:
+        """get_*_code_by_id와 동일한 형태로 코드 하나를 반환합니다."""
+        _, _, key, _, not_found = CODE_TABLES[table]
+        row = self._table(table)["by_id"].get(code)
+        if row is None:
+            return {"success": False, "message": not_found}
+        return {"success": True, key: dict(row)}
+
+    def get_by_ids(self, table: str, codes: list) -> dict:
+        """
+        여러 코드를 한 번에 조회합니다.
+        :return: {"success": True, "<키 컬럼>s": {코드: 행}, "not_found": [없는 코드]}
+        """
+        _, _, key, list_key, _ = CODE_TABLES[table]
+        by_id = self._table(table)["by_id"]
+        found = {}
+        not_found = []
+        for code in codes:
+            row = by_id.get(code)
+            if row is None:
+                not_found.append(code)
+            else:
+                found[code] = dict(row)
+        return {"success": True, list_key: found, "not_found": not_found}
+
+    def get_name(self, table: str, code) -> Optional[str]:
+        """코드의 이름(sal_name, edu_name, job_name, loc_name)을 반환합니다. (없으면 None)"""
+        try:
+            row = self._table(table)["by_id"].get(int(code))
+        except (TypeError, ValueError):
+            return None
+        return row[f"{table}_name"] if row is not None else None
+
+    def get_rows(self, table: str) -> tuple:
+        """테이블 전체 행 (수정하지 말 것)"""
+        return self._table(table)["rows"]
+
+code_table_cache = CodeTableCache()
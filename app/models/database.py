@@ -1,20 +1,103 @@
 # models/database.py
 
-from . import Base, SQLALCHEMY_DATABASE_URI
+from . import Base, SQLALCHEMY_DATABASE_URI, SQLALCHEMY_REPLICA_DATABASE_URI
 # models/company_group.py 와 models/company.py의 각 CRUD 함수들이 정상적으로 동작하는지 테스트
 # 각 함수의 반환 값을 모두 출력
 # 각 모듈의 테스트가 끝날 때마다 총 n개 중 몇 개가 성공했고, 몇 개가 실패했는지 알림. (실패한 함수들이 누군지 따로 알리기)
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session  # Session 임포트 추가
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.orm import sessionmaker, scoped_session, Session  # Session 임포트 추가
+
+from config import Config
 
 from .company_group import *
 from .company import *
 
-# 데이터베이스 엔진 생성 (echo=True로 쿼리 확인 가능)
-engine = create_engine(SQLALCHEMY_DATABASE_URI, echo=True)
+def build_engine_options(config) -> dict:
+    """config.Config의 DB_* 설정으로 create_engine 인자를 만듭니다."""
+    options = {
+        "echo": config.DB_ECHO,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+    if config.DB_ISOLATION_LEVEL:
+        options["isolation_level"] = config.DB_ISOLATION_LEVEL
+    return options
+
+# 데이터베이스 엔진 생성 (DB_ECHO=True로 쿼리 확인 가능)
+engine = create_engine(SQLALCHEMY_DATABASE_URI, **build_engine_options(Config))
+
+# 읽기 전용 replica 엔진 (MySQL_REPLICA_DB_URL이 없으면 primary 엔진을 그대로 사용)
+replica_engine = create_engine(SQLALCHEMY_REPLICA_DATABASE_URI, **build_engine_options(Config)) if SQLALCHEMY_REPLICA_DATABASE_URI else engine
+
+def warm_up_pool(connections: int = None) -> int:
+    """
+    첫 요청 전에 커넥션 풀의 커넥션을 미리 열어 둡니다.
+    :param connections: 열어 둘 커넥션 수 (None이면 pool_size만큼)
+    :return: 열어 둔 커넥션 수
+    """
+    engines = [engine] if replica_engine is engine else [engine, replica_engine]
+    opened = []
+    try:
+        # 동시에 checkout해야 서로 다른 커넥션이 생성됨
+        for target in engines:
+            count = target.pool.size() if connections is None else connections
+            for _ in range(count):
+                opened.append(target.connect())
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+# session.info 키
+_USE_PRIMARY = "use_primary"  # True면 이후 모든 쿼리를 primary로 보냄
+_WROTE = "wrote"              # 이 세션에서 쓰기가 있었는지 여부
+_IDENTITY = "identity"        # 요청한 사용자 (get_db_session(identity=...)로 전달)
+
+class RoutingSession(Session):
+    """
+    쓰기(flush, INSERT/UPDATE/DELETE)는 primary로, 읽기는 replica로 보내는 세션
+
+    한 번 쓰기가 일어나면 이 세션(요청)의 이후 읽기도 primary로 보내 방금 쓴 내용을 읽을 수 있게 합니다.
+    """
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[_USE_PRIMARY] = True
+            self.info[_WROTE] = True
+            return engine
+        if self.info.get(_USE_PRIMARY):
+            return engine
+        return replica_engine
+
+# 사용자별 마지막 쓰기 시각 (replica 복제 지연 동안 해당 사용자의 읽기를 primary로 보냄)
+_recent_writes = {}
+_recent_writes_lock = threading.Lock()
+
+@event.listens_for(RoutingSession, "after_commit")
+def _remember_write(session):
+    identity = session.info.get(_IDENTITY)
+    if replica_engine is engine or identity is None or not session.info.get(_WROTE):
+        return
+    now = time.monotonic()
+    with _recent_writes_lock:
+        if len(_recent_writes) >= 10000:
+            for key in [key for key, written_at in _recent_writes.items() if now - written_at > Config.DB_REPLICA_STICKY_SECONDS]:
+                del _recent_writes[key]
+        _recent_writes[identity] = now
+
+def _wrote_recently(identity) -> bool:
+    with _recent_writes_lock:
+        written_at = _recent_writes.get(identity)
+    return written_at is not None and time.monotonic() - written_at <= Config.DB_REPLICA_STICKY_SECONDS
 
 # 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
 
 def get_db():  # Dependency Injection을 위한 함수
     db = SessionLocal()
@@ -23,6 +106,38 @@ def get_db():  # Dependency Injection을 위한 함수
     finally:
         db.close()
 
+# 요청 단위 세션 (한 요청에서 여러 모델 함수를 호출해도 같은 세션/커넥션을 재사용)
+# 요청은 한 스레드에서 처리되고 app context 종료 시 remove_db_session이 세션을 정리하므로, 스레드 단위 세션이 곧 요청 단위 세션이 됨
+db_session = scoped_session(SessionLocal)
+
+def get_db_session(primary: bool = False, identity: str = None) -> Session:
+    """
+    현재 요청의 세션을 반환합니다. 요청이 끝나면 teardown에서 닫힙니다.
+    :param primary: True면 이 요청의 모든 쿼리를 primary로 보냄 (쓰기 전에 읽는 조회가 최신이어야 하는 경우)
+    :param identity: 요청한 사용자 ID (최근에 쓰기를 한 사용자의 읽기를 primary로 보내고, 이 세션의 쓰기를 사용자별로 기록)
+    """
+    db = db_session()
+    if replica_engine is engine:
+        return db
+    if identity is not None and db.info.get(_IDENTITY) is None:
+        db.info[_IDENTITY] = identity
+        # 최근에 쓰기를 한 사용자는 복제 지연 동안 primary에서 읽음
+        if _wrote_recently(identity):
+            db.info[_USE_PRIMARY] = True
+    if primary:
+        db.info[_USE_PRIMARY] = True
+    return db
+
+def remove_db_session(exception=None):
+    """현재 요청의 세션을 닫고 커넥션을 풀에 반환합니다. (요청 중 예외가 있었다면 롤백)"""
+    if exception is not None:
+        db_session.rollback()
+    db_session.remove()
+
+def init_app(app):
+    """app context 종료 시 요청 단위 세션을 정리하도록 teardown 핸들러를 등록합니다."""
+    app.teardown_appcontext(remove_db_session)
+
 from typing import List, Dict, Any
 
 def run_test(db: Session, test_name: str, test_func, *args, **kwargs) -> Dict[str, Any]:
@@ -5,6 +5,8 @@ from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import Session
 
 from . import Base
+from .pagination import count_cache, paginate, COUNT_MODE_ESTIMATE
+from .code_cache import code_table_cache
 
 class EduCode(Base):
     """
@@ -21,19 +23,16 @@ class EduCode(Base):
             "edu_name": self.edu_name
         }
 
-def get_edu_codes(db: Session, page: int = 1, item_counts: int = 20) -> dict:
+def get_edu_codes(db: Session, page: int = 1, item_counts: int = 20, count_mode: str = COUNT_MODE_ESTIMATE) -> dict:
     """
     EduCode 목록을 조회하는 함수 (Pagination 적용)
     """
     try:
-        offset = (page - 1) * item_counts
-        edu_codes = db.query(EduCode).offset(offset).limit(item_counts).all()
-        total_count = db.query(EduCode).count()
+        query = db.query(EduCode).order_by(EduCode.edu_code)
+        edu_codes, page_info = paginate(query, page, item_counts, count_mode, count_cache.make_key(EduCode.__tablename__))
         data = {
             "edu_codes": [edu_code.to_dict() for edu_code in edu_codes],
-            "total_count": total_count,
-            "current_page": page,
-            "total_page": (total_count + item_counts - 1) // item_counts
+            **page_info,
         }
         return {
             "success": True,
@@ -55,6 +54,8 @@ def create_edu_code(db: Session, edu_code: int, edu_name: str) -> dict:
         new_edu_code = EduCode(edu_code=edu_code, edu_name=edu_name)
         db.add(new_edu_code)
         db.commit()
+        count_cache.invalidate(EduCode.__tablename__)
+        code_table_cache.invalidate()
         db.refresh(new_edu_code)
         return {"success": True, "edu_code": new_edu_code.to_dict()}
     except Exception as e:
@@ -80,6 +81,7 @@ def update_edu_code(db: Session, edu_code_id: int, new_edu_name: str) -> dict: #
         try:
             edu_code.edu_name = new_edu_name
             db.commit()
+            code_table_cache.invalidate()
             return {"success": True, "edu_code": edu_code.to_dict()}
         except Exception as e:
             db.rollback()
@@ -96,6 +98,8 @@ def delete_edu_code(db: Session, edu_code_id: int) -> dict: # 인자 이름 통
         try:
             db.delete(edu_code)
             db.commit()
+            count_cache.invalidate(EduCode.__tablename__)
+            code_table_cache.invalidate()
             return {"success": True}
         except Exception as e:
             db.rollback()
@@ -5,6 +5,8 @@ from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import Session
 
 from . import Base
+from .pagination import count_cache, paginate, COUNT_MODE_ESTIMATE
+from .code_cache import code_table_cache
 
 class JobCode(Base):
     """
@@ -21,19 +23,16 @@ class JobCode(Base):
             "job_name": self.job_name
         }
 
-def get_job_codes(db: Session, page: int = 1, item_counts: int = 20) -> dict:
+def get_job_codes(db: Session, page: int = 1, item_counts: int = 20, count_mode: str = COUNT_MODE_ESTIMATE) -> dict:
     """
     JobCode 목록을 조회하는 함수 (Pagination 적용)
     """
     try:
-        offset = (page - 1) * item_counts
-        job_codes = db.query(JobCode).offset(offset).limit(item_counts).all()
-        total_count = db.query(JobCode).count()
+        query = db.query(JobCode).order_by(JobCode.job_code)
+        job_codes, page_info = paginate(query, page, item_counts, count_mode, count_cache.make_key(JobCode.__tablename__))
         data = {
             "job_codes": [job_code.to_dict() for job_code in job_codes],
-            "total_count": total_count,
-            "current_page": page,
-            "total_page": (total_count + item_counts - 1) // item_counts
+            **page_info,
         }
         return {
             "success": True,
@@ -54,6 +53,8 @@ def create_job_code(db: Session, job_code: int, job_name: str) -> dict:
         new_job_code = JobCode(job_code=job_code, job_name=job_name)
         db.add(new_job_code)
         db.commit()
+        count_cache.invalidate(JobCode.__tablename__)
+        code_table_cache.invalidate()
         db.refresh(new_job_code)
         return {"success": True, "job_code": new_job_code.to_dict()}
     except Exception as e:
@@ -79,6 +80,7 @@ def update_job_code(db: Session, job_code_id: int, new_job_name: str) -> dict: #
         try:
             job_code.job_name = new_job_name
             db.commit()
+            code_table_cache.invalidate()
             return {"success": True, "job_code": job_code.to_dict()}
         except Exception as e:
             db.rollback()
@@ -95,6 +97,8 @@ def delete_job_code(db: Session, job_code_id: int) -> dict: #인자 이름 통
         try:
             db.delete(job_code)
             db.commit()
+            count_cache.invalidate(JobCode.__tablename__)
+            code_table_cache.invalidate()
             return {"success": True}
         except Exception as e:
             db.rollback()
@@ -1,13 +1,30 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, Text, JSON, asc, desc, and_, or_
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Text, JSON, Index, asc, desc, and_, or_, exists, func, distinct, case, update
 from sqlalchemy.orm import declarative_base, relationship, Session
 from datetime import date, datetime
 from typing import Optional
 
 from . import Base
+from .pagination import CountCache, count_cache, paginate, COUNT_MODE_ESTIMATE, COUNT_MODE_NONE
+from .title_search import title_index, resolve_title_search_strategy, get_relevance_max_candidates, fulltext_match_expression, title_relevance_score, NGRAM_SIZE, TITLE_SEARCH_LIKE, TITLE_SEARCH_FULLTEXT, TITLE_SEARCH_INVERTED
+from .job_posting_job import JobPostingJob
+from .job_posting_loc import JobPostingLoc
+from .job_posting_change import record_job_posting_changes
+from .loc_code import LocCode
 
 class JobPosting(Base):
     """JobPosting 테이블에 대한 SQLAlchemy 모델 클래스"""
     __tablename__ = "JobPosting"
+    __table_args__ = (
+        # 제목 검색용 FULLTEXT 인덱스 (한국어 제목을 위해 ngram parser 사용, MySQL 전용)
+        Index("ft_poster_title", "poster_title", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+        # 게시 중인 공고 조회(available_job_posting_condition)와 마감 공고 정리(expire_job_postings)용
+        Index("ix_job_posting_status_deadline", "poster_status", "deadline_date"),
+        # 목록 정렬(sort_by)용 인덱스 (InnoDB 보조 인덱스는 PK(poster_id)를 포함하므로 poster_id 보조 정렬까지 인덱스 순서로 처리)
+        # edu_code, sal_code는 외래 키 인덱스를 그대로 사용
+        Index("ix_job_posting_deadline_date", "deadline_date"),
+        Index("ix_job_posting_last_updated_date", "last_updated_date"),
+        Index("ix_job_posting_poster_title", "poster_title"),
+    )
 
     comp_id = Column(Integer, ForeignKey("Company.comp_id"), nullable=False)
     poster_id = Column(String(255), primary_key=True, nullable=False)
@@ -39,8 +56,8 @@ class JobPosting(Base):
             "job_education": self.job_education,
             "edu_code": self.edu_code,
             "edu_upper": self.edu_upper,
-            "deadline_date": self.deadline_date.isoformat() if self.deadline_date else None,
-            "last_updated_date": self.last_updated_date.isoformat() if self.last_updated_date else None,
+            "deadline_date": self.deadline_date,  # date/datetime은 응답 직렬화(views/serializer.py)에서 ISO 8601 문자열로 변환
+            "last_updated_date": self.last_updated_date,
             "job_codes": self.job_codes,
             "loc_codes": self.loc_codes,
             "sal_code": self.sal_code,
@@ -55,7 +72,7 @@ class JobPosting(Base):
             "comp_id": self.comp_id,
             "poster_id": self.poster_id,
             "poster_title": self.poster_title,
-            "deadline_date": self.deadline_date.isoformat() if self.deadline_date else None,
+            "deadline_date": self.deadline_date,
             "edu_code": self.edu_code,
             "job_codes": self.job_codes,
             "loc_codes": self.loc_codes,
@@ -63,6 +80,21 @@ class JobPosting(Base):
             "poster_status": self.poster_status,
         }
 
+# to_brief_dict와 동일한 목록 응답 필드 (fields= 로 일부만 선택 가능)
+BRIEF_FIELDS = ("comp_id", "poster_id", "poster_title", "deadline_date", "edu_code", "job_codes", "loc_codes", "sal_code", "poster_status")
+
+def _project_brief(query, fields: tuple, extra: tuple = ()):
+    """
+    ORM 엔티티 대신 목록 응답에 필요한 컬럼만 row tuple로 조회하도록 쿼리를 변경합니다.
+    :param extra: 응답에는 없지만 조회가 필요한 컬럼 (커서 생성용 정렬 컬럼 등)
+    """
+    names = fields + tuple(name for name in extra if name not in fields)
+    return query.with_entities(*[getattr(JobPosting, name) for name in names])
+
+def _rows_to_briefs(rows, fields: tuple) -> list:
+    """row tuple을 to_brief_dict 형태(fields만 포함)의 딕셔너리로 변환합니다."""
+    return [{name: getattr(row, name) for name in fields} for row in rows]
+
 # 정렬 로직을 함수로 분리
 def _apply_ordering(query, sort_criteria: dict):
     order_by_clauses = []
@@ -78,6 +110,10 @@ def _apply_ordering(query, sort_criteria: dict):
             order_by_clauses.append(desc(column))
         else:
             raise ValueError(f"Invalid sorting method for column: {column_name}, Value should be 0 or 1.")
+
+    # 동일한 값끼리의 순서를 고정하기 위해 마지막 정렬 방향으로 poster_id를 추가 정렬
+    if order_by_clauses and "poster_id" not in sort_criteria:
+        order_by_clauses.append(asc(JobPosting.poster_id) if sorting_method == 0 else desc(JobPosting.poster_id))
     return query.order_by(*order_by_clauses)
 
 def get_job_postings(db: Session, page: int = 1, item_counts: int = 20) -> dict:
@@ -121,18 +157,22 @@ POSTER_STATUS_ACTIVE = 1
 POSTER_STATUS_EXTENDED = 0
 POSTER_STATUS_INACTIVE = 2
 
+def available_job_posting_condition(today: Optional[date] = None):
+    """
+    게시 중인 공고(무기한 연장되었거나, 마감일자가 지나지 않은 게시 상태의 공고) 조건
+    마감된 공고는 expire_job_postings가 POSTER_STATUS_INACTIVE로 바꾸므로,
+    (poster_status, deadline_date) 인덱스에서 EXTENDED 구간과 ACTIVE 중 오늘 이후 마감 구간만 읽습니다.
+    (정리 작업이 아직 실행되지 않은 날에도 결과가 같도록 ACTIVE 공고의 마감일자 조건은 유지)
+    """
+    return or_(
+        JobPosting.poster_status == POSTER_STATUS_EXTENDED,
+        and_(JobPosting.poster_status == POSTER_STATUS_ACTIVE, JobPosting.deadline_date >= (today or date.today())),
+    )
+
 def get_available_job_postings_sorted_by(db: Session, sort_criteria: dict, page: int = 1, item_counts: int = 20) -> dict:
     """마감일자가 지나지 않았거나, 지났더라도 무기한 연장된 JobPosting 목록 정렬 조회"""
     try:
-        query = db.query(JobPosting).filter(
-            and_(
-                JobPosting.poster_status < POSTER_STATUS_INACTIVE,
-                or_(
-                    JobPosting.poster_status == POSTER_STATUS_EXTENDED,
-                    JobPosting.deadline_date >= date.today()
-                    )
-            )
-        )
+        query = db.query(JobPosting).filter(available_job_posting_condition())
         query = _apply_ordering(query, sort_criteria)
         offset = (page - 1) * item_counts
         postings = query.offset(offset).limit(item_counts).all()
@@ -150,6 +190,22 @@ def get_available_job_postings_sorted_by(db: Session, sort_criteria: dict, page:
     except Exception as e:
         return {"success": False, "message": str(e)}
 
+def _on_job_posting_changed(poster_id: str, posting: Optional["JobPosting"] = None):
+    """
+    JobPosting 변경 후 캐시와 검색 인덱스를 갱신합니다.
+    :param posting: 변경된 JobPosting (삭제된 경우 None)
+    """
+    from .posting_index import posting_index  # posting_index가 이 모듈을 import하므로 지연 import
+
+    count_cache.invalidate(JobPosting.__tablename__)
+    facet_cache.invalidate(JobPosting.__tablename__)
+    if posting is None:
+        title_index.remove(poster_id)
+        posting_index.remove(poster_id)
+    else:
+        title_index.upsert(poster_id, posting.poster_title)
+        posting_index.upsert(posting)
+
 def create_job_posting(db: Session, comp_id: int, poster_id: str, poster_title: str, poster_link: Optional[str] = None, job_sectors: Optional[str] = None, job_career: Optional[str] = None, job_education: Optional[str] = None, edu_code: int = None, edu_upper: Optional[int] = None, deadline_date: Optional[date] = None, job_codes: Optional[list] = None, loc_codes: Optional[list] = None, sal_code: int = None, poster_status: int = POSTER_STATUS_ACTIVE, poster_writer_user_id: str = None) -> dict:
     """새로운 JobPosting 생성"""
     try:
@@ -176,17 +232,75 @@ def create_job_posting(db: Session, comp_id: int, poster_id: str, poster_title:
             poster_writer_user_id=poster_writer_user_id
         )
         db.add(new_posting)
+        _sync_code_tables(db, poster_id, job_codes, loc_codes)
+        record_job_posting_changes(db, [poster_id])
         db.commit()
         db.refresh(new_posting)
+        _on_job_posting_changed(new_posting.poster_id, new_posting)
         return {"success": True, "posting": new_posting.to_dict()}
     except Exception as e:
         db.rollback()
         return {"success": False, "message": str(e)}
 
-def create_filter_for_job_postings(params: dict):
+CODE_MATCH_ANY = "any"  # 주어진 코드 중 하나라도 포함
+CODE_MATCH_ALL = "all"  # 주어진 코드를 모두 포함
+CODE_MATCH_MODES = (CODE_MATCH_ANY, CODE_MATCH_ALL)
+
+def _sync_code_tables(db: Session, poster_id: str, job_codes: Optional[list] = None, loc_codes: Optional[list] = None):
+    """
+    JobPosting의 job_codes/loc_codes JSON 컬럼과 JobPostingJob/JobPostingLoc 조인 테이블을 동기화합니다.
+    None인 항목은 변경하지 않으며, commit은 호출한 쪽에서 수행합니다.
+    """
+    if job_codes is not None:
+        db.query(JobPostingJob).filter(JobPostingJob.poster_id == poster_id).delete(synchronize_session=False)
+        db.add_all([JobPostingJob(poster_id=poster_id, job_code=int(code)) for code in set(job_codes)])
+    if loc_codes is not None:
+        db.query(JobPostingLoc).filter(JobPostingLoc.poster_id == poster_id).delete(synchronize_session=False)
+        db.add_all([JobPostingLoc(poster_id=poster_id, loc_code=int(code)) for code in set(loc_codes)])
+
+def _create_code_filter(join_model, code_column, codes: list, match: str = CODE_MATCH_ANY):
+    """
+    조인 테이블(JobPostingJob, JobPostingLoc)에 대한 EXISTS 세미조인 조건을 생성합니다.
+    (poster_id, code) 복합 PK를 통해 인덱스 조회로 처리됩니다.
+    :param match: any(하나라도 포함) 또는 all(모두 포함)
+    """
+    if match not in CODE_MATCH_MODES:
+        raise ValueError(f"Invalid code match option: {match}, Value should be one of {list(CODE_MATCH_MODES)}.")
+
+    codes = list(codes) if isinstance(codes, (list, tuple, set)) else [codes]
+    if match == CODE_MATCH_ANY:
+        return exists().where(and_(join_model.poster_id == JobPosting.poster_id, code_column.in_(codes)))
+    return and_(*[
+        exists().where(and_(join_model.poster_id == JobPosting.poster_id, code_column == code))
+        for code in codes
+    ])
+
+def _create_title_filter(keyword: str, title_search_strategy: str = TITLE_SEARCH_LIKE):
+    """
+    title_contains 검색 조건을 검색 전략에 따라 생성합니다.
+    - like: ILIKE '%keyword%' (전체 스캔)
+    - fulltext: FULLTEXT 인덱스로 후보를 찾은 뒤 LIKE로 정확히 확인 (MySQL)
+    - inverted: 프로세스 내 역색인으로 찾은 poster_id 목록 (title_index가 로드되어 있어야 함)
+    """
+    like_filter = JobPosting.poster_title.ilike(f"%{keyword}%")
+    if title_search_strategy == TITLE_SEARCH_FULLTEXT and len("".join(keyword.split())) >= NGRAM_SIZE:
+        return and_(fulltext_match_expression(JobPosting.poster_title, keyword), like_filter)
+    if title_search_strategy == TITLE_SEARCH_INVERTED:
+        return JobPosting.poster_id.in_(title_index.search(keyword))
+    return like_filter
+
+def _resolve_title_search(db: Session, filters: Optional[dict]) -> str:
+    """세션의 DB 종류로 제목 검색 전략을 정하고, inverted 전략이면 역색인을 준비합니다."""
+    strategy = resolve_title_search_strategy(db.get_bind().dialect.name)
+    if strategy == TITLE_SEARCH_INVERTED and filters and filters.get("title_contains"):
+        title_index.ensure_loaded(lambda: db.query(JobPosting.poster_id, JobPosting.poster_title).all())
+    return strategy
+
+def create_filter_for_job_postings(params: dict, title_search_strategy: str = TITLE_SEARCH_LIKE):
     """
     JobPosting 검색 조건을 생성합니다.
     :param params: 검색 필터 조건을 포함한 딕셔너리 (예: {"comp_id": 1, "job_sectors": "IT"})
+    :param title_search_strategy: title_contains 검색 전략 (like, fulltext, inverted)
     :return: SQLAlchemy 필터 조건 (and_ 객체)
     """
     filters = []
@@ -194,7 +308,7 @@ def create_filter_for_job_postings(params: dict):
     # 필터링 조건 적용 (AVAILABLE_FILTERS 기준)
     for key, value in params.items():
         if key == "title_contains":
-            filters.append(JobPosting.poster_title.ilike(f"%{value}%"))
+            filters.append(_create_title_filter(value, title_search_strategy))
         elif key == "comp_id":
             filters.append(JobPosting.comp_id == value)
         elif key == "sal_code_eq":
@@ -210,19 +324,54 @@ def create_filter_for_job_postings(params: dict):
         elif key == "edu_code_lte":
             filters.append(JobPosting.edu_code <= value)
         elif key == "deadline_date_eq":
-            filters.append(JobPosting.deadline_date == datetime.strptime(value, "%Y-%m-%d"))
+            filters.append(JobPosting.deadline_date == datetime.strptime(value, "%Y-%m-%d").date())
         elif key == "deadline_date_gte":
-            filters.append(JobPosting.deadline_date >= datetime.strptime(value, "%Y-%m-%d"))
+            filters.append(JobPosting.deadline_date >= datetime.strptime(value, "%Y-%m-%d").date())
         elif key == "deadline_date_lte":
-            filters.append(JobPosting.deadline_date <= datetime.strptime(value, "%Y-%m-%d"))
+            filters.append(JobPosting.deadline_date <= datetime.strptime(value, "%Y-%m-%d").date())
         elif key == "loc_codes":
-            filters.append(JobPosting.loc_codes.in_(value))  # loc_codes는 리스트로 처리
+            filters.append(_create_code_filter(JobPostingLoc, JobPostingLoc.loc_code, value, params.get("loc_codes_match", CODE_MATCH_ANY)))
         elif key == "job_codes":
-            filters.append(JobPosting.job_codes.in_(value))  # job_codes는 리스트로 처리
+            filters.append(_create_code_filter(JobPostingJob, JobPostingJob.job_code, value, params.get("job_codes_match", CODE_MATCH_ANY)))
             
     return and_(*filters)
 
-def get_available_job_postings(db: Session, page: int = 1, item_counts: int = 20, filters: dict = None, sort_criteria: dict = {"deadline_date": {"sorting_method": 0}}) -> dict:
+SORT_BY_RELEVANCE = "relevance"
+
+def _get_relevance_page(db: Session, query, keyword: str, page: int, item_counts: int, count_mode: str, fields: tuple = BRIEF_FIELDS) -> dict:
+    """
+    FULLTEXT 인덱스가 없는 환경(like, inverted 전략)에서 관련도 순으로 정렬된 페이지를 생성합니다.
+    최근 수정된 검색 결과 최대 get_relevance_max_candidates()개의 (poster_id, poster_title)만 조회해 점수를 계산한 뒤,
+    해당 페이지의 공고만 다시 조회합니다. (total_count도 점수를 계산한 결과 수 기준)
+    """
+    rows = (
+        query.with_entities(JobPosting.poster_id, JobPosting.poster_title)
+        .order_by(desc(JobPosting.last_updated_date), asc(JobPosting.poster_id))
+        .limit(get_relevance_max_candidates())
+        .all()
+    )
+    # 점수가 같으면 poster_id 오름차순
+    rows.sort(key=lambda row: row.poster_id)
+    rows.sort(key=lambda row: title_relevance_score(row.poster_title, keyword), reverse=True)
+
+    offset = (page - 1) * item_counts
+    page_ids = [row.poster_id for row in rows[offset:offset + item_counts]]
+    page_query = _project_brief(db.query(JobPosting), fields, extra=("poster_id",)).filter(JobPosting.poster_id.in_(page_ids))
+    rows_by_id = {row.poster_id: row for row in page_query.all()} if page_ids else {}
+
+    data = {"postings": _rows_to_briefs([rows_by_id[poster_id] for poster_id in page_ids if poster_id in rows_by_id], fields)}
+    if count_mode == COUNT_MODE_NONE:
+        data.update({"current_page": page, "has_next": offset + item_counts < len(rows)})
+    else:
+        data.update({
+            "total_count": len(rows),
+            "current_page": page,
+            "total_page": (len(rows) + item_counts - 1) // item_counts,
+            "has_next": offset + item_counts < len(rows),
+        })
+    return data
+
+def get_available_job_postings(db: Session, page: int = 1, item_counts: int = 20, filters: dict = None, sort_criteria: dict = {"deadline_date": {"sorting_method": 0}}, count_mode: str = COUNT_MODE_ESTIMATE, fields: Optional[tuple] = None) -> dict:
     """
     마감일자가 지나지 않았거나, 무기한 연장된 JobPosting 목록 조회
     :param db: SQLAlchemy Session
@@ -230,38 +379,42 @@ def get_available_job_postings(db: Session, page: int = 1, item_counts: int = 20
     :param page: 조회할 페이지 번호 (기본값: 1)
     :param item_counts: 페이지당 항목 수 (기본값: 20)
     :param filters: 필터 조건 (딕셔너리 형태)
+    :param count_mode: total_count 계산 방식 (estimate: 캐시 사용, exact: 항상 계산, none: 생략하고 has_next만 반환)
+    :param fields: 응답에 포함할 필드 (BRIEF_FIELDS 중 일부, None이면 전체)
     :return: 조회 결과 (성공 여부, 게시물 목록, 총 개수 등)
     """
     try:
+        fields = fields or BRIEF_FIELDS
         # 기본 필터 조건 생성
-        query = db.query(JobPosting).filter(
-            and_(
-                JobPosting.poster_status < POSTER_STATUS_INACTIVE,
-                or_(
-                    JobPosting.poster_status == POSTER_STATUS_EXTENDED,
-                    JobPosting.deadline_date >= date.today()
-                )
-            )
-        )
+        query = db.query(JobPosting).filter(available_job_posting_condition())
 
         # 추가 필터 조건 적용
+        title_search_strategy = _resolve_title_search(db, filters)
         if filters:
             # 필터 조건을 사용하여 추가적인 조건 생성
-            additional_filters = create_filter_for_job_postings(filters)
+            additional_filters = create_filter_for_job_postings(filters, title_search_strategy)
             query = query.filter(additional_filters)
+
+        # 관련도 정렬
+        if SORT_BY_RELEVANCE in sort_criteria:
+            keyword = (filters or {}).get("title_contains")
+            if not keyword:
+                raise ValueError("Sorting by relevance requires title_contains.")
+            if title_search_strategy != TITLE_SEARCH_FULLTEXT:
+                return {"success": True, "data": _get_relevance_page(db, query, keyword, page, item_counts, count_mode, fields)}
+            query = query.order_by(desc(fulltext_match_expression(JobPosting.poster_title, keyword)), asc(JobPosting.poster_id))
+        else:
+            # 정렬 적용
+            query = _apply_ordering(query, sort_criteria)
         
-        # 정렬 적용
-        query = _apply_ordering(query, sort_criteria)
-        
-        # 페이징 적용
-        offset = (page - 1) * item_counts
-        postings = query.offset(offset).limit(item_counts).all()
-        total_count = query.count()
+        # 필요한 컬럼만 조회 (ORM 엔티티 생성 생략)
+        query = _project_brief(query, fields)
+
+        # 페이징 적용 (total_count는 필터 기준으로 캐싱)
+        rows, page_info = paginate(query, page, item_counts, count_mode, count_cache.make_key(JobPosting.__tablename__, filters))
         data = {
-            "postings": [posting.to_brief_dict() for posting in postings],
-            "total_count": total_count,
-            "current_page": page,
-            "total_page": (total_count + item_counts - 1) // item_counts,
+            "postings": _rows_to_briefs(rows, fields),
+            **page_info,
         }
         return {
             "success": True,
@@ -272,6 +425,152 @@ def get_available_job_postings(db: Session, page: int = 1, item_counts: int = 20
     except Exception as e:
         return {"success": False, "message": str(e)}
 
+# 키셋(커서) 페이징에서 정렬 컬럼 값을 복원할 때 사용하는 타입 정보
+_KEYSET_DATE_COLUMNS = {"deadline_date", "last_updated_date"}
+
+def _apply_keyset(query, sort_criteria: dict, cursor: Optional[dict] = None):
+    """
+    정렬 컬럼 + poster_id 기준으로 정렬하고, 커서가 주어지면 해당 위치 이후부터 조회하도록 WHERE 조건을 추가합니다.
+    :param sort_criteria: 정렬 기준 (단일 컬럼, 예: {"deadline_date": {"sorting_method": 0}})
+    :param cursor: 이전 페이지 마지막 항목의 값 (예: {"value": "2024-12-20", "poster_id": "rec-1"})
+    """
+    if len(sort_criteria) != 1:
+        raise ValueError("Cursor pagination supports exactly one sorting column.")
+
+    column_name, sort_info = next(iter(sort_criteria.items()))
+    column = getattr(JobPosting, column_name, None)
+    if column is None:
+        raise ValueError(f"Invalid column name: {column_name}")
+
+    sorting_method = sort_info.get('sorting_method', 0)  # 0: asc, 1: desc
+    if sorting_method not in (0, 1):
+        raise ValueError(f"Invalid sorting method for column: {column_name}, Value should be 0 or 1.")
+
+    if cursor is not None:
+        value = cursor.get("value")
+        last_poster_id = cursor.get("poster_id")
+        if value is None or last_poster_id is None:
+            raise ValueError("Invalid cursor.")
+        if column_name in _KEYSET_DATE_COLUMNS:
+            value = date.fromisoformat(value)
+
+        # (column, poster_id) 튜플 비교를 OR 조건으로 풀어서 인덱스 탐색이 가능하도록 함
+        if sorting_method == 0:
+            query = query.filter(or_(column > value, and_(column == value, JobPosting.poster_id > last_poster_id)))
+        else:
+            query = query.filter(or_(column < value, and_(column == value, JobPosting.poster_id < last_poster_id)))
+
+    if sorting_method == 0:
+        return query.order_by(asc(column), asc(JobPosting.poster_id)), column_name
+    return query.order_by(desc(column), desc(JobPosting.poster_id)), column_name
+
+def get_available_job_postings_by_cursor(db: Session, item_counts: int = 20, filters: dict = None, sort_criteria: dict = {"deadline_date": {"sorting_method": 0}}, cursor: Optional[dict] = None, fields: Optional[tuple] = None) -> dict:
+    """
+    마감일자가 지나지 않았거나, 무기한 연장된 JobPosting 목록을 키셋(커서) 방식으로 조회
+    OFFSET 없이 이전 페이지의 마지막 (정렬 컬럼, poster_id) 값 이후부터 조회하므로 페이지 깊이와 관계없이 일정한 비용으로 조회됩니다.
+    :param db: SQLAlchemy Session
+    :param item_counts: 페이지당 항목 수 (기본값: 20)
+    :param filters: 필터 조건 (딕셔너리 형태)
+    :param sort_criteria: 정렬 기준 (예: {"poster_title": {"sorting_method": 0}})
+    :param cursor: 이전 페이지 마지막 항목의 정렬 값 (첫 페이지는 None)
+    :param fields: 응답에 포함할 필드 (BRIEF_FIELDS 중 일부, None이면 전체)
+    :return: 조회 결과 (성공 여부, 게시물 목록, 다음 커서 등)
+    """
+    try:
+        fields = fields or BRIEF_FIELDS
+        query = db.query(JobPosting).filter(available_job_posting_condition())
+
+        title_search_strategy = _resolve_title_search(db, filters)
+        if filters:
+            query = query.filter(create_filter_for_job_postings(filters, title_search_strategy))
+
+        query, column_name = _apply_keyset(query, sort_criteria, cursor)
+        query = _project_brief(query, fields, extra=(column_name, "poster_id"))
+
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        rows = query.limit(item_counts + 1).all()
+        has_next = len(rows) > item_counts
+        rows = rows[:item_counts]
+
+        next_cursor = None
+        if has_next and rows:
+            last = rows[-1]
+            value = getattr(last, column_name)
+            next_cursor = {
+                "value": value.isoformat() if column_name in _KEYSET_DATE_COLUMNS else value,
+                "poster_id": last.poster_id,
+            }
+
+        data = {
+            "postings": _rows_to_briefs(rows, fields),
+            "has_next": has_next,
+            "next_cursor": next_cursor,
+        }
+        return {
+            "success": True,
+            "data": data
+        }
+    except ValueError as e:  # 유효하지 않은 정렬 기준 또는 커서 처리
+        return {"success": False, "message": str(e)}
+    except Exception as e:
+        return {"success": False, "message": str(e)}
+
+# 필터별 facet 결과 캐시 (JobPosting 변경 시 _on_job_posting_changed에서 무효화)
+facet_cache = CountCache()
+
+def get_available_job_posting_facets(db: Session, filters: dict = None) -> dict:
+    """
+    마감일자가 지나지 않았거나, 무기한 연장된 JobPosting 중 필터 조건에 맞는 공고의 facet별 개수를 조회
+    sal_code, edu_code, 1차 지역(LocCode.loc_mcode), 직무(job_code)별 개수를 GROUP BY 집계로 계산합니다.
+    :param db: SQLAlchemy Session
+    :param filters: 필터 조건 (딕셔너리 형태)
+    :return: 조회 결과 (성공 여부, 전체 개수, facet별 개수)
+    """
+    try:
+        cache_key = facet_cache.make_key(JobPosting.__tablename__, filters)
+        data = facet_cache.get(cache_key)
+        if data is not None:
+            return {"success": True, "data": data}
+
+        query = db.query(JobPosting).filter(available_job_posting_condition())
+        title_search_strategy = _resolve_title_search(db, filters)
+        if filters:
+            query = query.filter(create_filter_for_job_postings(filters, title_search_strategy))
+
+        matched_ids = query.with_entities(JobPosting.poster_id)
+
+        sal_counts = query.with_entities(JobPosting.sal_code, func.count()).group_by(JobPosting.sal_code).all()
+        edu_counts = query.with_entities(JobPosting.edu_code, func.count()).group_by(JobPosting.edu_code).all()
+        loc_counts = (
+            db.query(LocCode.loc_mcode, func.count(distinct(JobPostingLoc.poster_id)))
+            .join(LocCode, LocCode.loc_code == JobPostingLoc.loc_code)
+            .filter(JobPostingLoc.poster_id.in_(matched_ids))
+            .group_by(LocCode.loc_mcode)
+            .all()
+        )
+        job_counts = (
+            db.query(JobPostingJob.job_code, func.count())
+            .filter(JobPostingJob.poster_id.in_(matched_ids))
+            .group_by(JobPostingJob.job_code)
+            .all()
+        )
+
+        data = {
+            "total_count": query.count(),
+            "facets": {
+                "sal_code": [{"sal_code": code, "count": count} for code, count in sorted(sal_counts)],
+                "edu_code": [{"edu_code": code, "count": count} for code, count in sorted(edu_counts)],
+                "loc_mcode": [{"loc_mcode": code, "count": count} for code, count in sorted(loc_counts, key=lambda row: (row[0] is None, row[0] or 0))],
+                "job_code": [{"job_code": code, "count": count} for code, count in sorted(job_counts)],
+            },
+        }
+        facet_cache.set(cache_key, data)
+        return {"success": True, "data": data}
+    except ValueError as e:
+        return {"success": False, "message": str(e)}
+    except Exception as e:
+        return {"success": False, "message": str(e)}
+
 def get_job_posting_by_id(db: Session, poster_id_input: str) -> dict:
     """poster_id로 JobPosting 정보 가져오기"""
     try:
@@ -304,7 +603,10 @@ def update_job_posting(db: Session, poster_id_input: str, new_comp_id: Optional[
             if new_loc_codes is not None: posting.loc_codes = new_loc_codes
             if new_sal_code is not None: posting.sal_code = new_sal_code
             posting.last_updated_date = date.today()
+            _sync_code_tables(db, poster_id_input, new_job_codes, new_loc_codes)
+            record_job_posting_changes(db, [poster_id_input])
 
+        _on_job_posting_changed(posting.poster_id, posting)
         return {"success": True, "posting": posting.to_dict()}
     except Exception as e:
         db.rollback()
@@ -318,27 +620,65 @@ def delete_job_posting(db: Session, poster_id_input: str) -> dict:
             if not posting:
                 return {"success": False, "message": "JobPosting을 찾을 수 없습니다."}
             db.delete(posting)
+            record_job_posting_changes(db, [poster_id_input])
+        _on_job_posting_changed(poster_id_input)
         return {"success": True}
     except Exception as e:
         db.rollback()
         return {"success": False, "message": str(e)}
     
-def increment_view_count(db: Session, poster_id_input: str) -> dict:
-    """poster_id로 JobPosting의 view_cnts 값을 1 증가시킴"""
+def add_view_counts(db: Session, counts: dict) -> dict:
+    """
+    여러 JobPosting의 view_cnts 값을 한 번에 증가시킴
+    UPDATE JobPosting SET view_cnts = view_cnts + CASE poster_id WHEN ... END WHERE poster_id IN (...) 한 번으로 반영합니다.
+    :param counts: {poster_id: 증가분}
+    """
     try:
-        # 해당 JobPosting을 찾기
-        posting = db.query(JobPosting).filter(JobPosting.poster_id == poster_id_input).first()
-        if not posting:
-            return {"success": False, "message": "JobPosting을 찾을 수 없습니다."}
-
-        # view_cnts 증가
-        posting.view_cnts += 1
-
-        # 변경사항 커밋
+        if not counts:
+            return {"success": True, "updated": 0}
+        result = db.execute(
+            update(JobPosting)
+            .where(JobPosting.poster_id.in_(list(counts.keys())))
+            .values(view_cnts=JobPosting.view_cnts + case(counts, value=JobPosting.poster_id, else_=0))
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
-        db.refresh(posting)
+        return {"success": True, "updated": result.rowcount}
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "message": str(e)}
 
-        return {"success": True, "posting": posting.to_dict()}
+def expire_job_postings(db: Session, today: Optional[date] = None, batch_size: int = 1000) -> dict:
+    """
+    마감일자가 지난 게시 상태(ACTIVE)의 JobPosting을 batch_size개씩 POSTER_STATUS_INACTIVE로 변경하는 함수 (배치마다 커밋)
+    UPDATE 조건에 상태와 마감일자를 다시 포함하므로, 여러 번 또는 여러 노드에서 동시에 실행해도 안전합니다.
+    무기한 연장(EXTENDED)된 공고는 변경하지 않습니다.
+    :return: {"success": True, "expired": 변경한 행 수}
+    """
+    today = today or date.today()
+    expired_condition = and_(JobPosting.poster_status == POSTER_STATUS_ACTIVE, JobPosting.deadline_date < today)
+    expired = 0
+    try:
+        while True:
+            poster_ids = [poster_id for (poster_id,) in db.query(JobPosting.poster_id).filter(expired_condition).limit(batch_size)]
+            if not poster_ids:
+                break
+            result = db.execute(
+                update(JobPosting)
+                .where(JobPosting.poster_id.in_(poster_ids), expired_condition)
+                .values(poster_status=POSTER_STATUS_INACTIVE)
+                .execution_options(synchronize_session=False)
+            )
+            record_job_posting_changes(db, poster_ids)
+            db.commit()
+            expired += result.rowcount
+            if len(poster_ids) < batch_size:
+                break
+        return {"success": True, "expired": expired}
     except Exception as e:
         db.rollback()
-        return {"success": False, "message": str(e)}
\ No newline at end of file
+        return {"success": False, "expired": expired, "error": str(e)}
+    finally:
+        if expired:
+            count_cache.invalidate(JobPosting.__tablename__)
+            facet_cache.invalidate(JobPosting.__tablename__)
@@ -0,0 +1,49 @@
+# models/job_posting_change.py
+
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Index, delete, func
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Iterable
+
+from . import Base
+
+class JobPostingChange(Base):
+    """
+    JobPostingChange 테이블에 대한 SQLAlchemy 모델 클래스
+    JobPosting이 생성/수정/삭제/상태 변경될 때 같은 트랜잭션에서 poster_id를 기록하는 변경 로그입니다.
+    (다른 프로세스의 검색 인덱스(posting_index)가 변경된 공고만 다시 읽는 데 사용)
+    """
+    __tablename__ = "JobPostingChange"
+    __table_args__ = (
+        # 변경분 조회(changed_at >= 시각)와 오래된 로그 정리용
+        Index("ix_job_posting_change_changed_at", "changed_at"),
+    )
+
+    change_id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True, nullable=False)
+    poster_id = Column(String(255), nullable=False)  # 삭제된 공고도 기록하므로 외래 키를 두지 않음
+    changed_at = Column(DateTime, nullable=False, server_default=func.now())  # DB 시각 (프로세스 간 시계 차이 없음)
+
+def record_job_posting_changes(db: Session, poster_ids: Iterable[str]):
+    """변경된 공고의 poster_id를 기록합니다. (commit은 호출한 쪽에서 공고 변경과 함께 수행)"""
+    db.add_all([JobPostingChange(poster_id=poster_id) for poster_id in set(poster_ids)])
+
+def prune_job_posting_changes(db: Session, before: datetime, batch_size: int = 1000) -> dict:
+    """
+    changed_at이 before 이전인 변경 로그를 batch_size개씩 삭제합니다. (배치마다 커밋)
+    :return: {"success": bool, "deleted": 삭제한 행 수}
+    """
+    deleted = 0
+    try:
+        while True:
+            change_ids = [change_id for (change_id,) in db.query(JobPostingChange.change_id).filter(JobPostingChange.changed_at < before).order_by(JobPostingChange.changed_at).limit(batch_size)]
+            if not change_ids:
+                break
+            result = db.execute(delete(JobPostingChange).where(JobPostingChange.change_id.in_(change_ids)))
+            db.commit()
+            deleted += result.rowcount
+            if len(change_ids) < batch_size:
+                break
+        return {"success": True, "deleted": deleted}
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "deleted": deleted, "error": str(e)}
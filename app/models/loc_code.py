@@ -5,6 +5,8 @@ from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import Session
 
 from . import Base
+from .pagination import count_cache, paginate, COUNT_MODE_ESTIMATE
+from .code_cache import code_table_cache
 
 class LocCode(Base):
     """
@@ -25,19 +27,16 @@ class LocCode(Base):
             "loc_mname": self.loc_mname
         }
 
-def get_loc_codes(db: Session, page: int = 1, item_counts: int = 20) -> dict:
+def get_loc_codes(db: Session, page: int = 1, item_counts: int = 20, count_mode: str = COUNT_MODE_ESTIMATE) -> dict:
     """
     LocCode 목록을 조회하는 함수 (Pagination 적용)
     """
     try:
-        offset = (page - 1) * item_counts
-        loc_codes = db.query(LocCode).offset(offset).limit(item_counts).all()
-        total_count = db.query(LocCode).count()
+        query = db.query(LocCode).order_by(LocCode.loc_code)
+        loc_codes, page_info = paginate(query, page, item_counts, count_mode, count_cache.make_key(LocCode.__tablename__))
         data = {
             "loc_codes": [loc_code.to_dict() for loc_code in loc_codes],
-            "total_count": total_count,
-            "current_page": page,
-            "total_page": (total_count + item_counts - 1) // item_counts
+            **page_info,
         }
         return {
             "success": True,
@@ -58,6 +57,8 @@ def create_loc_code(db: Session, loc_code: int, loc_name: str, loc_mcode: int =
         new_loc_code = LocCode(loc_code=loc_code, loc_name=loc_name, loc_mcode=loc_mcode, loc_mname=loc_mname)
         db.add(new_loc_code)
         db.commit()
+        count_cache.invalidate(LocCode.__tablename__)
+        code_table_cache.invalidate()
         db.refresh(new_loc_code)
         return {"success": True, "loc_code": new_loc_code.to_dict()}
     except Exception as e:
@@ -85,6 +86,7 @@ def update_loc_code(db: Session, loc_code_id: int, new_loc_name: str = None, new
             if new_loc_mcode is not None: loc_code.loc_mcode = new_loc_mcode
             if new_loc_mname is not None: loc_code.loc_mname = new_loc_mname
             db.commit()
+            code_table_cache.invalidate()
             return {"success": True, "loc_code": loc_code.to_dict()}
         except Exception as e:
             db.rollback()
@@ -101,6 +103,8 @@ def delete_loc_code(db: Session, loc_code_id: int) -> dict:
         try:
             db.delete(loc_code)
             db.commit()
+            count_cache.invalidate(LocCode.__tablename__)
+            code_table_cache.invalidate()
             return {"success": True}
         except Exception as e:
             db.rollback()
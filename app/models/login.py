@@ -1,18 +1,29 @@
 # models/login.py
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, Index, func
 from sqlalchemy.orm import declarative_base, relationship, Session
 from datetime import datetime
+from typing import Optional
+from zoneinfo import ZoneInfo
+import jwt
 
 from . import Base
+from .refresh_token_cache import refresh_token_cache
 
 class Login(Base):
     """Login 테이블에 대한 SQLAlchemy 모델 클래스"""
     __tablename__ = "Login"
+    __table_args__ = (
+        # refresh_token(TEXT)은 인덱스를 걸 수 없으므로, 토큰의 jti로 조회
+        Index("uq_login_refresh_jti", "refresh_jti", unique=True),
+        # 만료된 로그인 정리(sweep_expired_logins)용
+        Index("ix_login_expires_at", "expires_at"),
+    )
 
     refresh_id = Column(Integer, primary_key=True, autoincrement=True, nullable=False)
     user_id = Column(String(255), ForeignKey("User.user_id"), nullable=False)
     refresh_token = Column(Text)
+    refresh_jti = Column(String(64))  # refresh_token(JWT)의 jti
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     expires_at = Column(DateTime, nullable=False)
     login_device_info = Column(Text)
@@ -26,12 +37,30 @@ class Login(Base):
             "refresh_id": self.refresh_id,
             "user_id": self.user_id,
             "refresh_token": self.refresh_token,
+            "refresh_jti": self.refresh_jti,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "expires_at": self.expires_at.isoformat() if self.expires_at else None,
             "login_device_info": self.login_device_info,
             "login_ip": self.login_ip
         }
 
+def get_refresh_jti(refresh_token: str) -> Optional[str]:
+    """
+    refresh token(JWT)에서 jti를 꺼냅니다. (조회 키로만 사용하므로 서명은 검증하지 않음)
+    JWT 형식이 아니거나 jti가 없으면 None을 반환합니다.
+    """
+    try:
+        jti = jwt.decode(refresh_token, options={"verify_signature": False}).get("jti")
+    except (jwt.PyJWTError, AttributeError, TypeError):
+        return None
+    return jti if isinstance(jti, str) else None
+
+def get_expires_timestamp(expires_at: datetime) -> float:
+    """Login.expires_at(한국 시간 기준, timezone 정보 없음)을 epoch 초로 변환합니다."""
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=ZoneInfo("Asia/Seoul"))
+    return expires_at.timestamp()
+
 def get_logins(db: Session, page: int = 1, item_counts: int = 20) -> dict:
     """Login 목록을 조회하는 함수 (Pagination 적용)"""
     offset = (page - 1) * item_counts
@@ -48,10 +77,11 @@ def get_logins(db: Session, page: int = 1, item_counts: int = 20) -> dict:
 def create_login(db: Session, user_id: str, refresh_token: str, expires_at: datetime, login_device_info: str = None, login_ip: str = None) -> dict:
     """새로운 Login 정보를 생성하는 함수"""
     try:
-        new_login = Login(user_id=user_id, refresh_token=refresh_token, expires_at=expires_at, login_device_info=login_device_info, login_ip=login_ip)
+        new_login = Login(user_id=user_id, refresh_token=refresh_token, refresh_jti=get_refresh_jti(refresh_token), expires_at=expires_at, login_device_info=login_device_info, login_ip=login_ip)
         db.add(new_login)
         db.commit()
         db.refresh(new_login)
+        refresh_token_cache.add(new_login.refresh_jti, user_id, get_expires_timestamp(expires_at))
         return {"success": True, "login": new_login.to_dict()}
     except Exception as e:
         db.rollback()
@@ -66,20 +96,50 @@ def get_login_by_refresh_id(db: Session, refresh_id_input: int) -> dict:
         return {"success": False, "message": "Login not found"}
     
 def get_login_by_refresh_token(db: Session, refresh_token_input: str) -> dict:
-    """refresh_id로 Login 정보를 가져오는 함수"""
-    login = db.query(Login).filter(Login.refresh_token == refresh_token_input).first()
+    """refresh_token으로 Login 정보를 가져오는 함수 (refresh_jti 유니크 인덱스로 조회)"""
+    refresh_jti = get_refresh_jti(refresh_token_input)
+    login = None
+    if refresh_jti is not None:
+        login = db.query(Login).filter(Login.refresh_jti == refresh_jti).first()
+    if login and login.refresh_token == refresh_token_input:
+        return {"success": True, "login": login.to_dict()}
+    else:
+        return {"success": False, "message": "Login not found"}
+
+def get_login_by_refresh_jti(db: Session, refresh_jti_input: str) -> dict:
+    """refresh token의 jti로 Login 정보를 가져오는 함수"""
+    login = db.query(Login).filter(Login.refresh_jti == refresh_jti_input).first()
     if login:
         return {"success": True, "login": login.to_dict()}
     else:
         return {"success": False, "message": "Login not found"}
 
+def lookup_refresh_login(db: Session, refresh_jti: str, refresh_token: str = None) -> tuple:
+    """
+    refresh token이 유효한 Login인지 refresh_token_cache를 거쳐 확인하는 함수 (캐시에 없을 때만 DB 조회)
+    :param refresh_token: 지정하면 캐시에 없을 때 저장된 토큰 문자열까지 일치하는지 확인
+    :return: (user_id, 만료 시각(epoch)), 폐기되었거나 없으면 (None, 0.0)
+    """
+    def load():
+        if refresh_token is not None:
+            result = get_login_by_refresh_token(db, refresh_token)
+        else:
+            result = get_login_by_refresh_jti(db, refresh_jti)
+        if not result['success']:
+            return None
+        return result['login']['user_id'], get_expires_timestamp(datetime.fromisoformat(result['login']['expires_at']))
+
+    return refresh_token_cache.lookup(refresh_jti, load)
+
 def delete_login(db: Session, refresh_id_input: int) -> dict:
     """기존 Login 정보를 삭제하는 함수"""
     login = db.query(Login).filter(Login.refresh_id == refresh_id_input).first()
     if login:
         try:
+            refresh_jti = login.refresh_jti
             db.delete(login)
             db.commit()
+            refresh_token_cache.revoke(refresh_jti)
             return {"success": True}
         except Exception as e:
             db.rollback()
@@ -88,17 +148,21 @@ def delete_login(db: Session, refresh_id_input: int) -> dict:
         return {"success": False, "message": "Login not found"}
     
 def delete_login_by_refresh_token(db: Session, refresh_token_input: str) -> dict:
-    """기존 Login 정보를 삭제하는 함수"""
-    login = db.query(Login).filter(Login.refresh_token == refresh_token_input).first()
+    """기존 Login 정보를 삭제하는 함수 (refresh_jti 유니크 인덱스로 조회 없이 바로 삭제)"""
+    refresh_jti = get_refresh_jti(refresh_token_input)
+    if refresh_jti is None:
+        return {"success": False, "message": "Login not found"}
 
-    if login:
-        try:
-            db.delete(login)
-            db.commit()
-            return {"success": True}
-        except Exception as e:
-            db.rollback()
-            return {"success": False, "error": str(e)}
+    try:
+        deleted = db.query(Login).filter(Login.refresh_jti == refresh_jti, Login.refresh_token == refresh_token_input).delete(synchronize_session=False)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "error": str(e)}
+
+    refresh_token_cache.revoke(refresh_jti)
+    if deleted:
+        return {"success": True}
     else:
         return {"success": False, "message": "Login not found"}
 
@@ -108,4 +172,102 @@ def get_login_by_user_id(db: Session, user_id_input: str) -> dict:
     if login:
         return {"success": True, "login": login.to_dict()}
     else:
-        return {"success": False, "message": "Login not found"}
\ No newline at end of file
+        return {"success": False, "message": "Login not found"}
+
+def backfill_login_refresh_jti(db: Session, batch_size: int = 1000) -> dict:
+    """
+    refresh_jti가 비어 있는 기존 Login 행에 refresh_token의 jti를 채우는 함수
+    refresh_id 순서로 batch_size개씩 처리하고 배치마다 커밋합니다. (여러 번 실행해도 안전)
+    :return: {"success": True, "updated": 채운 행 수, "skipped": jti를 꺼낼 수 없는 행 수}
+    """
+    updated = 0
+    skipped = 0
+    last_refresh_id = 0
+    try:
+        while True:
+            rows = db.query(Login.refresh_id, Login.refresh_token) \
+                .filter(Login.refresh_jti.is_(None), Login.refresh_id > last_refresh_id) \
+                .order_by(Login.refresh_id).limit(batch_size).all()
+            if not rows:
+                break
+            mappings = []
+            for refresh_id, refresh_token in rows:
+                refresh_jti = get_refresh_jti(refresh_token)
+                if refresh_jti is None:
+                    skipped += 1
+                else:
+                    mappings.append({"refresh_id": refresh_id, "refresh_jti": refresh_jti})
+            if mappings:
+                db.bulk_update_mappings(Login, mappings)
+            db.commit()
+            updated += len(mappings)
+            last_refresh_id = rows[-1][0]
+        return {"success": True, "updated": updated, "skipped": skipped}
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "updated": updated, "error": str(e)}
+
+def _delete_logins(db: Session, rows: list) -> int:
+    """(refresh_id, refresh_jti) 목록의 Login을 삭제하고 커밋한 뒤 refresh_token_cache에 폐기를 기록합니다."""
+    deleted = db.query(Login).filter(Login.refresh_id.in_([refresh_id for refresh_id, _ in rows])).delete(synchronize_session=False)
+    db.commit()
+    for _, refresh_jti in rows:
+        refresh_token_cache.revoke(refresh_jti)
+    return deleted
+
+def sweep_expired_logins(db: Session, now: datetime, batch_size: int = 1000) -> dict:
+    """
+    expires_at이 now 이전인 Login을 batch_size개씩 삭제하는 함수 (배치마다 커밋해 잠금을 짧게 유지)
+    여러 노드에서 동시에 실행해도 이미 삭제된 행은 건너뛰므로 안전합니다.
+    :param now: 한국 시간 기준 (timezone 정보 없음, Login.expires_at과 동일)
+    :return: {"success": True, "deleted": 삭제한 행 수}
+    """
+    deleted = 0
+    try:
+        while True:
+            rows = db.query(Login.refresh_id, Login.refresh_jti) \
+                .filter(Login.expires_at <= now) \
+                .order_by(Login.expires_at).limit(batch_size).all()
+            if not rows:
+                break
+            deleted += _delete_logins(db, rows)
+            if len(rows) < batch_size:
+                break
+        return {"success": True, "deleted": deleted}
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "deleted": deleted, "error": str(e)}
+
+def cap_user_logins(db: Session, max_sessions: int, batch_size: int = 1000) -> dict:
+    """
+    사용자마다 최근 max_sessions개의 Login만 남기고 오래된 Login을 삭제하는 함수
+    대상 사용자와 삭제할 Login 모두 batch_size개씩 조회하고, 삭제는 배치마다 커밋합니다.
+    :return: {"success": True, "deleted": 삭제한 행 수}
+    """
+    deleted = 0
+    try:
+        last_user_id = None
+        while True:
+            query = db.query(Login.user_id)
+            if last_user_id is not None:
+                query = query.filter(Login.user_id > last_user_id)
+            user_ids = [user_id for (user_id,) in query.group_by(Login.user_id).having(func.count(Login.refresh_id) > max_sessions).order_by(Login.user_id).limit(batch_size)]
+            for user_id in user_ids:
+                while True:
+                    # 삭제한 만큼 다음 배치가 앞으로 당겨지므로 항상 최근 max_sessions개 이후부터 조회
+                    rows = db.query(Login.refresh_id, Login.refresh_jti) \
+                        .filter(Login.user_id == user_id) \
+                        .order_by(Login.created_at.desc(), Login.refresh_id.desc()) \
+                        .offset(max_sessions).limit(batch_size).all()
+                    if not rows:
+                        break
+                    deleted += _delete_logins(db, rows)
+                    if len(rows) < batch_size:
+                        break
+            if len(user_ids) < batch_size:
+                break
+            last_user_id = user_ids[-1]
+        return {"success": True, "deleted": deleted}
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "deleted": deleted, "error": str(e)}
@@ -1,14 +1,19 @@
 # models/login_log.py
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, Index
 from sqlalchemy.orm import declarative_base, relationship, Session
 from datetime import datetime
 
 from . import Base
+from .audit_log_writer import audit_log_writer
 
 class LoginLog(Base):
     """LoginLog 테이블에 대한 SQLAlchemy 모델 클래스"""
     __tablename__ = "LoginLog"
+    __table_args__ = (
+        # 사용자별 로그인 기록 최신순 조회(get_login_logs_by_login_id)용
+        Index("ix_login_log_login_id_login_date", "login_id", "login_date"),
+    )
 
     login_log_id = Column(Integer, primary_key=True, autoincrement=True, nullable=False)
     login_date = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -55,6 +60,23 @@ def create_login_log(db: Session, login_id: str, login_ip: str = None, login_dev
         db.rollback()
         return {"success": False, "error": str(e)}
 
+def enqueue_login_log(login_id: str, login_ip: str = None, login_device_info: str = None, login_success: int = 0) -> dict:
+    """
+    LoginLog를 audit_log_writer로 기록하는 함수
+    async 모드에서는 요청과 별도의 커밋으로 모아서 저장되므로, login_date는 호출 시각으로 미리 채웁니다.
+    """
+    try:
+        audit_log_writer.write(LoginLog, {
+            "login_date": datetime.utcnow(),
+            "login_id": login_id,
+            "login_ip": login_ip,
+            "login_device_info": login_device_info,
+            "login_success": login_success,
+        })
+        return {"success": True}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
 def get_login_log_by_id(db: Session, login_log_id_input: int) -> dict:
     """login_log_id로 LoginLog 정보를 가져오는 함수"""
     log = db.query(LoginLog).filter(LoginLog.login_log_id == login_log_id_input).first()
@@ -0,0 +1,97 @@
+# models/login_sweeper.py
+
+import atexit
+import threading
+from datetime import datetime
+from typing import Callable, Optional
+
+from ..utils.util import now_korea
+
+class LoginSweeper:
+    """
+    만료된 Login 행과 사용자별 최대 세션 수를 넘는 오래된 Login 행을 주기적으로 삭제하는 sweeper
+
+    CLI(flask --app run sweep-logins)로 한 번 실행하거나, start()로 interval_seconds마다 실행합니다.
+    삭제는 batch_size개씩 나누어 커밋하므로 긴 잠금을 만들지 않으며, 여러 노드에서 동시에 실행해도 안전합니다.
+    실행 결과는 stats()로 확인할 수 있습니다.
+    """
+    def __init__(self, interval_seconds: float = 3600, batch_size: int = 1000, max_sessions_per_user: int = 0):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.max_sessions_per_user = max_sessions_per_user  # 0이면 제한 없음
+        self._session_factory = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._stats = {"runs": 0, "expired_deleted": 0, "over_limit_deleted": 0, "last_run_at": None, "last_error": None}
+
+    def configure(self, session_factory: Callable, interval_seconds: Optional[float] = None, batch_size: Optional[int] = None, max_sessions_per_user: Optional[int] = None):
+        self._session_factory = session_factory
+        if interval_seconds is not None:
+            self.interval_seconds = interval_seconds
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if max_sessions_per_user is not None:
+            self.max_sessions_per_user = max_sessions_per_user
+
+    def start(self):
+        """interval_seconds마다 sweep하는 백그라운드 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="login-sweeper", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                result = self.run_once()
+                print(f"Login sweep: {result['expired_deleted']} expired, {result['over_limit_deleted']} over session limit")
+            except Exception as e:
+                print(f"Failed to sweep logins: {e}")
+
+    def run_once(self, now: Optional[datetime] = None) -> dict:
+        """
+        만료된 Login을 삭제하고, max_sessions_per_user가 설정되어 있으면 사용자별 세션 수를 제한합니다.
+        :return: {"expired_deleted": 삭제한 만료 행 수, "over_limit_deleted": 세션 수 제한으로 삭제한 행 수}
+        """
+        if self._session_factory is None:
+            raise RuntimeError("LoginSweeper is not configured.")
+        from .login import sweep_expired_logins, cap_user_logins
+
+        if now is None:
+            now = now_korea().replace(tzinfo=None)  # Login.expires_at은 한국 시간 기준으로 저장됨
+
+        with self._lock:
+            db = self._session_factory()
+            try:
+                expired = sweep_expired_logins(db, now, self.batch_size)
+                over_limit = {"success": True, "deleted": 0}
+                if expired["success"] and self.max_sessions_per_user > 0:
+                    over_limit = cap_user_logins(db, self.max_sessions_per_user, self.batch_size)
+            finally:
+                db.close()
+
+            self._stats["runs"] += 1
+            self._stats["expired_deleted"] += expired["deleted"]
+            self._stats["over_limit_deleted"] += over_limit["deleted"]
+            self._stats["last_run_at"] = now.isoformat()
+            self._stats["last_error"] = expired.get("error") or over_limit.get("error")
+
+        if self._stats["last_error"]:
+            raise RuntimeError(self._stats["last_error"])
+        return {"expired_deleted": expired["deleted"], "over_limit_deleted": over_limit["deleted"]}
+
+    def stats(self) -> dict:
+        """누적 실행 횟수와 삭제한 행 수"""
+        with self._lock:
+            return dict(self._stats)
+
+login_sweeper = LoginSweeper()
@@ -0,0 +1,119 @@
+# models/pagination.py
+
+import threading
+import time
+from datetime import date
+from typing import Optional
+
+COUNT_MODE_ESTIMATE = "estimate"  # 캐시된 total_count 사용 (없으면 COUNT 후 캐시)
+COUNT_MODE_EXACT = "exact"        # 항상 COUNT 실행 후 캐시 갱신
+COUNT_MODE_NONE = "none"          # COUNT 생략, has_next만 반환
+COUNT_MODES = (COUNT_MODE_ESTIMATE, COUNT_MODE_EXACT, COUNT_MODE_NONE)
+
+class CountCache:
+    """
+    목록 조회 쿼리의 total_count를 캐싱하는 클래스
+
+    (namespace, 정규화된 필터) 를 키로 사용하며, 아래 경우 만료됩니다.
+    - 해당 namespace의 데이터가 변경되어 invalidate가 호출된 경우
+    - 날짜가 바뀐 경우 (마감일 기준 필터 결과가 달라지므로)
+    - ttl_seconds가 지난 경우
+    """
+    def __init__(self, ttl_seconds: float = 60, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def make_key(namespace: str, filters: Optional[dict] = None) -> tuple:
+        """필터 딕셔너리를 순서와 무관한 해시 가능한 키로 정규화합니다."""
+        normalized = []
+        for key, value in sorted((filters or {}).items()):
+            if isinstance(value, (list, tuple, set)):
+                value = tuple(sorted(value))
+            normalized.append((key, value))
+        return (namespace, tuple(normalized))
+
+    def get(self, key: tuple) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            count, created_at, created_date = entry
+            if time.monotonic() - created_at > self.ttl_seconds or created_date != date.today():
+                del self._entries[key]
+                return None
+            return count
+
+    def set(self, key: tuple, count: int):
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[key] = (count, time.monotonic(), date.today())
+
+    def invalidate(self, namespace: Optional[str] = None):
+        """namespace에 해당하는 캐시를 모두 삭제합니다. (None이면 전체 삭제)"""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[key]
+
+count_cache = CountCache()
+
+def paginate(query, page: int = 1, item_counts: int = 20, count_mode: str = COUNT_MODE_ESTIMATE, cache_key: Optional[tuple] = None):
+    """
+    쿼리에 OFFSET 페이징을 적용하고 total_count 정보를 계산합니다.
+    :param query: 정렬/필터가 적용된 SQLAlchemy Query
+    :param count_mode: estimate | exact | none
+    :param cache_key: CountCache.make_key로 만든 캐시 키 (None이면 캐시 사용 안 함)
+    :return: (조회된 항목 리스트, 페이지 정보 딕셔너리)
+    """
+    if count_mode not in COUNT_MODES:
+        raise ValueError(f"Invalid count mode: {count_mode}, Value should be one of {list(COUNT_MODES)}.")
+
+    offset = (page - 1) * item_counts
+
+    if count_mode == COUNT_MODE_NONE:
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        items = query.offset(offset).limit(item_counts + 1).all()
+        has_next = len(items) > item_counts
+        return items[:item_counts], {
+            "current_page": page,
+            "has_next": has_next,
+        }
+
+    items = query.offset(offset).limit(item_counts).all()
+
+    total_count = None
+    if count_mode == COUNT_MODE_ESTIMATE and cache_key is not None:
+        total_count = count_cache.get(cache_key)
+    if total_count is None:
+        total_count = query.order_by(None).count()
+        if cache_key is not None:
+            count_cache.set(cache_key, total_count)
+
+    return items, {
+        "total_count": total_count,
+        "current_page": page,
+        "total_page": (total_count + item_counts - 1) // item_counts,
+        "has_next": offset + len(items) < total_count,
+    }
+
+def resolve_fields(fields, available: tuple) -> tuple:
+    """
+    요청한 필드 목록(sparse fieldset)을 검증하고 available 순서로 정렬해 반환합니다.
+    :param fields: 필드 이름 리스트 또는 쉼표로 구분된 문자열 (비어 있으면 available 전체)
+    :param available: 선택할 수 있는 필드 이름 (응답의 기본 필드 순서)
+    """
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    requested = {field.strip() for field in fields or () if field.strip()}
+    if not requested:
+        return available
+    invalid = requested.difference(available)
+    if invalid:
+        raise ValueError(f"Invalid fields: {', '.join(sorted(invalid))}, Value should be in {list(available)}.")
+    return tuple(field for field in available if field in requested)
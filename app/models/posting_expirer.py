@@ -0,0 +1,88 @@
+# models/posting_expirer.py
+
+import atexit
+import threading
+from datetime import date
+from typing import Callable, Optional
+
+class PostingExpirer:
+    """
+    마감일자가 지난 채용 공고를 POSTER_STATUS_INACTIVE로 바꾸는 작업을 주기적으로 실행하는 스케줄러
+
+    CLI(flask --app run expire-postings)로 한 번 실행하거나, start()로 시작 직후와 interval_seconds(기본 하루)마다 실행합니다.
+    변경은 batch_size개씩 나누어 커밋하며, 이미 변경된 공고는 건너뛰므로 여러 노드에서 동시에 실행해도 안전합니다.
+    """
+    def __init__(self, interval_seconds: float = 86400, batch_size: int = 1000):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._session_factory = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._stats = {"runs": 0, "expired": 0, "last_run_on": None, "last_error": None}
+
+    def configure(self, session_factory: Callable, interval_seconds: Optional[float] = None, batch_size: Optional[int] = None):
+        self._session_factory = session_factory
+        if interval_seconds is not None:
+            self.interval_seconds = interval_seconds
+        if batch_size is not None:
+            self.batch_size = batch_size
+
+    def start(self):
+        """바로 한 번 실행한 뒤 interval_seconds마다 실행하는 백그라운드 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="posting-expirer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        # 주기가 길어 재시작이 잦으면 실행되지 않을 수 있으므로 시작 직후에도 한 번 실행
+        while True:
+            try:
+                result = self.run_once()
+                print(f"Posting expire: {result['expired']} expired")
+            except Exception as e:
+                print(f"Failed to expire postings: {e}")
+            if self._stop.wait(self.interval_seconds):
+                break
+
+    def run_once(self, today: Optional[date] = None) -> dict:
+        """
+        마감일자가 today 이전인 게시 상태의 공고를 POSTER_STATUS_INACTIVE로 변경합니다.
+        :return: {"expired": 변경한 공고 수}
+        """
+        if self._session_factory is None:
+            raise RuntimeError("PostingExpirer is not configured.")
+        from .job_posting import expire_job_postings
+
+        today = today or date.today()
+        with self._lock:
+            db = self._session_factory()
+            try:
+                result = expire_job_postings(db, today, self.batch_size)
+            finally:
+                db.close()
+
+            self._stats["runs"] += 1
+            self._stats["expired"] += result["expired"]
+            self._stats["last_run_on"] = today.isoformat()
+            self._stats["last_error"] = result.get("error")
+
+        if self._stats["last_error"]:
+            raise RuntimeError(self._stats["last_error"])
+        return {"expired": result["expired"]}
+
+    def stats(self) -> dict:
+        """누적 실행 횟수와 변경한 공고 수"""
+        with self._lock:
+            return dict(self._stats)
+
+posting_expirer = PostingExpirer()
@@ -0,0 +1,436 @@
+# models/posting_index.py
+
+import atexit
+import threading
+import time
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from .job_posting import JobPosting, POSTER_STATUS_EXTENDED, POSTER_STATUS_INACTIVE, CODE_MATCH_ANY
+from .job_posting_change import JobPostingChange, prune_job_posting_changes
+from .loc_code import LocCode
+from .pagination import COUNT_MODES, COUNT_MODE_NONE
+from .title_search import TitleInvertedIndex
+
+# 인덱스가 SQL과 동일한 순서로 정렬할 수 있는 컬럼
+# (poster_title은 MySQL collation 순서를 재현할 수 없으므로 SQL 경로를 사용)
+INDEX_SORTABLE_COLUMNS = ("deadline_date", "last_updated_date", "edu_code", "sal_code")
+
+# refresh에서 poster_id 목록으로 다시 읽을 때 한 번에 조회할 개수
+REFRESH_BATCH_SIZE = 1000
+
+# 늦게 커밋된 변경을 놓치지 않도록, 마지막으로 읽은 변경 시각보다 이만큼 앞부터 변경 로그를 다시 읽음
+CHANGE_LOG_OVERLAP = timedelta(seconds=60)
+
+def _bitmap_from_positions(positions, size: int) -> int:
+    """행 위치 목록을 비트맵(int)으로 변환합니다."""
+    buf = bytearray((size + 7) // 8)
+    for pos in positions:
+        buf[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(buf, "little")
+
+def _or_all(bitmaps) -> int:
+    result = 0
+    for bitmap in bitmaps:
+        result |= bitmap
+    return result
+
+def _range_bitmap(value_bitmaps: dict, low=None, high=None) -> int:
+    """값별 비트맵에서 low <= 값 <= high 범위에 해당하는 비트맵의 합집합을 구합니다."""
+    return _or_all(
+        bitmap for value, bitmap in value_bitmaps.items()
+        if (low is None or value >= low) and (high is None or value <= high)
+    )
+
+def _date_ordinal(value: str) -> int:
+    return datetime.strptime(value, "%Y-%m-%d").date().toordinal()
+
+class AvailablePostingIndex:
+    """
+    채용 공고 목록 조회(get_available_job_postings)를 DB 조회 없이 처리하기 위한 프로세스 내 검색 인덱스
+
+    - 정렬용 컬럼(sal_code, edu_code, deadline/last_updated 서수, comp_id)은 array 기반 컬럼으로 저장합니다.
+    - 필터용으로 값별 비트맵(int)과 loc_codes/job_codes 별 포스팅 비트맵을 저장하며, 필터 조합은 비트 연산으로 계산합니다.
+    - 마감 여부는 조회 시점의 날짜로 계산하므로 날짜가 바뀌어도 다시 적재할 필요가 없습니다.
+    - 결과는 SQL 경로(get_available_job_postings)와 동일한 정렬 순서(정렬 컬럼 + poster_id)와 응답 형태를 가집니다.
+    - 다른 프로세스의 변경은 start()로 시작한 백그라운드 스레드가 refresh_interval_seconds마다 변경 로그(JobPostingChange)를 읽어 반영합니다.
+    """
+    def __init__(self, refresh_interval_seconds: float = 30, change_retention_seconds: float = 86400):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.change_retention_seconds = change_retention_seconds
+        self._session_factory = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.RLock()
+        self._records = {}  # poster_id -> (brief_dict, poster_title, sal_code, edu_code, deadline ordinal, last_updated ordinal, comp_id, poster_status, job_codes, loc_codes)
+        self._version = 0  # 레코드가 바뀔 때마다 증가
+        self._snapshot_version = -1  # _snapshot을 만든 시점의 _version
+        self._build_lock = threading.Lock()
+        self._loaded = False
+        self._changes_since: Optional[datetime] = None  # 다음 refresh에서 이 시각 이후의 변경 로그를 읽음
+        self._last_change_at: Optional[datetime] = None  # 마지막으로 읽은 변경 로그의 시각 (DB 시각)
+        self._last_refreshed_at = 0.0
+        self._snapshot = None
+        self._loc_parents = {}  # loc_code -> loc_mcode
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @staticmethod
+    def _to_record(posting: JobPosting) -> tuple:
+        return (
+            posting.to_brief_dict(),
+            posting.poster_title,
+            posting.sal_code,
+            posting.edu_code,
+            posting.deadline_date.toordinal(),
+            posting.last_updated_date.toordinal(),
+            posting.comp_id,
+            posting.poster_status,
+            tuple(int(code) for code in (posting.job_codes or [])),
+            tuple(int(code) for code in (posting.loc_codes or [])),
+        )
+
+    def load(self, db: Session):
+        """JobPosting 전체를 읽어 인덱스를 새로 생성합니다."""
+        # 공고를 읽는 동안 기록된 변경도 다음 refresh에서 읽도록 변경 로그 시각을 먼저 확인
+        last_change_at = db.query(func.max(JobPostingChange.changed_at)).scalar()
+        postings = db.query(JobPosting).all()
+        records = {posting.poster_id: self._to_record(posting) for posting in postings}
+        loc_parents = dict(db.query(LocCode.loc_code, LocCode.loc_mcode).all())
+        with self._lock:
+            self._records = records
+            self._loc_parents = loc_parents
+            self._last_change_at = last_change_at
+            self._changes_since = last_change_at - CHANGE_LOG_OVERLAP if last_change_at else None
+            self._version += 1
+            self._loaded = True
+            self._last_refreshed_at = time.monotonic()
+
+    def refresh(self, db: Session):
+        """
+        다른 프로세스에서 변경된 공고를 반영합니다.
+        변경 로그(JobPostingChange)에서 마지막으로 읽은 시각 이후에 기록된 poster_id만 다시 읽고,
+        JobPosting에 없는 공고(삭제)는 인덱스에서 제거합니다.
+        실제로 달라진 레코드가 있을 때만 다음 조회에서 스냅샷을 다시 생성합니다.
+        오래된 변경 로그는 정리되므로, change_retention_seconds 동안 refresh하지 못했으면 전체를 다시 적재합니다.
+        """
+        if not self._loaded or time.monotonic() - self._last_refreshed_at > self.change_retention_seconds:
+            return self.load(db)
+
+        query = db.query(JobPostingChange.poster_id, JobPostingChange.changed_at)
+        if self._changes_since is not None:
+            query = query.filter(JobPostingChange.changed_at >= self._changes_since)
+        changes = query.all()
+
+        poster_ids = sorted({change.poster_id for change in changes})
+        postings = {}
+        for start in range(0, len(poster_ids), REFRESH_BATCH_SIZE):
+            for posting in db.query(JobPosting).filter(JobPosting.poster_id.in_(poster_ids[start:start + REFRESH_BATCH_SIZE])):
+                postings[posting.poster_id] = posting
+
+        with self._lock:
+            changed = False
+            for poster_id in poster_ids:
+                posting = postings.get(poster_id)
+                if posting is None:
+                    changed |= self._records.pop(poster_id, None) is not None
+                    continue
+                record = self._to_record(posting)
+                if self._records.get(poster_id) != record:
+                    self._records[poster_id] = record
+                    changed = True
+            if changes:
+                last_change_at = max(change.changed_at for change in changes)
+                if self._last_change_at is None or last_change_at > self._last_change_at:
+                    self._last_change_at = last_change_at
+                    self._changes_since = last_change_at - CHANGE_LOG_OVERLAP
+            if changed:
+                self._version += 1
+            self._last_refreshed_at = time.monotonic()
+
+    def configure(self, session_factory: Callable, refresh_interval_seconds: Optional[float] = None, change_retention_seconds: Optional[float] = None):
+        self._session_factory = session_factory
+        if refresh_interval_seconds is not None:
+            self.refresh_interval_seconds = refresh_interval_seconds
+        if change_retention_seconds is not None:
+            self.change_retention_seconds = change_retention_seconds
+
+    def start(self):
+        """refresh_interval_seconds마다 변경분을 반영하는 백그라운드 스레드를 시작합니다. (요청 처리 중에는 refresh하지 않음)"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="posting-index-refresher", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_interval_seconds):
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"Failed to refresh posting index: {e}")
+
+    def run_once(self):
+        """변경분을 반영하고, change_retention_seconds보다 오래된 변경 로그를 정리합니다."""
+        if self._session_factory is None:
+            raise RuntimeError("AvailablePostingIndex is not configured.")
+        db = self._session_factory()
+        try:
+            self.refresh(db)
+            # 이미 반영한 변경 중 보존 기간이 지난 로그만 삭제 (DB 시각 기준으로 비교)
+            if self._last_change_at is not None:
+                result = prune_job_posting_changes(db, self._last_change_at - timedelta(seconds=self.change_retention_seconds))
+                if not result["success"]:
+                    raise RuntimeError(result["error"])
+        finally:
+            db.close()
+
+    def upsert(self, posting: JobPosting):
+        with self._lock:
+            if not self._loaded:
+                return
+            self._records[posting.poster_id] = self._to_record(posting)
+            self._version += 1
+
+    def remove(self, poster_id: str):
+        with self._lock:
+            if self._loaded and self._records.pop(poster_id, None) is not None:
+                self._version += 1
+
+    def clear(self):
+        with self._lock:
+            self._records = {}
+            self._snapshot = None
+            self._version += 1
+            self._loaded = False
+            self._changes_since = None
+            self._last_change_at = None
+
+    def _build_snapshot(self, records_by_id: dict, loc_parents: dict) -> dict:
+        """레코드로부터 컬럼 배열, 비트맵, 정렬 순서를 생성합니다."""
+        poster_ids = sorted(records_by_id)
+        size = len(poster_ids)
+        records = [records_by_id[poster_id] for poster_id in poster_ids]
+
+        columns = {
+            "sal_code": array("i", (r[2] for r in records)),
+            "edu_code": array("i", (r[3] for r in records)),
+            "deadline_date": array("i", (r[4] for r in records)),
+            "last_updated_date": array("i", (r[5] for r in records)),
+            "comp_id": array("i", (r[6] for r in records)),
+        }
+
+        def value_bitmaps(values) -> dict:
+            positions = {}
+            for pos, value in enumerate(values):
+                positions.setdefault(value, []).append(pos)
+            return {value: _bitmap_from_positions(pos_list, size) for value, pos_list in positions.items()}
+
+        def posting_bitmaps(index: int) -> dict:
+            positions = {}
+            for pos, record in enumerate(records):
+                for code in set(record[index]):
+                    positions.setdefault(code, []).append(pos)
+            return {code: _bitmap_from_positions(pos_list, size) for code, pos_list in positions.items()}
+
+        title_index = TitleInvertedIndex()
+        title_index.build((poster_id, record[1]) for poster_id, record in zip(poster_ids, records))
+
+        # 1차 지역(loc_mcode)별 비트맵: 하위 loc_code 비트맵의 합집합
+        loc_bitmaps = posting_bitmaps(9)
+        loc_mcode_bitmaps = {}
+        for code, bitmap in loc_bitmaps.items():
+            if code in loc_parents:
+                mcode = loc_parents[code]
+                loc_mcode_bitmaps[mcode] = loc_mcode_bitmaps.get(mcode, 0) | bitmap
+
+        # poster_id 순으로 정렬된 위치에 대해 안정 정렬하므로, 동률은 poster_id 오름차순이 됨
+        orders = {name: sorted(range(size), key=columns[name].__getitem__) for name in INDEX_SORTABLE_COLUMNS}
+
+        return {
+            "size": size,
+            "poster_ids": poster_ids,
+            "position_of": {poster_id: pos for pos, poster_id in enumerate(poster_ids)},
+            "briefs": [record[0] for record in records],
+            "columns": columns,
+            "value_bitmaps": {name: value_bitmaps(column) for name, column in columns.items()},
+            "status_bitmaps": value_bitmaps([record[7] for record in records]),
+            "job_bitmaps": posting_bitmaps(8),
+            "loc_bitmaps": loc_bitmaps,
+            "loc_mcode_bitmaps": loc_mcode_bitmaps,
+            "title_index": title_index,
+            "orders": orders,
+        }
+
+    def _get_snapshot(self) -> dict:
+        """
+        최신 스냅샷을 반환합니다. 레코드가 바뀌었으면 잠금 밖에서 새로 생성하며,
+        다른 스레드가 생성 중이면 기다리지 않고 이전 스냅샷을 반환합니다.
+        """
+        with self._lock:
+            if self._snapshot is not None and self._snapshot_version == self._version:
+                return self._snapshot
+            previous = self._snapshot
+
+        if previous is not None and not self._build_lock.acquire(blocking=False):
+            return previous
+        if previous is None:
+            self._build_lock.acquire()
+        try:
+            with self._lock:
+                if self._snapshot is not None and self._snapshot_version == self._version:
+                    return self._snapshot
+                version = self._version
+                records = dict(self._records)
+                loc_parents = self._loc_parents
+            snapshot = self._build_snapshot(records, loc_parents)
+            with self._lock:
+                if version > self._snapshot_version:
+                    self._snapshot = snapshot
+                    self._snapshot_version = version
+            return snapshot
+        finally:
+            self._build_lock.release()
+
+    def can_answer(self, filters: Optional[dict], sort_criteria: dict) -> bool:
+        """인덱스로 SQL 경로와 동일한 결과를 만들 수 있는 요청인지 확인합니다."""
+        return self._loaded and len(sort_criteria) == 1 and next(iter(sort_criteria)) in INDEX_SORTABLE_COLUMNS
+
+    def _filter_bitmap(self, snapshot: dict, filters: Optional[dict]) -> int:
+        size = snapshot["size"]
+        value_bitmaps = snapshot["value_bitmaps"]
+        status_bitmaps = snapshot["status_bitmaps"]
+
+        # 마감일자가 지나지 않았거나, 무기한 연장된 공고
+        today = date.today().toordinal()
+        active = _or_all(bitmap for status, bitmap in status_bitmaps.items() if status < POSTER_STATUS_INACTIVE)
+        result = active & (status_bitmaps.get(POSTER_STATUS_EXTENDED, 0) | _range_bitmap(value_bitmaps["deadline_date"], low=today))
+
+        filters = filters or {}
+        for key, value in filters.items():
+            if key == "title_contains":
+                positions = snapshot["position_of"]
+                result &= _bitmap_from_positions((positions[pid] for pid in snapshot["title_index"].search(value)), size)
+            elif key == "comp_id":
+                result &= value_bitmaps["comp_id"].get(value, 0)
+            elif key in ("sal_code_eq", "edu_code_eq"):
+                result &= value_bitmaps[key[:-3]].get(value, 0)
+            elif key in ("sal_code_gte", "edu_code_gte"):
+                result &= _range_bitmap(value_bitmaps[key[:-4]], low=value)
+            elif key in ("sal_code_lte", "edu_code_lte"):
+                result &= _range_bitmap(value_bitmaps[key[:-4]], high=value)
+            elif key == "deadline_date_eq":
+                result &= value_bitmaps["deadline_date"].get(_date_ordinal(value), 0)
+            elif key == "deadline_date_gte":
+                result &= _range_bitmap(value_bitmaps["deadline_date"], low=_date_ordinal(value))
+            elif key == "deadline_date_lte":
+                result &= _range_bitmap(value_bitmaps["deadline_date"], high=_date_ordinal(value))
+            elif key in ("loc_codes", "job_codes"):
+                bitmaps = snapshot["loc_bitmaps" if key == "loc_codes" else "job_bitmaps"]
+                codes = value if isinstance(value, (list, tuple, set)) else [value]
+                if filters.get(f"{key}_match", CODE_MATCH_ANY) == CODE_MATCH_ANY:
+                    result &= _or_all(bitmaps.get(code, 0) for code in codes)
+                else:
+                    for code in codes:
+                        result &= bitmaps.get(code, 0)
+        return result
+
+    def search(self, page: int = 1, item_counts: int = 20, filters: dict = None, sort_criteria: dict = {"deadline_date": {"sorting_method": 0}}, count_mode: str = COUNT_MODES[0], fields: Optional[tuple] = None) -> dict:
+        """
+        get_available_job_postings와 동일한 형태의 결과를 인덱스에서 조회합니다.
+        :param fields: 응답에 포함할 필드 (None이면 전체)
+        :return: {"success": bool, "data": dict} 또는 {"success": False, "message": str}
+        """
+        try:
+            if count_mode not in COUNT_MODES:
+                raise ValueError(f"Invalid count mode: {count_mode}, Value should be one of {list(COUNT_MODES)}.")
+            column_name, sort_info = next(iter(sort_criteria.items()))
+            if column_name not in INDEX_SORTABLE_COLUMNS:
+                raise ValueError(f"Invalid column name: {column_name}")
+            sorting_method = sort_info.get('sorting_method', 0)
+            if sorting_method not in (0, 1):
+                raise ValueError(f"Invalid sorting method for column: {column_name}, Value should be 0 or 1.")
+
+            snapshot = self._get_snapshot()
+            bitmap = self._filter_bitmap(snapshot, filters)
+            matched = bitmap.to_bytes((snapshot["size"] + 7) // 8, "little")
+
+            order = snapshot["orders"][column_name]
+            if sorting_method == 1:
+                order = reversed(order)
+
+            offset = (page - 1) * item_counts
+            page_positions = []
+            seen = 0
+            for pos in order:
+                if matched[pos >> 3] >> (pos & 7) & 1:
+                    if seen >= offset:
+                        page_positions.append(pos)
+                        if len(page_positions) > item_counts:
+                            break
+                    seen += 1
+
+            has_next = len(page_positions) > item_counts
+            briefs = snapshot["briefs"]
+            if fields:
+                data = {"postings": [{name: briefs[pos][name] for name in fields} for pos in page_positions[:item_counts]]}
+            else:
+                data = {"postings": [dict(briefs[pos]) for pos in page_positions[:item_counts]]}
+            if count_mode == COUNT_MODE_NONE:
+                data.update({"current_page": page, "has_next": has_next})
+            else:
+                total_count = bitmap.bit_count()
+                data.update({
+                    "total_count": total_count,
+                    "current_page": page,
+                    "total_page": (total_count + item_counts - 1) // item_counts,
+                    "has_next": has_next,
+                })
+            return {"success": True, "data": data}
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
+        except Exception as e:
+            return {"success": False, "message": str(e)}
+
+    def facets(self, filters: dict = None) -> dict:
+        """
+        get_available_job_posting_facets와 동일한 형태의 facet별 개수를 인덱스에서 계산합니다.
+        필터 결과 비트맵과 각 값의 비트맵의 교집합 크기(bit_count)로 개수를 구합니다.
+        """
+        try:
+            snapshot = self._get_snapshot()
+            bitmap = self._filter_bitmap(snapshot, filters)
+
+            def histogram(name: str, value_bitmaps: dict) -> list:
+                counts = ((value, (value_bitmap & bitmap).bit_count()) for value, value_bitmap in value_bitmaps.items())
+                return [{name: value, "count": count} for value, count in sorted(counts, key=lambda row: (row[0] is None, row[0] or 0)) if count]
+
+            data = {
+                "total_count": bitmap.bit_count(),
+                "facets": {
+                    "sal_code": histogram("sal_code", snapshot["value_bitmaps"]["sal_code"]),
+                    "edu_code": histogram("edu_code", snapshot["value_bitmaps"]["edu_code"]),
+                    "loc_mcode": histogram("loc_mcode", snapshot["loc_mcode_bitmaps"]),
+                    "job_code": histogram("job_code", snapshot["job_bitmaps"]),
+                },
+            }
+            return {"success": True, "data": data}
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
+        except Exception as e:
+            return {"success": False, "message": str(e)}
+
+posting_index = AvailablePostingIndex()
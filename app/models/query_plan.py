@@ -0,0 +1,62 @@
+# models/query_plan.py
+
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from .job_posting import JobPosting, available_job_posting_condition, _apply_ordering, POSTER_STATUS_ACTIVE
+from .user_applicated import UserApplicated
+from .user_applicated_log import UserApplicatedLog
+from .user_bookmark import UserBookmark
+from .login import Login
+from .login_log import LoginLog
+
+# 실행 계획 확인에 사용할 예시 값 (존재하지 않아도 실행 계획은 같음)
+SAMPLE_USER_ID = "query_plan_check"
+SAMPLE_POSTER_ID = "query_plan_check"
+JOB_POSTING_SORT_COLUMNS = ("deadline_date", "last_updated_date", "edu_code", "sal_code", "poster_title")
+
+def get_main_queries(db: Session, today: Optional[date] = None) -> dict:
+    """
+    서비스의 주요 조회 쿼리를 실제 조회 함수와 같은 조건으로 생성합니다.
+    :return: {쿼리 이름: Query}
+    """
+    today = today or date.today()
+    queries = {}
+    for column_name in JOB_POSTING_SORT_COLUMNS:
+        for sorting_method, order in ((0, "asc"), (1, "desc")):
+            query = db.query(JobPosting.poster_id).filter(available_job_posting_condition(today))
+            queries[f"job_postings_sorted_by_{column_name}_{order}"] = _apply_ordering(query, {column_name: {"sorting_method": sorting_method}}).limit(20)
+    queries["job_postings_count"] = db.query(JobPosting.poster_id).filter(available_job_posting_condition(today))
+    queries["job_posting_by_id"] = db.query(JobPosting).filter(JobPosting.poster_id == SAMPLE_POSTER_ID)
+    queries["expired_job_postings"] = db.query(JobPosting.poster_id).filter(JobPosting.poster_status == POSTER_STATUS_ACTIVE, JobPosting.deadline_date < today).limit(1000)
+    queries["user_applications"] = db.query(UserApplicated).filter(UserApplicated.user_id == SAMPLE_USER_ID).limit(20)
+    queries["user_application_by_poster"] = db.query(UserApplicated).filter(UserApplicated.user_id == SAMPLE_USER_ID, UserApplicated.poster_id == SAMPLE_POSTER_ID)
+    queries["user_applicated_logs"] = db.query(UserApplicatedLog).filter(UserApplicatedLog.user_id == SAMPLE_USER_ID).order_by(UserApplicatedLog.applicated_at.desc()).limit(20)
+    queries["user_bookmarks"] = db.query(UserBookmark).filter(UserBookmark.user_id == SAMPLE_USER_ID).limit(20)
+    queries["login_by_refresh_jti"] = db.query(Login).filter(Login.refresh_jti == SAMPLE_USER_ID)
+    queries["expired_logins"] = db.query(Login.refresh_id, Login.refresh_jti).filter(Login.expires_at <= datetime.combine(today, datetime.min.time())).order_by(Login.expires_at).limit(1000)
+    queries["login_logs_by_login_id"] = db.query(LoginLog).filter(LoginLog.login_id == SAMPLE_USER_ID).order_by(LoginLog.login_date.desc()).limit(20)
+    return queries
+
+def explain_query(db: Session, query) -> list:
+    """MySQL EXPLAIN 결과를 행마다 딕셔너리로 반환합니다."""
+    sql = str(query.statement.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}))
+    result = db.connection().exec_driver_sql("EXPLAIN " + sql)
+    return [dict(row._mapping) for row in result]
+
+def check_query_plans(db: Session) -> dict:
+    """
+    주요 조회 쿼리의 실행 계획을 확인해 인덱스 없이 테이블 전체를 읽는(type=ALL) 쿼리를 찾습니다. (MySQL 전용)
+    :return: {"success": 모두 인덱스를 사용하면 True, "plans": {쿼리 이름: EXPLAIN 결과}, "full_scans": [쿼리 이름]}
+    """
+    if db.get_bind().dialect.name != "mysql":
+        return {"success": False, "plans": {}, "full_scans": [], "error": "Query plan check requires MySQL."}
+    plans = {}
+    full_scans = []
+    for name, query in get_main_queries(db).items():
+        plans[name] = explain_query(db, query)
+        if any(row.get("type") == "ALL" for row in plans[name]):
+            full_scans.append(name)
+    return {"success": not full_scans, "plans": plans, "full_scans": full_scans}
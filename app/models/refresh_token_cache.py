@@ -0,0 +1,125 @@
+# models/refresh_token_cache.py
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+REFRESH_TOKEN_CACHE_BACKEND_MEMORY = "memory"
+REFRESH_TOKEN_CACHE_BACKEND_REDIS = "redis"
+REFRESH_TOKEN_CACHE_BACKENDS = (REFRESH_TOKEN_CACHE_BACKEND_MEMORY, REFRESH_TOKEN_CACHE_BACKEND_REDIS)
+
+# 폐기되었거나 존재하지 않는 jti를 나타내는 캐시 값
+REVOKED = (None, 0.0)
+
+class MemoryRefreshTokenStore:
+    """프로세스 메모리에 jti -> (user_id, 만료 시각) 을 최대 max_entries개까지 보관합니다. (LRU)"""
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # jti -> (캐시 만료 시각(monotonic), user_id, 토큰 만료 시각(epoch))
+
+    def get(self, jti: str) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[jti]
+                return None
+            self._entries.move_to_end(jti)
+            return entry[1], entry[2]
+
+    def set(self, jti: str, value: tuple, ttl_seconds: float):
+        with self._lock:
+            self._entries[jti] = (time.monotonic() + ttl_seconds, value[0], value[1])
+            self._entries.move_to_end(jti)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class RedisRefreshTokenStore:
+    """
+    Redis에 jti -> (user_id, 만료 시각) 을 TTL과 함께 저장합니다.
+    여러 프로세스(노드)가 같은 키를 공유하므로, 로그아웃이 모든 프로세스에 즉시 반영됩니다.
+    """
+    KEY_PREFIX = "refresh_jti:"
+
+    def __init__(self, host: str, port: int, password: Optional[str] = None):
+        import redis  # 선택 의존성: redis 백엔드를 사용할 때만 필요
+        self._client = redis.Redis(host=host, port=port, password=password or None, decode_responses=True)
+
+    def get(self, jti: str) -> Optional[tuple]:
+        value = self._client.get(self.KEY_PREFIX + jti)
+        if value is None:
+            return None
+        user_id, expires_at = json.loads(value)
+        return user_id, expires_at
+
+    def set(self, jti: str, value: tuple, ttl_seconds: float):
+        self._client.set(self.KEY_PREFIX + jti, json.dumps(list(value)), ex=max(1, int(ttl_seconds)))
+
+    def clear(self):
+        keys = list(self._client.scan_iter(self.KEY_PREFIX + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+class RefreshTokenCache:
+    """
+    refresh token의 폐기 여부를 확인할 때 Login 테이블 조회를 줄이기 위한 캐시
+
+    jti마다 (user_id, 만료 시각) 또는 폐기(REVOKED) 여부를 ttl_seconds 동안 보관합니다.
+    로그인/로그아웃 시 이 프로세스의 캐시(redis인 경우 공유 캐시)는 바로 갱신되며,
+    memory 백엔드에서 다른 프로세스의 로그아웃은 최대 ttl_seconds 후에 반영됩니다.
+    """
+    def __init__(self, ttl_seconds: float = 30, max_entries: int = 100000):
+        self.ttl_seconds = ttl_seconds
+        self._store = MemoryRefreshTokenStore(max_entries)
+
+    def configure(self, backend: str = REFRESH_TOKEN_CACHE_BACKEND_MEMORY, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None, redis_options: Optional[dict] = None):
+        """
+        저장소와 캐시 유지 시간(폐기가 다른 프로세스에 반영되기까지 걸리는 최대 시간)을 설정합니다.
+        :param backend: memory | redis
+        :param redis_options: RedisRefreshTokenStore 생성 인자 (host, port, password)
+        """
+        if backend not in REFRESH_TOKEN_CACHE_BACKENDS:
+            raise ValueError(f"Invalid refresh token cache backend: {backend}, Value should be one of {list(REFRESH_TOKEN_CACHE_BACKENDS)}.")
+        if backend == REFRESH_TOKEN_CACHE_BACKEND_REDIS:
+            self._store = RedisRefreshTokenStore(**(redis_options or {}))
+        elif max_entries is not None:
+            self._store = MemoryRefreshTokenStore(max_entries)
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds
+
+    def lookup(self, jti: str, loader: Callable[[], Optional[tuple]]) -> tuple:
+        """
+        jti의 (user_id, 만료 시각(epoch))을 반환합니다. 폐기되었거나 없으면 REVOKED를 반환합니다.
+        캐시에 없으면 loader()로 DB를 조회해 (user_id, 만료 시각) 또는 None을 받아 캐시합니다.
+        """
+        if self.ttl_seconds <= 0:
+            return loader() or REVOKED
+        cached = self._store.get(jti)
+        if cached is not None:
+            return cached
+        value = loader() or REVOKED
+        self._store.set(jti, value, self.ttl_seconds)
+        return value
+
+    def add(self, jti: str, user_id: str, expires_at: float):
+        """로그인으로 새 refresh token이 저장되었음을 기록합니다."""
+        if jti and self.ttl_seconds > 0:
+            self._store.set(jti, (user_id, expires_at), self.ttl_seconds)
+
+    def revoke(self, jti: str):
+        """로그아웃 등으로 refresh token이 삭제되었음을 기록합니다."""
+        if jti and self.ttl_seconds > 0:
+            self._store.set(jti, REVOKED, self.ttl_seconds)
+
+    def clear(self):
+        self._store.clear()
+
+refresh_token_cache = RefreshTokenCache()
@@ -5,6 +5,8 @@ from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import Session
 
 from . import Base
+from .pagination import count_cache, paginate, COUNT_MODE_ESTIMATE
+from .code_cache import code_table_cache
 
 class SalCode(Base):
     """
@@ -21,19 +23,16 @@ class SalCode(Base):
             "sal_name": self.sal_name
         }
 
-def get_sal_codes(db: Session, page: int = 1, item_counts: int = 20) -> dict:
+def get_sal_codes(db: Session, page: int = 1, item_counts: int = 20, count_mode: str = COUNT_MODE_ESTIMATE) -> dict:
     """
     SalCode 목록을 조회하는 함수 (Pagination 적용)
     """
     try:
-        offset = (page - 1) * item_counts
-        sal_codes = db.query(SalCode).offset(offset).limit(item_counts).all()
-        total_count = db.query(SalCode).count()
+        query = db.query(SalCode).order_by(SalCode.sal_code)
+        sal_codes, page_info = paginate(query, page, item_counts, count_mode, count_cache.make_key(SalCode.__tablename__))
         data = {
             "sal_codes": [sal_code.to_dict() for sal_code in sal_codes],
-            "total_count": total_count,
-            "current_page": page,
-            "total_page": (total_count + item_counts - 1) // item_counts
+            **page_info,
         }
         return {
             "success": True,
@@ -54,6 +53,8 @@ def create_sal_code(db: Session, sal_code: int, sal_name: str) -> dict:
         new_sal_code = SalCode(sal_code=sal_code, sal_name=sal_name)
         db.add(new_sal_code)
         db.commit()
+        count_cache.invalidate(SalCode.__tablename__)
+        code_table_cache.invalidate()
         db.refresh(new_sal_code)
         return {"success": True, "sal_code": new_sal_code.to_dict()}
     except Exception as e:
@@ -79,6 +80,7 @@ def update_sal_code(db: Session, sal_code_id: int, new_sal_name: str) -> dict: #
         try:
             sal_code.sal_name = new_sal_name
             db.commit()
+            code_table_cache.invalidate()
             return {"success": True, "sal_code": sal_code.to_dict()}
         except Exception as e:
             db.rollback()
@@ -95,6 +97,8 @@ def delete_sal_code(db: Session, sal_code_id: int) -> dict: #인자 이름 수
         try:
             db.delete(sal_code)
             db.commit()
+            count_cache.invalidate(SalCode.__tablename__)
+            code_table_cache.invalidate()
             return {"success": True}
         except Exception as e:
             db.rollback()
@@ -0,0 +1,160 @@
+# models/title_search.py
+
+import threading
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy.dialects.mysql import match
+
+TITLE_SEARCH_LIKE = "like"          # poster_title ILIKE '%keyword%' (인덱스 사용 불가, 전체 스캔)
+TITLE_SEARCH_FULLTEXT = "fulltext"  # MySQL FULLTEXT INDEX (ngram parser) + MATCH ... AGAINST
+TITLE_SEARCH_INVERTED = "inverted"  # 프로세스 내 bigram 역색인 (SQLite/테스트 환경용)
+TITLE_SEARCH_STRATEGIES = (TITLE_SEARCH_LIKE, TITLE_SEARCH_FULLTEXT, TITLE_SEARCH_INVERTED)
+
+# MySQL ngram parser의 기본 ngram_token_size와 동일하게 맞춤
+NGRAM_SIZE = 2
+
+# configure_title_search로 설정 (create_app에서 Config의 TITLE_SEARCH_* 값으로 호출)
+_title_search_strategy = ""  # 비어 있으면 DB 종류로 결정
+_relevance_max_candidates = 1000  # like/inverted 전략의 관련도 정렬에서 점수를 계산할 최대 검색 결과 수
+
+def _normalize(s: str) -> str:
+    return s.lower()
+
+def _ngrams(s: str) -> set:
+    """공백을 제외한 문자열에서 NGRAM_SIZE 길이의 토큰 집합을 생성합니다."""
+    compact = "".join(_normalize(s).split())
+    return {compact[i:i + NGRAM_SIZE] for i in range(len(compact) - NGRAM_SIZE + 1)}
+
+def configure_title_search(strategy: str = "", relevance_max_candidates: Optional[int] = None):
+    """
+    제목 검색 설정을 변경합니다.
+    :param strategy: like, fulltext, inverted 중 하나 (비어 있으면 DB 종류로 결정)
+    :param relevance_max_candidates: like/inverted 전략의 관련도 정렬에서 점수를 계산할 최대 검색 결과 수
+    """
+    global _title_search_strategy, _relevance_max_candidates
+    if strategy and strategy not in TITLE_SEARCH_STRATEGIES:
+        raise ValueError(f"Invalid title search strategy: {strategy}, Value should be one of {list(TITLE_SEARCH_STRATEGIES)}.")
+    if relevance_max_candidates is not None and relevance_max_candidates < 1:
+        raise ValueError(f"Invalid relevance max candidates: {relevance_max_candidates}, Value should be at least 1.")
+    _title_search_strategy = strategy
+    if relevance_max_candidates is not None:
+        _relevance_max_candidates = relevance_max_candidates
+
+def get_relevance_max_candidates() -> int:
+    return _relevance_max_candidates
+
+def resolve_title_search_strategy(dialect_name: str) -> str:
+    """
+    configure_title_search로 설정한 전략이 있으면 이를 사용하고,
+    없으면 MySQL은 fulltext, 그 외(SQLite 등)는 inverted 전략을 사용합니다.
+    """
+    if _title_search_strategy:
+        return _title_search_strategy
+    return TITLE_SEARCH_FULLTEXT if dialect_name == "mysql" else TITLE_SEARCH_INVERTED
+
+def title_relevance_score(title: str, keyword: str) -> tuple:
+    """
+    inverted/like 전략에서 사용하는 관련도 점수 (클수록 관련도가 높음)
+    등장 횟수가 많을수록, 처음 등장 위치가 앞일수록, 제목이 짧을수록 높은 점수를 받습니다.
+    """
+    title_norm = _normalize(title)
+    keyword_norm = _normalize(keyword)
+    return (title_norm.count(keyword_norm), -title_norm.find(keyword_norm), -len(title_norm))
+
+def fulltext_match_expression(column, keyword: str):
+    """
+    MATCH(column) AGAINST('"keyword"' IN BOOLEAN MODE) 표현식을 생성합니다. (MySQL 전용)
+    ngram parser에서 구문 검색(" ")은 연속된 ngram을 찾으므로 부분 문자열 검색과 유사하게 동작하며, 반환값은 관련도 점수로 정렬에도 사용됩니다.
+    """
+    phrase = '"' + keyword.replace('"', " ") + '"'
+    return match(column, against=phrase).in_boolean_mode()
+
+class TitleInvertedIndex:
+    """
+    poster_title에 대한 프로세스 내 bigram 역색인
+
+    후보 poster_id를 bigram 교집합으로 좁힌 뒤 부분 문자열 검사를 수행하므로,
+    결과는 ILIKE '%keyword%' 와 동일합니다.
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._titles = {}    # poster_id -> poster_title
+        self._postings = {}  # ngram -> set(poster_id)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def build(self, rows: Iterable[tuple]):
+        """(poster_id, poster_title) 목록으로 색인을 새로 생성합니다."""
+        titles = {}
+        postings = {}
+        for poster_id, title in rows:
+            titles[poster_id] = title
+            for gram in _ngrams(title):
+                postings.setdefault(gram, set()).add(poster_id)
+        with self._lock:
+            self._titles = titles
+            self._postings = postings
+            self._loaded = True
+
+    def ensure_loaded(self, loader: Callable[[], Iterable[tuple]]):
+        """색인이 비어 있으면 loader를 호출해 (poster_id, poster_title) 목록으로 생성합니다."""
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self.build(loader())
+
+    def upsert(self, poster_id: str, title: str):
+        with self._lock:
+            if not self._loaded:
+                return
+            self._remove_locked(poster_id)
+            self._titles[poster_id] = title
+            for gram in _ngrams(title):
+                self._postings.setdefault(gram, set()).add(poster_id)
+
+    def remove(self, poster_id: str):
+        with self._lock:
+            if self._loaded:
+                self._remove_locked(poster_id)
+
+    def _remove_locked(self, poster_id: str):
+        title = self._titles.pop(poster_id, None)
+        if title is None:
+            return
+        for gram in _ngrams(title):
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(poster_id)
+                if not ids:
+                    del self._postings[gram]
+
+    def search(self, keyword: str) -> set:
+        """keyword를 포함하는 poster_id 집합을 반환합니다."""
+        keyword_norm = _normalize(keyword)
+        with self._lock:
+            grams = _ngrams(keyword)
+            if grams:
+                candidates = None
+                for gram in sorted(grams, key=lambda g: len(self._postings.get(g, ()))):
+                    ids = self._postings.get(gram)
+                    if not ids:
+                        return set()
+                    candidates = set(ids) if candidates is None else candidates & ids
+                    if not candidates:
+                        return set()
+            else:
+                # bigram을 만들 수 없는 1글자 검색어는 전체 제목 검사
+                candidates = self._titles.keys()
+            return {pid for pid in candidates if keyword_norm in _normalize(self._titles[pid])}
+
+    def clear(self):
+        with self._lock:
+            self._titles = {}
+            self._postings = {}
+            self._loaded = False
+
+title_index = TitleInvertedIndex()
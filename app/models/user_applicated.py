@@ -1,11 +1,14 @@
 # models/user_applicated.py
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, UniqueConstraint
 from sqlalchemy.orm import declarative_base, relationship, Session
 from sqlalchemy import and_
+from sqlalchemy.exc import IntegrityError
 import enum
 
 from . import Base
+from .pagination import count_cache, paginate, COUNT_MODE_ESTIMATE
+from .user_applicated_log import UserApplicatedLog, ApplicateAction
 
 class ApplicationStatus(enum.IntEnum):
     APPLIED = 0     # 지원
@@ -16,6 +19,10 @@ class ApplicationStatus(enum.IntEnum):
 class UserApplicated(Base):
     """UserApplicated 테이블에 대한 SQLAlchemy 모델 클래스"""
     __tablename__ = "UserApplicated"
+    __table_args__ = (
+        # 사용자는 공고 하나에 한 번만 지원 가능 (중복 지원은 INSERT 시 충돌로 확인)
+        UniqueConstraint("user_id", "poster_id", name="uq_user_applicated_user_poster"),
+    )
 
     application_id = Column(Integer, primary_key=True, autoincrement=True, nullable=False)
     user_id = Column(String(255), ForeignKey("User.user_id"), nullable=False)
@@ -49,16 +56,20 @@ def get_user_applicateds(db: Session, page: int = 1, item_counts: int = 20) -> d
         "data": data
     }
 
-def get_user_applications_by_user_id(db: Session, user_id: int, page: int = 1, item_counts: int = 20) -> dict:
-    """특정 사용자의 UserApplicated 목록을 조회하는 함수 (Pagination 적용)"""
-    offset = (page - 1) * item_counts
-    total_count = db.query(UserApplicated).filter(UserApplicated.user_id == user_id).count()
-    applicateds = db.query(UserApplicated).filter(UserApplicated.user_id == user_id).offset(offset).limit(item_counts).all()
+# to_dict와 동일한 목록 응답 필드 (fields= 로 일부만 선택 가능)
+APPLICATION_FIELDS = ("application_id", "user_id", "poster_id", "application", "application_status")
+
+def get_user_applications_by_user_id(db: Session, user_id: int, page: int = 1, item_counts: int = 20, count_mode: str = COUNT_MODE_ESTIMATE, fields: tuple = None) -> dict:
+    """
+    특정 사용자의 UserApplicated 목록을 조회하는 함수 (Pagination 적용)
+    ORM 엔티티 대신 fields에 해당하는 컬럼만 row tuple로 조회합니다.
+    """
+    fields = fields or APPLICATION_FIELDS
+    query = db.query(*[getattr(UserApplicated, name) for name in fields]).filter(UserApplicated.user_id == user_id)
+    rows, page_info = paginate(query, page, item_counts, count_mode, count_cache.make_key(UserApplicated.__tablename__, {"user_id": user_id}))
     data = {
-        "user_applicateds": [applicated.to_dict() for applicated in applicateds],
-        "total_count": total_count,
-        "current_page": page,
-        "total_page": (total_count + item_counts - 1) // item_counts
+        "user_applicateds": [{name: getattr(row, name) for name in fields} for row in rows],
+        **page_info,
     }
     return {
         "success": True,
@@ -73,6 +84,7 @@ def create_user_applicated(db: Session, user_id: str, poster_id: str, applicatio
         db.add(new_applicated)
         db.commit()
         db.refresh(new_applicated)
+        count_cache.invalidate(UserApplicated.__tablename__)
         return {"success": True, "user_applicated": new_applicated.to_dict()}
     except Exception as e:
         db.rollback()
@@ -122,9 +134,93 @@ def delete_user_applicated(db: Session, application_id_input: int) -> dict:
         try:
             db.delete(applicated)
             db.commit()
+            count_cache.invalidate(UserApplicated.__tablename__)
             return {"success": True}
         except Exception as e:
             db.rollback()
             return {"success": False, "error": str(e)}
     else:
-        return {"success": False, "message": "UserApplicated not found"}
\ No newline at end of file
+        return {"success": False, "message": "UserApplicated not found"}
+
+def submit_user_applicated(db: Session, user_id: str, poster_id: str, application: str, application_status: int) -> dict:
+    """
+    UserApplicated와 생성 로그(UserApplicatedLog)를 한 트랜잭션으로 생성하는 함수
+    중복 지원 여부는 미리 조회하지 않고 (user_id, poster_id) 유니크 제약 충돌로 확인합니다.
+    :return: 성공 시 {"success": True, "user_applicated": ...},
+             이미 지원한 경우 {"success": False, "message": "UserApplicated already exists", "user_applicated": 기존 지원서}
+    """
+    try:
+        new_applicated = UserApplicated(user_id=user_id, poster_id=poster_id, application=application, application_status=application_status)
+        db.add(new_applicated)
+        db.flush()  # application_id 할당
+        db.add(UserApplicatedLog(application_id=new_applicated.application_id, user_id=user_id, poster_id=poster_id, applicate_action=ApplicateAction.CREATE))
+        user_applicated = new_applicated.to_dict()  # commit 후에는 속성이 만료되어 다시 조회하므로 미리 변환
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        # 유니크 제약 충돌(이미 지원)인지, FK 위반(없는 사용자/공고)인지 구분
+        existing = get_user_applicated_by_ids(db, user_id, poster_id)
+        if existing['success']:
+            return {"success": False, "message": "UserApplicated already exists", "user_applicated": existing['user_applicated']}
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "error": str(e)}
+    count_cache.invalidate(UserApplicated.__tablename__)
+    return {"success": True, "user_applicated": user_applicated}
+
+def update_user_applicated_with_log(db: Session, application_id_input: int, user_id: str, new_application: str = None, new_application_status: int = None) -> dict:
+    """
+    본인의 UserApplicated를 수정하고 수정 로그를 한 트랜잭션으로 생성하는 함수
+    수정할 행을 SELECT ... FOR UPDATE로 잠근 뒤 UPDATE와 로그 INSERT를 함께 커밋합니다.
+    :return: 실패 시 message는 "UserApplicated not found", "Unauthorized User", "UserApplicated not updated" 중 하나
+    """
+    try:
+        applicated = db.query(UserApplicated).filter(UserApplicated.application_id == application_id_input).with_for_update().first()
+        if applicated is None:
+            db.rollback()
+            return {"success": False, "message": "UserApplicated not found"}
+        if applicated.user_id != user_id:
+            db.rollback()
+            return {"success": False, "message": "Unauthorized User"}
+        if (new_application is None or applicated.application == new_application) and \
+                (new_application_status is None or applicated.application_status == new_application_status):
+            db.rollback()
+            return {"success": False, "message": "UserApplicated not updated", "user_applicated": applicated.to_dict()}
+
+        if new_application is not None:
+            applicated.application = new_application
+        if new_application_status is not None:
+            applicated.application_status = new_application_status
+        db.add(UserApplicatedLog(application_id=applicated.application_id, user_id=user_id, poster_id=applicated.poster_id, applicate_action=ApplicateAction.UPDATE))
+        user_applicated = applicated.to_dict()
+        db.commit()
+        return {"success": True, "user_applicated": user_applicated}
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "error": str(e)}
+
+def cancel_user_applicated(db: Session, application_id_input: int, user_id: str) -> dict:
+    """
+    본인의 UserApplicated를 삭제하고 삭제 로그를 한 트랜잭션으로 생성하는 함수
+    :return: 성공 시 삭제된 지원서를 user_applicated로 반환,
+             실패 시 message는 "UserApplicated not found", "Unauthorized User" 중 하나
+    """
+    try:
+        applicated = db.query(UserApplicated).filter(UserApplicated.application_id == application_id_input).with_for_update().first()
+        if applicated is None:
+            db.rollback()
+            return {"success": False, "message": "UserApplicated not found"}
+        if applicated.user_id != user_id:
+            db.rollback()
+            return {"success": False, "message": "Unauthorized User"}
+
+        user_applicated = applicated.to_dict()
+        db.add(UserApplicatedLog(application_id=applicated.application_id, user_id=user_id, poster_id=applicated.poster_id, applicate_action=ApplicateAction.DELETE))
+        db.delete(applicated)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "error": str(e)}
+    count_cache.invalidate(UserApplicated.__tablename__)
+    return {"success": True, "user_applicated": user_applicated}
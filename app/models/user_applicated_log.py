@@ -1,6 +1,6 @@
 # models/user_applicated_log.py
 
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import declarative_base, relationship, Session
 from datetime import datetime
 from sqlalchemy import and_
@@ -16,6 +16,10 @@ class ApplicateAction(enum.IntEnum):
 class UserApplicatedLog(Base):
     """UserApplicatedLog 테이블에 대한 SQLAlchemy 모델 클래스"""
     __tablename__ = "UserApplicatedLog"
+    __table_args__ = (
+        # 사용자별 지원 기록 시간순 조회용
+        Index("ix_user_applicated_log_user_applicated_at", "user_id", "applicated_at"),
+    )
 
     application_log_id = Column(Integer, primary_key=True, autoincrement=True, nullable=False)
     application_id = Column(Integer, nullable=False)
@@ -2,9 +2,12 @@
 
 from sqlalchemy import Column, String, ForeignKey
 from sqlalchemy.orm import declarative_base, relationship, Session
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, insert, exists
+from sqlalchemy.exc import IntegrityError, OperationalError
 
 from . import Base
+from .pagination import count_cache, paginate, COUNT_MODE_ESTIMATE
+from .bookmark_cache import bookmark_cache
 
 class UserBookmark(Base):
     """UserBookmark 테이블에 대한 SQLAlchemy 모델 클래스"""
@@ -43,6 +46,8 @@ def create_user_bookmark(db: Session, user_id: str, poster_id: str) -> dict:
         db.add(new_bookmark)
         db.commit()
         db.refresh(new_bookmark)
+        count_cache.invalidate(UserBookmark.__tablename__)
+        bookmark_cache.apply(user_id, poster_id, True)
         return {"success": True, "user_bookmark": new_bookmark.to_dict()}
     except Exception as e:
         db.rollback()
@@ -57,21 +62,24 @@ def get_user_bookmark_by_ids(db: Session, user_id_input: str, poster_id_input: s
     else:
         return {"success": False, "message": "UserBookmark not found"}
 
-def get_user_bookmark_by_user_id(db: Session, user_id_input: str, page: int = 1, item_counts: int = 20) -> dict:
-    """user_id로 정보를 가져오는 함수"""
+# to_dict와 동일한 목록 응답 필드 (fields= 로 일부만 선택 가능)
+BOOKMARK_FIELDS = ("user_id", "poster_id")
+
+def get_user_bookmark_by_user_id(db: Session, user_id_input: str, page: int = 1, item_counts: int = 20, count_mode: str = COUNT_MODE_ESTIMATE, fields: tuple = None) -> dict:
+    """
+    user_id로 정보를 가져오는 함수
+    ORM 엔티티 대신 fields에 해당하는 컬럼만 row tuple로 조회합니다.
+    """
+    data = {}
     try:
-        query = db.query(UserBookmark).filter(UserBookmark.user_id == user_id_input)
-        offset = (page - 1) * item_counts
-        bookmarks = query.offset(offset).limit(item_counts).all()
-        total_count = query.count()
-        data = {}
+        fields = fields or BOOKMARK_FIELDS
+        query = db.query(*[getattr(UserBookmark, name) for name in fields]).filter(UserBookmark.user_id == user_id_input)
+        rows, page_info = paginate(query, page, item_counts, count_mode, count_cache.make_key(UserBookmark.__tablename__, {"user_id": user_id_input}))
 
-        if bookmarks:
+        if rows:
             data = {
-                "user_bookmarks": [bookmark.to_dict() for bookmark in bookmarks],
-                "total_count": total_count,
-                "current_page": page,
-                "total_page": (total_count + item_counts - 1) // item_counts,
+                "user_bookmarks": [{name: getattr(row, name) for name in fields} for row in rows],
+                **page_info,
             }
             return {"success": True, "data": data, "message": "Successfully load user bookmark"}
         else:
@@ -86,9 +94,59 @@ def delete_user_bookmark(db: Session, user_id_input: str, poster_id_input: str)
         try:
             db.delete(bookmark)
             db.commit()
+            count_cache.invalidate(UserBookmark.__tablename__)
+            bookmark_cache.apply(user_id_input, poster_id_input, False)
             return {"success": True}
         except Exception as e:
             db.rollback()
             return {"success": False, "error": str(e)}
     else:
-        return {"success": False, "message": "UserBookmark not found"}
\ No newline at end of file
+        return {"success": False, "message": "UserBookmark not found"}
+
+# 동시에 같은 북마크를 토글할 때 발생할 수 있는 잠금 오류 (MySQL 1213: 교착 상태, 1205: 잠금 대기 시간 초과)
+RETRYABLE_LOCK_ERRORS = (1213, 1205)
+TOGGLE_MAX_ATTEMPTS = 3
+
+def _is_retryable_lock_error(e: OperationalError) -> bool:
+    """트랜잭션을 다시 실행하면 성공할 수 있는 잠금 오류인지 확인합니다. (SQLite는 database is locked)"""
+    args = getattr(e.orig, "args", ())
+    return bool(args) and (args[0] in RETRYABLE_LOCK_ERRORS or "database is locked" in str(args[0]))
+
+def toggle_user_bookmark(db: Session, user_id_input: str, poster_id_input: str) -> dict:
+    """
+    UserBookmark를 한 트랜잭션에서 등록/해제하는 함수
+    DELETE를 먼저 실행하고, 삭제된 행이 없으면 INSERT 합니다. (SELECT 없이 한 커넥션에서 처리)
+    동시에 같은 (user_id, poster_id)로 등록이 경합해 PK 충돌이 나면 이미 등록된 상태로 간주합니다.
+    InnoDB에서는 없는 행에 대한 DELETE가 gap lock을 잡으므로 동시 토글이 교착 상태가 될 수 있으며,
+    이 경우 트랜잭션을 최대 TOGGLE_MAX_ATTEMPTS번까지 다시 실행합니다.
+    :return: {"success": True, "bookmarked": 토글 후 북마크 여부}
+    """
+    condition = and_(UserBookmark.user_id == user_id_input, UserBookmark.poster_id == poster_id_input)
+    for attempt in range(1, TOGGLE_MAX_ATTEMPTS + 1):
+        try:
+            deleted = db.execute(delete(UserBookmark).where(condition)).rowcount
+            if deleted:
+                bookmarked = False
+            else:
+                db.execute(insert(UserBookmark).values(user_id=user_id_input, poster_id=poster_id_input))
+                bookmarked = True
+            db.commit()
+            break
+        except IntegrityError as e:
+            db.rollback()
+            # PK 충돌(다른 요청이 먼저 등록)인지, FK 위반(없는 사용자/포스터)인지 구분
+            if db.query(exists().where(condition)).scalar():
+                bookmark_cache.apply(user_id_input, poster_id_input, True)
+                return {"success": True, "bookmarked": True}
+            return {"success": False, "error": str(e)}
+        except OperationalError as e:
+            db.rollback()
+            if attempt < TOGGLE_MAX_ATTEMPTS and _is_retryable_lock_error(e):
+                continue
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            db.rollback()
+            return {"success": False, "error": str(e)}
+    count_cache.invalidate(UserBookmark.__tablename__)
+    bookmark_cache.apply(user_id_input, poster_id_input, bookmarked)
+    return {"success": True, "bookmarked": bookmarked}
@@ -0,0 +1,177 @@
+# models/view_counter.py
+
+import atexit
+import threading
+from typing import Callable, Optional
+
+VIEW_COUNTER_BACKEND_MEMORY = "memory"
+VIEW_COUNTER_BACKEND_REDIS = "redis"
+VIEW_COUNTER_BACKENDS = (VIEW_COUNTER_BACKEND_MEMORY, VIEW_COUNTER_BACKEND_REDIS)
+
+class MemoryViewCountStore:
+    """프로세스 메모리에 반영 대기 중인 조회수를 저장합니다."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._total = 0
+
+    def incr(self, poster_id: str) -> int:
+        """조회수를 1 증가시키고, 반영 대기 중인 전체 증가분을 반환합니다."""
+        with self._lock:
+            self._counts[poster_id] = self._counts.get(poster_id, 0) + 1
+            self._total += 1
+            return self._total
+
+    def get(self, poster_id: str) -> int:
+        with self._lock:
+            return self._counts.get(poster_id, 0)
+
+    def drain(self) -> dict:
+        """반영 대기 중인 증가분을 모두 꺼내고 비웁니다."""
+        with self._lock:
+            counts, self._counts, self._total = self._counts, {}, 0
+            return counts
+
+    def restore(self, counts: dict):
+        """DB 반영에 실패한 증가분을 되돌려 놓습니다."""
+        with self._lock:
+            for poster_id, count in counts.items():
+                self._counts[poster_id] = self._counts.get(poster_id, 0) + count
+                self._total += count
+
+class RedisViewCountStore:
+    """
+    Redis 해시에 반영 대기 중인 조회수를 저장합니다.
+    여러 프로세스(노드)가 같은 해시를 공유하므로, 어느 노드가 flush하더라도 증가분이 한 번만 반영됩니다.
+    """
+    HASH_KEY = "job_posting:view_counts"
+    TOTAL_KEY = "job_posting:view_counts:total"
+
+    def __init__(self, host: str, port: int, password: Optional[str] = None):
+        import redis  # 선택 의존성: redis 백엔드를 사용할 때만 필요
+        self._client = redis.Redis(host=host, port=port, password=password or None, decode_responses=True)
+
+    def incr(self, poster_id: str) -> int:
+        pipe = self._client.pipeline()
+        pipe.hincrby(self.HASH_KEY, poster_id, 1)
+        pipe.incr(self.TOTAL_KEY)
+        return pipe.execute()[1]
+
+    def get(self, poster_id: str) -> int:
+        return int(self._client.hget(self.HASH_KEY, poster_id) or 0)
+
+    def drain(self) -> dict:
+        # HGETALL과 DEL을 MULTI로 묶어 그 사이의 증가분이 유실되지 않도록 함
+        pipe = self._client.pipeline(transaction=True)
+        pipe.hgetall(self.HASH_KEY)
+        pipe.delete(self.HASH_KEY, self.TOTAL_KEY)
+        counts = pipe.execute()[0]
+        return {poster_id: int(count) for poster_id, count in counts.items()}
+
+    def restore(self, counts: dict):
+        pipe = self._client.pipeline()
+        for poster_id, count in counts.items():
+            pipe.hincrby(self.HASH_KEY, poster_id, count)
+        pipe.incrby(self.TOTAL_KEY, sum(counts.values()))
+        pipe.execute()
+
+class ViewCounter:
+    """
+    채용 공고 조회수 write-behind 카운터
+
+    조회할 때마다 UPDATE를 실행하는 대신 증가분을 store(메모리 또는 Redis)에 모아 두었다가,
+    flush_seconds마다 또는 증가분이 flush_threshold 이상 쌓이면 UPDATE ... CASE 한 번으로 반영합니다.
+    프로세스 종료 시에도 남은 증가분을 반영합니다.
+    """
+    def __init__(self, flush_seconds: float = 5, flush_threshold: int = 100):
+        self.flush_seconds = flush_seconds
+        self.flush_threshold = flush_threshold
+        self._store = MemoryViewCountStore()
+        self._session_factory = None
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def configure(self, session_factory: Callable, backend: str = VIEW_COUNTER_BACKEND_MEMORY, flush_seconds: Optional[float] = None, flush_threshold: Optional[int] = None, redis_options: Optional[dict] = None):
+        """
+        flush에 사용할 세션 팩토리와 저장소를 설정합니다.
+        :param backend: memory | redis
+        :param redis_options: RedisViewCountStore 생성 인자 (host, port, password)
+        """
+        if backend not in VIEW_COUNTER_BACKENDS:
+            raise ValueError(f"Invalid view counter backend: {backend}, Value should be one of {list(VIEW_COUNTER_BACKENDS)}.")
+        if backend == VIEW_COUNTER_BACKEND_REDIS:
+            self._store = RedisViewCountStore(**(redis_options or {}))
+        self._session_factory = session_factory
+        if flush_seconds is not None:
+            self.flush_seconds = flush_seconds
+        if flush_threshold is not None:
+            self.flush_threshold = flush_threshold
+
+    def start(self):
+        """주기적으로 flush하는 백그라운드 스레드를 시작하고, 종료 시 flush를 등록합니다."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="view-counter-flusher", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """백그라운드 스레드를 멈추고 남은 증가분을 반영합니다."""
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join(timeout=self.flush_seconds + 5)
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Failed to flush view counts: {e}")
+
+    def increment(self, poster_id: str):
+        """poster_id의 조회수를 1 증가시킵니다. (DB에는 flush 시 반영)"""
+        total = self._store.incr(poster_id)
+        if total >= self.flush_threshold:
+            if self._thread is not None:
+                self._wake.set()
+            else:
+                self.flush()
+
+    def pending(self, poster_id: str) -> int:
+        """poster_id의 아직 DB에 반영되지 않은 조회수 증가분을 반환합니다."""
+        return self._store.get(poster_id)
+
+    def flush(self) -> int:
+        """
+        반영 대기 중인 증가분을 DB에 반영합니다.
+        :return: 반영된 공고 수 (실패 시 증가분을 되돌려 놓고 예외를 다시 발생)
+        """
+        if self._session_factory is None:
+            return 0
+        from .job_posting import add_view_counts
+
+        with self._flush_lock:
+            counts = self._store.drain()
+            if not counts:
+                return 0
+            db = self._session_factory()
+            try:
+                result = add_view_counts(db, counts)
+            finally:
+                db.close()
+            if not result["success"]:
+                self._store.restore(counts)
+                raise RuntimeError(result["message"])
+            return result["updated"]
+
+view_counter = ViewCounter()
@@ -9,6 +9,7 @@ application = Namespace('application', description='Application related operatio
 
 parser = application.parser()
 parser.add_argument('page', type=int, help='페이지 번호 (기본값: 1)', location='args', default=1)
+parser.add_argument('fields', type=str, help='응답에 포함할 필드 (쉼표로 구분, 기본값: 전체)', location='args')
 
 # 모델 정의
 application_add_model = application.model('ApplicationAdd', {
@@ -62,6 +63,7 @@ class Application(Resource):
         description="지원 목록을 조회합니다.",
         params={
             'page': '페이지 번호 (기본값: 1)',
+            'fields': '응답에 포함할 필드 (쉼표로 구분, 기본값: 전체)\n가능한 값: application_id, user_id, poster_id, application, application_status',
         },
         responses={
             HTTPStatus.OK.value: '''{
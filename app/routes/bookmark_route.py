@@ -12,6 +12,7 @@ bookmark = Namespace('bookmark', description='User Bookmark related operations')
 
 parser = bookmark.parser()
 parser.add_argument('page', type=int, help='페이지 번호 (기본값: 1)', location='args', default=1)
+parser.add_argument('fields', type=str, help='응답에 포함할 필드 (쉼표로 구분, 기본값: 전체)', location='args')
 
 @bookmark.route('/')
 class GetBookmarks(Resource):
@@ -20,6 +21,7 @@ class GetBookmarks(Resource):
         description="북마크 목록을 조회합니다.",
         params={
             'page': '페이지 번호 (기본값: 1)',
+            'fields': '응답에 포함할 필드 (쉼표로 구분, 기본값: 전체)\n가능한 값: user_id, poster_id',
         },
         responses={
             HTTPStatus.OK.value: '''''',
@@ -2,6 +2,7 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
 from app.services import job_service
+from app.middlewares.auth_guard import AuthGuard
 from app.views.response import JsonResponse, fail
 from http import HTTPStatus
 
@@ -10,7 +11,8 @@ job = Namespace('job', description='poster related operations')
 # Query parameters 모델 정의 (Swagger 문서화)
 job_filters = job.model('JobFilters', {
     'page': fields.Integer(example=1, description="페이지 번호 (기본값: 1)"),
-    'sort_by': fields.String(example="deadline_date", description="정렬 기준 (기본값: deadline_date)\n가능한 값: ['deadline_date', 'last_updated_date', 'edu_code', 'sal_code', 'poster_title']"),
+    'fields': fields.String(example="poster_id,poster_title,deadline_date", description="응답에 포함할 필드 (쉼표로 구분, 기본값: 전체)"),
+    'sort_by': fields.String(example="deadline_date", description="정렬 기준 (기본값: deadline_date)\n가능한 값: ['deadline_date', 'last_updated_date', 'edu_code', 'sal_code', 'poster_title', 'relevance']"),
     'sort_order': fields.String(example="asc", description="정렬 순서 (asc 또는 desc)"),
     'title_contains': fields.String(example="정규직", description="제목을 포함한 검색어"),
     'comp_id': fields.Integer(example=101, description="회사의 ID"),
@@ -24,12 +26,19 @@ job_filters = job.model('JobFilters', {
     'deadline_date_gte': fields.String(example="2024-12-29", description="마감일 필터 (greater than or equal to)"),
     'deadline_date_lte': fields.String(example="2024-12-28", description="마감일 필터 (less than or equal to)"),
     'loc_codes': fields.List(fields.Integer, example=[101000], description="위치 코드 필터 (리스트)"),
-    'job_codes': fields.List(fields.Integer, example=[2225], description="직업 코드 필터 (리스트)")
+    'job_codes': fields.List(fields.Integer, example=[2225], description="직업 코드 필터 (리스트)"),
+    'loc_codes_match': fields.String(example="any", description="위치 코드 매칭 방식 (any 또는 all)"),
+    'loc_codes_expand': fields.String(example="descendants", description="descendants: 1차 지역 코드를 하위 지역 코드까지 포함해 검색"),
+    'job_codes_match': fields.String(example="any", description="직업 코드 매칭 방식 (any 또는 all)"),
+    'count': fields.String(example="estimate", description="total_count 계산 방식 (estimate, exact, none)"),
+    'cursor': fields.String(example="", description="커서 페이징용 커서 (첫 페이지는 빈 값)"),
+    'expand': fields.String(example="codes", description="codes: 코드 이름(sal_name, edu_name, job_names, loc_names)을 함께 반환")
 })
 
 parser = job.parser()
 parser.add_argument('page', type=int, help='페이지 번호 (기본값: 1)', location='args', default=1)
-parser.add_argument('sort_by', type=str, help='정렬 기준 (기본값: deadline_date)', location='args', default='deadline_date', choices=['deadline_date', 'last_updated_date', 'edu_code', 'sal_code', 'poster_title'])
+parser.add_argument('fields', type=str, help='응답에 포함할 필드 (쉼표로 구분, 기본값: 전체)', location='args')
+parser.add_argument('sort_by', type=str, help='정렬 기준 (기본값: deadline_date)', location='args', default='deadline_date', choices=['deadline_date', 'last_updated_date', 'edu_code', 'sal_code', 'poster_title', 'relevance'])
 parser.add_argument('sort_order', type=str, help='정렬 순서 (asc 또는 desc)', location='args', default='asc', choices=['asc', 'desc'])
 parser.add_argument('title_contains', type=str, help='제목을 포함한 검색어', location='args')
 parser.add_argument('comp_id', type=int, help='회사의 ID', location='args')
@@ -44,6 +53,17 @@ parser.add_argument('deadline_date_gte', type=str, help='마감일 필터 (great
 parser.add_argument('deadline_date_lte', type=str, help='마감일 필터 (less than or equal to)', location='args')
 parser.add_argument('loc_codes', type=int, help='위치 코드 필터 (리스트)', location='args', action='append')
 parser.add_argument('job_codes', type=int, help='직업 코드 필터 (리스트)', location='args', action='append')
+parser.add_argument('loc_codes_match', type=str, help='위치 코드 매칭 방식 (기본값: any)', location='args', default='any', choices=['any', 'all'])
+parser.add_argument('loc_codes_expand', type=str, help='descendants: 1차 지역 코드를 하위 지역 코드까지 포함해 검색', location='args', choices=['descendants'])
+parser.add_argument('job_codes_match', type=str, help='직업 코드 매칭 방식 (기본값: any)', location='args', default='any', choices=['any', 'all'])
+parser.add_argument('count', type=str, help='total_count 계산 방식 (기본값: estimate)', location='args', default='estimate', choices=['estimate', 'exact', 'none'])
+parser.add_argument('cursor', type=str, help='커서 페이징용 커서 (첫 페이지는 빈 값, 이후 응답의 next_cursor 사용)', location='args')
+parser.add_argument('expand', type=str, help='codes: 코드 이름을 함께 반환', location='args', choices=['codes'])
+
+# facet 조회용 파라미터 (정렬/페이징 관련 파라미터 제외)
+facet_parser = parser.copy()
+for argument_name in ['page', 'fields', 'sort_by', 'sort_order', 'count', 'cursor', 'expand']:
+    facet_parser.remove_argument(argument_name)
 
 @job.route('/')
 class Applications(Resource):
@@ -52,10 +72,11 @@ class Applications(Resource):
     """
     @job.doc(
         security=None,
-        description="채용 공고 목록을 조회합니다.",
+        description="채용 공고 목록을 조회합니다.\n로그인한 사용자(Authorization 헤더)인 경우 각 공고에 북마크 여부(is_bookmarked)를 함께 반환합니다. (fields에 poster_id가 포함된 경우)",
         params={
             'page': '페이지 번호 (기본값: 1)',
-            'sort_by': "정렬 기준 (기본값: deadline_date)\n가능한 값(이 중 하나만 가능): ['deadline_date', 'last_updated_date', 'edu_code', 'sal_code', 'poster_title']",
+            'fields': '응답에 포함할 필드 (쉼표로 구분, 기본값: 전체)\n가능한 값: comp_id, poster_id, poster_title, deadline_date, edu_code, job_codes, loc_codes, sal_code, poster_status',
+            'sort_by': "정렬 기준 (기본값: deadline_date)\n가능한 값(이 중 하나만 가능): ['deadline_date', 'last_updated_date', 'edu_code', 'sal_code', 'poster_title', 'relevance']\nrelevance는 title_contains 검색어와의 관련도 순(내림차순)으로 정렬하며, title_contains가 필요합니다.",
             'sort_order': '정렬 순서 (asc 또는 desc)',
             'title_contains': '제목을 포함한 검색어',
             'comp_id': '회사의 ID',
@@ -68,8 +89,14 @@ class Applications(Resource):
             'deadline_date_eq': '마감일 필터 (equals)',
             'deadline_date_gte': '마감일 필터 (greater than or equal to)',
             'deadline_date_lte': '마감일 필터 (less than or equal to)',
-            'loc_codes': '위치 코드 필터 (리스트)',
-            'job_codes': '직업 코드 필터 (리스트)'
+            'loc_codes': '위치 코드 필터 (쉼표로 구분된 리스트, 예: 101000,101010)',
+            'job_codes': '직업 코드 필터 (쉼표로 구분된 리스트, 예: 2225,2259)',
+            'loc_codes_match': "위치 코드 매칭 방식 (기본값: any)\nany: 하나라도 포함, all: 모두 포함",
+            'loc_codes_expand': "descendants로 지정하면 loc_codes의 1차 지역 코드(예: 101000)를 하위 지역 코드까지 포함해 검색합니다. (loc_codes_match=any만 가능)",
+            'job_codes_match': "직업 코드 매칭 방식 (기본값: any)\nany: 하나라도 포함, all: 모두 포함",
+            'count': "total_count 계산 방식 (기본값: estimate)\nestimate: 캐시된 개수 사용(최대 1분 지연), exact: 항상 새로 계산, none: 개수 계산을 생략하고 has_next만 반환",
+            'cursor': '커서 페이징용 커서. 지정 시 page 대신 커서 방식으로 조회합니다.\n첫 페이지는 빈 값(cursor=)으로 요청하고, 이후 응답의 next_cursor 값을 그대로 전달하세요.\n응답에는 total_count/total_page 대신 has_next, next_cursor가 포함됩니다.',
+            'expand': "codes로 지정하면 각 공고에 코드 이름을 함께 반환합니다.\nsal_name, edu_name, job_names(job_codes와 같은 순서), loc_names(loc_codes와 같은 순서)"
         },
         responses={
             HTTPStatus.OK.value: '''
@@ -416,7 +443,85 @@ class Applications(Resource):
         """
         try:
             query_params = request.args.to_dict()  # 쿼리 파라미터를 딕셔너리로 받음
-            success, data, message, status = job_service.get_applications_list(query_params)
+            # 로그인한 사용자인 경우 각 공고에 is_bookmarked를 함께 반환
+            success, data, message, status = job_service.get_applications_list(query_params, AuthGuard.get_optional_identity())
+            return JsonResponse(success, data, message, status).to_response()
+        except Exception as e:
+            return fail(str(e), HTTPStatus.INTERNAL_SERVER_ERROR)
+
+@job.route('/facets', methods=['GET'], endpoint='job_facets')
+class Facets(Resource):
+    """
+    채용 공고 facet 관련 API
+    """
+    @job.doc(
+        security=None,
+        description="채용 공고 목록과 동일한 필터 조건에서 급여(sal_code), 학력(edu_code), 1차 지역(loc_mcode), 직무(job_code)별 공고 개수를 한 번에 조회합니다.",
+        params={
+            'title_contains': '제목을 포함한 검색어',
+            'comp_id': '회사의 ID',
+            'sal_code_eq': '급여 코드 필터 (equals)',
+            'sal_code_gte': '급여 코드 필터 (greater than or equal to)',
+            'sal_code_lte': '급여 코드 필터 (less than or equal to)',
+            'edu_code_eq': '학력 코드 필터 (equals)',
+            'edu_code_gte': '학력 코드 필터 (greater than or equal to)',
+            'edu_code_lte': '학력 코드 필터 (less than or equal to)',
+            'deadline_date_eq': '마감일 필터 (equals)',
+            'deadline_date_gte': '마감일 필터 (greater than or equal to)',
+            'deadline_date_lte': '마감일 필터 (less than or equal to)',
+            'loc_codes': '위치 코드 필터 (쉼표로 구분된 리스트, 예: 101000,101010)',
+            'job_codes': '직업 코드 필터 (쉼표로 구분된 리스트, 예: 2225,2259)',
+            'loc_codes_match': "위치 코드 매칭 방식 (기본값: any)\nany: 하나라도 포함, all: 모두 포함",
+            'loc_codes_expand': "descendants로 지정하면 loc_codes의 1차 지역 코드(예: 101000)를 하위 지역 코드까지 포함해 검색합니다. (loc_codes_match=any만 가능)",
+            'job_codes_match': "직업 코드 매칭 방식 (기본값: any)\nany: 하나라도 포함, all: 모두 포함",
+        },
+        responses={
+            HTTPStatus.OK.value: '''
+{
+    "status": "success",
+    "message": "채용 공고 facet 정보를 성공적으로 조회했습니다.",
+    "data": {
+        "total_count": 584,
+        "facets": {
+            "sal_code": [
+                {"sal_code": 1, "count": 512},
+                {"sal_code": 5, "count": 72}
+            ],
+            "edu_code": [
+                {"edu_code": 0, "count": 201},
+                {"edu_code": 3, "count": 383}
+            ],
+            "loc_mcode": [
+                {"loc_mcode": 101000, "count": 455},
+                {"loc_mcode": 102000, "count": 143}
+            ],
+            "job_code": [
+                {"job_code": 2225, "count": 402},
+                {"job_code": 2259, "count": 199}
+            ]
+        }
+    }
+}
+''',
+            HTTPStatus.BAD_REQUEST.value: '''
+{
+    "status": "failed",
+    "message": "Invalid filter keys or values: sal_code_eq"
+}
+''',
+        }
+    )
+    @job.expect(facet_parser)
+    def get(self):
+        """
+        채용 공고 facet 정보를 조회합니다.
+
+        Returns:
+            flask.Response: JSON 응답
+        """
+        try:
+            query_params = request.args.to_dict()  # 쿼리 파라미터를 딕셔너리로 받음
+            success, data, message, status = job_service.get_job_facets(query_params)
             return JsonResponse(success, data, message, status).to_response()
         except Exception as e:
             return fail(str(e), HTTPStatus.INTERNAL_SERVER_ERROR)
@@ -429,7 +534,7 @@ class Application(Resource):
     """
     @job.doc(
         security=None,
-        description="특정 채용 공고를 조회합니다.",
+        description="특정 채용 공고를 조회합니다.\n로그인한 사용자(Authorization 헤더)인 경우 북마크 여부(is_bookmarked)를 함께 반환합니다.",
         responses={
             HTTPStatus.OK.value: '''
 {
@@ -480,7 +585,7 @@ class Application(Resource):
         """
         try:
             query_params = request.args.to_dict()  # 필요하면 query_params 사용
-            success, data, message, status = job_service.get_application(query_params, poster_id)
+            success, data, message, status = job_service.get_application(query_params, poster_id, AuthGuard.get_optional_identity())
             return JsonResponse(success, data, message, status).to_response()
         except Exception as e:
             return fail(str(e), HTTPStatus.INTERNAL_SERVER_ERROR)
\ No newline at end of file
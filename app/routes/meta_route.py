@@ -1,5 +1,5 @@
 # routes/bookmark_route.py
-from flask import request
+from flask import request, current_app
 from flask_restx import Namespace, Resource, fields
 from app.services import meta_service
 from app.views.response import JsonResponse, fail # JsonResponse, success, fail import
@@ -12,6 +12,9 @@ meta = Namespace('meta', description='Meta data table related to api')
 parser = meta.parser()
 parser.add_argument('page', type=int, help='페이지 번호 (기본값: 1)', location='args', default=1)
 
+ids_parser = meta.parser()
+ids_parser.add_argument('ids', type=str, help='쉼표로 구분된 코드 목록 (예: 1,2,3)', location='args', required=True)
+
 @meta.route('/salary')
 class GetSalaryTable(Resource):
     @meta.doc(
@@ -112,8 +115,10 @@ class GetSalaryTable(Resource):
         """
 
         try:
-            success, data, message, status =  meta_service.get_salary_table(request.args.to_dict())
-            return JsonResponse(success, data, message, status).to_response()
+            query_params = request.args.to_dict()
+            etag = meta_service.get_meta_etag("sal", query_params.get("page", "1"))
+            success, data, message, status =  meta_service.get_salary_table(query_params)
+            return JsonResponse(success, data, message, status).to_cached_response(etag, current_app.config['META_CACHE_MAX_AGE'])
         except Exception as e:
             return fail(str(e), HTTPStatus.INTERNAL_SERVER_ERROR)
 
@@ -171,8 +176,10 @@ class GetEducationTable(Resource):
             flask.Response: JSON 형태의 응답
         """
         try:
-            success, data, message, status =  meta_service.get_education_table(request.args.to_dict())
-            return JsonResponse(success, data, message, status).to_response()
+            query_params = request.args.to_dict()
+            etag = meta_service.get_meta_etag("edu", query_params.get("page", "1"))
+            success, data, message, status =  meta_service.get_education_table(query_params)
+            return JsonResponse(success, data, message, status).to_cached_response(etag, current_app.config['META_CACHE_MAX_AGE'])
         except Exception as e:
             return fail(str(e), HTTPStatus.INTERNAL_SERVER_ERROR)
         
@@ -285,11 +292,55 @@ class GetJobTable(Resource):
             flask.Response: JSON 형태의 응답
         """
         try:
-            success, data, message, status =  meta_service.get_job_table(request.args.to_dict())
-            return JsonResponse(success, data, message, status).to_response()
+            query_params = request.args.to_dict()
+            etag = meta_service.get_meta_etag("job", query_params.get("page", "1"))
+            success, data, message, status =  meta_service.get_job_table(query_params)
+            return JsonResponse(success, data, message, status).to_cached_response(etag, current_app.config['META_CACHE_MAX_AGE'])
         except Exception as e:
             return fail(str(e), HTTPStatus.INTERNAL_SERVER_ERROR)
         
+@meta.route('/job/batch')
+class GetJobNameBatch(Resource):
+    @meta.doc(
+        security=None,
+        description="여러 job_code의 job_name을 한 번에 조회합니다. (최대 200개)",
+        params={
+            'ids': '쉼표로 구분된 job_code 목록 (예: 80,81)'
+        },
+        responses={
+        200: '''{
+  "status": "success",
+  "message": "job name 조회에 성공했습니다.",
+  "data": {
+    "job_codes": {
+      "80": {
+        "job_code": 80,
+        "job_name": "게임개발"
+      },
+      "81": {
+        "job_code": 81,
+        "job_name": "웹개발"
+      }
+    },
+    "not_found": []
+  }
+}''',
+        400: '''{
+  "status": "failed",
+  "message": "ids is required.",
+  "data": {}
+}'''
+    })
+    @meta.expect(ids_parser)
+    def get(self):
+        """
+        여러 job_code의 job_name을 한 번에 획득합니다.
+        """
+        ids = request.args.get('ids', '')
+        etag = meta_service.get_meta_etag("job", ids)
+        success, data, message, status = meta_service.get_job_names(ids)
+        return JsonResponse(success, data, message, status).to_cached_response(etag, current_app.config['META_CACHE_MAX_AGE'])
+
 @meta.route('/job/<int:job_code>')
 class GetJobName(Resource):
     @meta.doc(
@@ -316,8 +367,9 @@ class GetJobName(Resource):
         """
         job_code를 통해 job_name을 획득합니다.
         """
+        etag = meta_service.get_meta_etag("job", job_code)
         success, data, message, status = meta_service.get_job_name(job_code)
-        return JsonResponse(success, data, message, status).to_response()
+        return JsonResponse(success, data, message, status).to_cached_response(etag, current_app.config['META_CACHE_MAX_AGE'])
         
 @meta.route('/loc')
 class GetLocTable(Resource):
@@ -469,11 +521,92 @@ class GetLocTable(Resource):
             flask.Response: JSON 형태의 응답
         """
         try:
-            success, data, message, status =  meta_service.get_location_table(request.args.to_dict())
-            return JsonResponse(success, data, message, status).to_response()
+            query_params = request.args.to_dict()
+            etag = meta_service.get_meta_etag("loc", query_params.get("page", "1"))
+            success, data, message, status =  meta_service.get_location_table(query_params)
+            return JsonResponse(success, data, message, status).to_cached_response(etag, current_app.config['META_CACHE_MAX_AGE'])
         except Exception as e:
             return fail(str(e), HTTPStatus.INTERNAL_SERVER_ERROR)
         
+@meta.route('/loc/tree')
+class GetLocTree(Resource):
+    @meta.doc(
+        security=None,
+        description="1차 지역(loc_mcode)별 하위 지역 트리 전체를 한 번에 조회합니다.",
+        responses={
+        200: '''{
+  "status": "success",
+  "message": "loc tree 조회에 성공했습니다.",
+  "data": {
+    "loc_tree": [
+      {
+        "loc_mcode": 101000,
+        "loc_mname": "서울",
+        "children": [
+          {
+            "loc_code": 101000,
+            "loc_name": "서울전체"
+          },
+          {
+            "loc_code": 101010,
+            "loc_name": "강남구"
+          }
+        ]
+      }
+    ]
+  }
+}'''
+    })
+    def get(self):
+        """
+        지역 트리 전체를 획득합니다.
+        """
+        etag = meta_service.get_meta_etag("loc", "tree")
+        success, data, message, status = meta_service.get_location_tree()
+        return JsonResponse(success, data, message, status).to_cached_response(etag, current_app.config['META_CACHE_MAX_AGE'])
+
+@meta.route('/loc/batch')
+class GetLocDataBatch(Resource):
+    @meta.doc(
+        security=None,
+        description="여러 loc_code의 지역 정보를 한 번에 조회합니다. (최대 200개)",
+        params={
+            'ids': '쉼표로 구분된 loc_code 목록 (예: 101000,101010)'
+        },
+        responses={
+        200: '''{
+  "status": "success",
+  "message": "loc data 조회에 성공했습니다.",
+  "data": {
+    "loc_codes": {
+      "101000": {
+        "loc_code": 101000,
+        "loc_name": "서울전체",
+        "loc_mcode": 101000,
+        "loc_mname": "서울"
+      }
+    },
+    "not_found": [
+      999999
+    ]
+  }
+}''',
+        400: '''{
+  "status": "failed",
+  "message": "ids is required.",
+  "data": {}
+}'''
+    })
+    @meta.expect(ids_parser)
+    def get(self):
+        """
+        여러 loc_code의 지역 정보를 한 번에 획득합니다.
+        """
+        ids = request.args.get('ids', '')
+        etag = meta_service.get_meta_etag("loc", ids)
+        success, data, message, status = meta_service.get_loc_datas(ids)
+        return JsonResponse(success, data, message, status).to_cached_response(etag, current_app.config['META_CACHE_MAX_AGE'])
+
 @meta.route('/loc/<int:loc_code>')
 class GetLocData(Resource):
     @meta.doc(
@@ -502,5 +635,6 @@ class GetLocData(Resource):
         """
         loc code를 통해 해당 지역 정보를 획득득합니다.
         """
+        etag = meta_service.get_meta_etag("loc", loc_code)
         success, data, message, status = meta_service.get_loc_data(loc_code)
-        return JsonResponse(success, data, message, status).to_response()
\ No newline at end of file
+        return JsonResponse(success, data, message, status).to_cached_response(etag, current_app.config['META_CACHE_MAX_AGE'])
\ No newline at end of file
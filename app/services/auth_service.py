@@ -1,18 +1,18 @@
-from ..models.database import get_db
+from ..models.database import get_db_session
 from ..models.user import create_user, get_user_by_id, update_user
-from ..models.login import create_login, delete_login_by_refresh_token, get_login_by_refresh_token
-from ..models.login_log import create_login_log
-from flask_jwt_extended import create_access_token, create_refresh_token
+from ..models.login import create_login, delete_login_by_refresh_token, lookup_refresh_login
+from ..models.login_log import enqueue_login_log
+from flask_jwt_extended import create_access_token, create_refresh_token, decode_token
 from flask import current_app
-from ..utils.util import base64_encode, base64_decode, is_valid_email, now_korea, mysql_str_to_datetime
+from ..utils.util import base64_encode, base64_decode, is_valid_email, now_korea
 
 def register_user(data):
     """
     회원 가입 함수
     """
     _data = None
-    db =  next(get_db())
     user_id = data.get("user_id")
+    db = get_db_session(primary=True, identity=user_id)
     user_email = data.get("user_email")
     user_password = data.get("user_password")
     user_level = data.get("user_level")
@@ -59,9 +59,9 @@ def user_login(data):
     로그인 함수
     """
     _data = None
-    db = next(get_db())
-    
     user_id = data.get("user_id")
+    db = get_db_session(primary=True, identity=user_id)
+    
     user_password = data.get("user_password")
 
     if not (user_id and user_password):
@@ -73,20 +73,20 @@ def user_login(data):
 
     if not result["success"]:
         message = "사용자를 찾을 수 없습니다."
-        create_login_log(db, login_id=user_id, login_success=0)
+        # LoginLog.login_id는 User를 참조하므로 없는 사용자의 로그인 기록은 남기지 않음
         return False, _data, message, 400
 
     user = result["user"]
 
     if base64_decode(user["user_password"]) != user_password:
         message = "잘못된 비밀번호 입니다."
-        create_login_log(db, login_id=user_id, login_success=0)
+        enqueue_login_log(login_id=user_id, login_success=0)
         return False, _data, message, 400
 
     access_token = create_access_token(identity=user_id)
     refresh_token = create_refresh_token(identity=user_id)
 
-    create_login_log(db, login_id=user_id, login_success=1)
+    enqueue_login_log(login_id=user_id, login_success=1)
     create_login(db, user_id=user_id, refresh_token=refresh_token, expires_at=now_korea() + current_app.config['JWT_REFRESH_TOKEN_EXPIRES'])
 
     message = "로그인 성공"
@@ -102,7 +102,7 @@ def user_logout(data):
     로그아웃 함수
     """
     _data = None
-    db = next(get_db())
+    db = get_db_session(primary=True)
     
     refresh_token = data.get("refresh_token")
 
@@ -125,7 +125,7 @@ def refresh_token(data):
     토큰 갱신 함수
     """
     _data = None
-    db = next(get_db())
+    db = get_db_session(primary=True)
 
     refresh_token = data.get("refresh_token")
 
@@ -134,23 +134,29 @@ def refresh_token(data):
         return False, message, _data, 400
 
     _data = {}
-    result = get_login_by_refresh_token(db, refresh_token)
-
-    if not result["success"]:
+    # 이 엔드포인트는 AuthGuard의 JWT 검증을 거치지 않으므로, 캐시 조회 전에 서명을 검증해 jti를 신뢰할 수 있게 함
+    # (만료 여부는 아래에서 Login.expires_at으로 확인)
+    try:
+        claims = decode_token(refresh_token, allow_expired=True)
+    except Exception:
+        message = "유효하지 않은 refresh token입니다."
+        return False, message, _data, 401
+
+    if claims.get("type") != "refresh" or not claims.get("jti"):
+        message = "유효하지 않은 refresh token입니다."
+        return False, message, _data, 401
+
+    # refresh_token_cache에 없을 때만 DB(refresh_jti 유니크 인덱스)에서 조회
+    user_id, expires_at = lookup_refresh_login(db, claims["jti"], refresh_token)
+
+    if user_id is None or user_id != claims.get("sub"):
         message = "로그인된 사용자를 찾을 수 없습니다."
         return False, message ,_data, 401
 
-    login_data = result.get("login")
-    # print(login_data)
-    expire_date = mysql_str_to_datetime(login_data.get("expires_at"))
-
-    if expire_date <= now_korea():
-        # print(expire_date)
-        # print(now_korea())
+    if expires_at <= now_korea().timestamp():
         message = "다시 로그인 해주세요."
         return False, message ,_data, 401
 
-    user_id = login_data.get("user_id")
     new_access_token = create_access_token(identity=user_id)
 
     message = "토큰 갱신 성공"
@@ -168,9 +174,9 @@ def update_user_profile(data):
     2. 이메일 정보 수정
     """
     _data = None
-    db = next(get_db())
-    
     user_id = data.get("user_id")
+    db = get_db_session(primary=True, identity=user_id)
+    
     action = data.get("action")
     new_value = data.get("new_value")
 
@@ -1,25 +1,27 @@
 # services/bookmark_service.py
-from ..models.database import get_db
-from ..models.user_bookmark import create_user_bookmark, get_user_bookmark_by_ids, get_user_bookmark_by_user_id, delete_user_bookmark
+from ..models.database import get_db_session
+from ..models.pagination import resolve_fields
+from ..models.user_bookmark import BOOKMARK_FIELDS, create_user_bookmark, get_user_bookmark_by_ids, get_user_bookmark_by_user_id, delete_user_bookmark, toggle_user_bookmark
 
 def toggle_bookmark(user_id, poster_id):
     """
     해당 포스터를 북마크 등록/ 해제 합니다.
+    DELETE -> (삭제된 행이 없으면) INSERT를 한 트랜잭션으로 실행하므로, 동시에 여러 번 요청해도 결과가 일관됩니다.
     """
     try:
-        success, data, message, status = register_bookmark(user_id, poster_id)
-        if success:
-            return success, {}, message, status 
-        if message == "이미 존재하는 북마크입니다.":
-            db = next(get_db())
-            result = delete_user_bookmark(db, user_id, poster_id)
-            if result['success']:
-                return True, {}, "북마크가 해제되었습니다.", 200
-        raise Exception
-    except Exception as e:
-        if "pymysql.err.IntegrityError" in message:
-            return False, None, "요청하신 포스터는 존재하지 않습니다.", 400
+        if not user_id or not poster_id:
+            return False, None, "사용자 ID와 포스터 ID는 필수입니다.", 400
 
+        db = get_db_session(primary=True, identity=user_id)
+        result = toggle_user_bookmark(db, user_id, poster_id)
+        if result['success']:
+            if result['bookmarked']:
+                return True, {"is_bookmarked": True}, "북마크가 성공적으로 등록되었습니다.", 200
+            return True, {"is_bookmarked": False}, "북마크가 해제되었습니다.", 200
+        if "IntegrityError" in result['error']:
+            return False, None, "요청하신 포스터는 존재하지 않습니다.", 400
+        return False, None, "Unknown Error is occured while toggling bookmark", 500
+    except Exception as e:
         return False, None, "Unknown Error is occured while toggling bookmark", 500
 
 def register_bookmark(user_id, poster_id):
@@ -27,7 +29,7 @@ def register_bookmark(user_id, poster_id):
     북마크를 등록합니다.
     """
     try:
-        db = next(get_db())
+        db = get_db_session(primary=True, identity=user_id)
 
         if not user_id or not poster_id:
             return False, None, "사용자 ID와 포스터 ID는 필수입니다.", 400
@@ -52,9 +54,16 @@ def get_bookmarks(data, user_id):
     북마크 목록을 조회합니다.
     """
     try:
-        db = next(get_db())
+        db = get_db_session(identity=user_id)
         page = int(data.get('page', '1'))
-        result = get_user_bookmark_by_user_id(db, user_id, page)
+
+        # fields=poster_id 처럼 응답에 포함할 필드를 선택
+        try:
+            fields = resolve_fields(data.get('fields'), BOOKMARK_FIELDS)
+        except ValueError as e:
+            return False, None, str(e), 400
+
+        result = get_user_bookmark_by_user_id(db, user_id, page, fields=fields)
         print(result)
         if result['message'] == "UserBookmark not found" or result['success']:
             return True, result['data'], "북마크 목록을 성공적으로 조회했습니다.", 200
@@ -1,8 +1,17 @@
 # services/job_service.py
-from ..models.database import get_db
-from ..models.job_posting import JobPosting, get_available_job_postings, get_job_posting_by_id, increment_view_count
+from flask import current_app
+from ..models.database import get_db_session
+from ..models.posting_index import posting_index
+from ..models.pagination import COUNT_MODES, COUNT_MODE_ESTIMATE, resolve_fields
+from ..models.job_posting import JobPosting, BRIEF_FIELDS, CODE_MATCH_ANY, CODE_MATCH_MODES, get_available_job_postings, get_available_job_postings_by_cursor, get_available_job_posting_facets, get_job_posting_by_id
+from ..models.view_counter import view_counter
+from ..models.code_cache import code_table_cache
+from ..models.bookmark_cache import bookmark_cache
 from datetime import datetime
 from sqlalchemy import or_
+import base64
+import binascii
+import json
 
 # 필터 조건 정의
 AVAILABLE_FILTERS = {
@@ -19,8 +28,13 @@ AVAILABLE_FILTERS = {
     "deadline_date_lte": str, 
     "loc_codes": int,  # 리스트 내 포함 여부 검사
     "job_codes": int,  # 리스트 내 포함 여부 검사
+    "loc_codes_match": str,  # loc_codes 매칭 방식 (any, all)
+    "job_codes_match": str,  # job_codes 매칭 방식 (any, all)
 }
 
+# 쉼표로 구분된 리스트로 받는 필터 (예: "loc_codes=101000,101010")
+LIST_FILTERS = {"loc_codes", "job_codes"}
+
 def validate_filters(filters: dict) -> dict:
     """
     주어진 필터의 유효성을 검사.
@@ -56,6 +70,10 @@ def validate_filters(filters: dict) -> dict:
         elif not isinstance(value, expected_format):
             invalid_keys.append(key)
 
+        # 코드 매칭 방식 검증
+        if key in ("loc_codes_match", "job_codes_match") and value not in CODE_MATCH_MODES:
+            invalid_keys.append(key)
+
         # 추가적으로 날짜 포맷 검증 (deadline_date 같은 경우)
         if key == "deadline_date" and isinstance(value, dict):
             for op, date_str in value.items():
@@ -74,60 +92,206 @@ def validate_filters(filters: dict) -> dict:
     return {"success": True, "message": "All filters are valid"}
 
 
-def get_applications_list(query_params):
+def encode_cursor(sort_by: str, sort_order: str, cursor: dict) -> str:
+    """
+    다음 페이지 조회용 커서를 클라이언트에 전달할 불투명(opaque) 문자열로 인코딩합니다.
+    정렬 기준이 바뀐 상태에서 커서를 재사용하지 못하도록 정렬 정보도 함께 담습니다.
+    """
+    payload = json.dumps([sort_by, sort_order, cursor["value"], cursor["poster_id"]], ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('utf-8')
+
+def decode_cursor(token: str, sort_by: str, sort_order: str) -> dict:
+    """
+    encode_cursor로 만든 커서 문자열을 디코딩합니다.
+    :raises ValueError: 커서 형식이 잘못되었거나 정렬 기준이 일치하지 않는 경우
+    """
+    try:
+        cursor_sort_by, cursor_sort_order, value, poster_id = json.loads(base64.urlsafe_b64decode(token.encode('utf-8')).decode('utf-8'))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError("Invalid cursor.")
+
+    if cursor_sort_by != sort_by or cursor_sort_order != sort_order:
+        raise ValueError("Cursor does not match the sorting option.")
+
+    return {"value": value, "poster_id": poster_id}
+
+# expand 파라미터로 지정할 수 있는 값
+EXPAND_CODES = "codes"  # 코드 값에 해당하는 이름(sal_name, edu_name, job_names, loc_names)을 함께 반환
+
+# loc_codes_expand 파라미터로 지정할 수 있는 값
+LOC_CODES_EXPAND_DESCENDANTS = "descendants"  # 1차 지역 코드를 자신과 모든 하위 지역 코드로 확장
+
+def expand_codes(postings: list):
+    """
+    코드 테이블 캐시를 이용해 각 공고에 코드 이름을 추가합니다.
+    job_names, loc_names는 job_codes, loc_codes와 같은 순서이며, 없는 코드는 None입니다.
+    """
+    code_table_cache.ensure_loaded(get_db_session)
+    for posting in postings:
+        # fields= 로 제외된 코드는 이름도 추가하지 않음
+        if 'sal_code' in posting:
+            posting['sal_name'] = code_table_cache.get_name("sal", posting['sal_code'])
+        if 'edu_code' in posting:
+            posting['edu_name'] = code_table_cache.get_name("edu", posting['edu_code'])
+        if 'job_codes' in posting:
+            posting['job_names'] = [code_table_cache.get_name("job", code) for code in posting['job_codes'] or []]
+        if 'loc_codes' in posting:
+            posting['loc_names'] = [code_table_cache.get_name("loc", code) for code in posting['loc_codes'] or []]
+
+def annotate_bookmarks(db, postings: list, user_id: str):
+    """
+    로그인한 사용자의 북마크 집합(bookmark_cache)으로 각 공고에 is_bookmarked를 추가합니다.
+    fields= 로 poster_id가 제외된 공고에는 추가하지 않습니다.
+    """
+    bookmarked = bookmark_cache.get(db, user_id)
+    for posting in postings:
+        if 'poster_id' in posting:
+            posting['is_bookmarked'] = posting['poster_id'] in bookmarked
+
+def parse_filters(query_params: dict) -> tuple:
+    """
+    쿼리 파라미터에서 AVAILABLE_FILTERS에 해당하는 필터를 추출하고 유효성을 검사합니다.
+    :return: (filters, validate_filters 결과)
+    """
+    # 필터링 조건 설정 (query_params에서 바로 추출)
+    filters = {}
+    for key, value in query_params.items():
+        if key in AVAILABLE_FILTERS:
+            expected_type = AVAILABLE_FILTERS[key]
+
+            # 리스트 처리 (loc_codes, job_codes)
+            if key in LIST_FILTERS and isinstance(value, str):
+                filters[key] = [int(v) for v in value.split(',') if v]  # 예: "loc_codes=1,2,3"
+            else:
+                # 기본적으로 문자열을 적절한 타입으로 변환
+                if expected_type == int:
+                    filters[key] = int(value)
+                elif expected_type == str:
+                    filters[key] = value
+                else:
+                    filters[key] = value  # 다른 경우 처리 (예: 날짜나 복합 조건)
+
+    # 필터 유효성 검사
+    validation_result = validate_filters(filters)
+    if not validation_result['success']:
+        return filters, validation_result
+
+    # loc_codes_expand=descendants 이면 1차 지역 코드를 하위 지역 코드까지 확장
+    loc_codes_expand = query_params.get('loc_codes_expand')
+    if loc_codes_expand:
+        if loc_codes_expand != LOC_CODES_EXPAND_DESCENDANTS:
+            return filters, {"success": False, "message": "Not valid loc_codes_expand option."}
+        if filters.get('loc_codes_match', CODE_MATCH_ANY) != CODE_MATCH_ANY:
+            return filters, {"success": False, "message": "loc_codes_expand requires loc_codes_match=any."}
+        if 'loc_codes' in filters:
+            code_table_cache.ensure_loaded(get_db_session)
+            filters['loc_codes'] = code_table_cache.expand_loc_codes(filters['loc_codes'])
+
+    return filters, validation_result
+
+def get_applications_list(query_params, user_id=None):
     """
     채용 공고 목록을 조회합니다.
     Args:
         query_params (dict): 쿼리 파라미터
+        user_id (str): 로그인한 사용자 ID (있으면 각 공고에 is_bookmarked 추가)
     Returns:
         tuple: (bool, dict, str, int) - 성공 여부, 결과 데이터, 메시지, HTTP 상태 코드
     """
     try:
-        db = next(get_db())
+        db = get_db_session(identity=user_id)
         page = int(query_params.get('page', 1))
         per_page = 20
 
         # 정렬 기준 설정
         sort_by = query_params.get('sort_by', "deadline_date")  # 기본 정렬: deadline_date
-        if sort_by not in ['deadline_date', 'last_updated_date', 'edu_code', 'sal_code', 'poster_title']:
+        if sort_by not in ['deadline_date', 'last_updated_date', 'edu_code', 'sal_code', 'poster_title', 'relevance']:
             return False, None, "Not valid sorting option.", 400
+        if sort_by == 'relevance' and not query_params.get('title_contains'):
+            return False, None, "Sorting by relevance requires title_contains.", 400
 
         sort_order = query_params.get('sort_order', 'asc')  # 정렬 순서: 내림차순('desc') 1, 오름차순('asc') 0
         sort_criteria = {sort_by: {'sorting_method': 0 if sort_order == 'asc' else 1}}
 
-        # 필터링 조건 설정 (query_params에서 바로 추출)
-        filters = {}
-        for key, value in query_params.items():
-            if key in AVAILABLE_FILTERS:
-                expected_type = AVAILABLE_FILTERS[key]
+        # total_count 계산 방식 (estimate: 캐시 사용, exact: 항상 계산, none: 생략하고 has_next만 반환)
+        count_mode = query_params.get('count', COUNT_MODE_ESTIMATE)
+        if count_mode not in COUNT_MODES:
+            return False, None, "Not valid count option.", 400
 
-                # 리스트 처리 (loc_codes, job_codes)
-                if isinstance(expected_type, int) and isinstance(value, str) and ',' in value:
-                    filters[key] = [int(v) for v in value.split(',')]  # 예: "loc_codes=1,2,3"
-                else:
-                    # 기본적으로 문자열을 적절한 타입으로 변환
-                    if expected_type == int:
-                        filters[key] = int(value)
-                    elif expected_type == str:
-                        filters[key] = value
-                    else:
-                        filters[key] = value  # 다른 경우 처리 (예: 날짜나 복합 조건)
-
-        # 필터 유효성 검사
-        validation_result = validate_filters(filters)
+        # expand=codes 이면 코드 이름을 함께 반환
+        expand = query_params.get('expand')
+        if expand and expand != EXPAND_CODES:
+            return False, None, "Not valid expand option.", 400
+
+        # fields=poster_id,poster_title 처럼 응답에 포함할 필드를 선택 (sparse fieldset)
+        try:
+            fields = resolve_fields(query_params.get('fields'), BRIEF_FIELDS)
+        except ValueError as e:
+            return False, None, str(e), 400
+
+        # 필터링 조건 설정 및 유효성 검사
+        filters, validation_result = parse_filters(query_params)
         if not validation_result['success']:
             return False, None, validation_result['message'], 400
 
-        # 데이터베이스에서 채용 공고 조회
-        result = get_available_job_postings(
-            db=db,
-            page=page,
-            item_counts=per_page,
-            filters=filters,
-            sort_criteria=sort_criteria,
-        )
+        # 커서 모드: cursor 파라미터가 있으면(첫 페이지는 빈 값) OFFSET 대신 키셋 페이징 사용
+        if 'cursor' in query_params:
+            if sort_by == 'relevance':
+                return False, None, "Cursor pagination does not support sorting by relevance.", 400
+            cursor = None
+            if query_params['cursor']:
+                try:
+                    cursor = decode_cursor(query_params['cursor'], sort_by, sort_order)
+                except ValueError as e:
+                    return False, None, str(e), 400
+
+            result = get_available_job_postings_by_cursor(
+                db=db,
+                item_counts=per_page,
+                filters=filters,
+                sort_criteria=sort_criteria,
+                cursor=cursor,
+                fields=fields,
+            )
+            if not result['success']:
+                return False, None, result['message'], 400
+
+            data = result['data']
+            if data['next_cursor'] is not None:
+                data['next_cursor'] = encode_cursor(sort_by, sort_order, data['next_cursor'])
+            if expand == EXPAND_CODES:
+                expand_codes(data['postings'])
+            if user_id:
+                annotate_bookmarks(db, data['postings'], user_id)
+            return True, data, "채용 공고 목록을 성공적으로 조회했습니다.", 200
+
+        # 인메모리 검색 인덱스로 처리 가능한 경우 DB를 조회하지 않음
+        if current_app.config.get('POSTING_INDEX_ENABLED') and posting_index.can_answer(filters, sort_criteria):
+            result = posting_index.search(
+                page=page,
+                item_counts=per_page,
+                filters=filters,
+                sort_criteria=sort_criteria,
+                count_mode=count_mode,
+                fields=fields,
+            )
+        else:
+            # 데이터베이스에서 채용 공고 조회
+            result = get_available_job_postings(
+                db=db,
+                page=page,
+                item_counts=per_page,
+                filters=filters,
+                sort_criteria=sort_criteria,
+                count_mode=count_mode,
+                fields=fields,
+            )
 
         if result['success']:
+            if expand == EXPAND_CODES:
+                expand_codes(result['data']['postings'])
+            if user_id:
+                annotate_bookmarks(db, result['data']['postings'], user_id)
             return True, result['data'], "채용 공고 목록을 성공적으로 조회했습니다.", 200
         else:
             return False, None, result['message'], 400
@@ -135,29 +299,61 @@ def get_applications_list(query_params):
     except Exception as e:
         return False, None, str(e), 500
 
-def get_application(query_params, poster_id):
+def get_job_facets(query_params):
+    """
+    채용 공고 목록과 동일한 필터 조건에서 facet(급여, 학력, 1차 지역, 직무)별 공고 개수를 조회합니다.
+    Args:
+        query_params (dict): 쿼리 파라미터 (get_applications_list와 동일한 필터)
+    Returns:
+        tuple: (bool, dict, str, int) - 성공 여부, 결과 데이터, 메시지, HTTP 상태 코드
+    """
+    try:
+        db = get_db_session()
+
+        # 필터링 조건 설정 및 유효성 검사
+        filters, validation_result = parse_filters(query_params)
+        if not validation_result['success']:
+            return False, None, validation_result['message'], 400
+
+        # 인메모리 검색 인덱스가 로드되어 있으면 비트맵 교집합으로 계산
+        if current_app.config.get('POSTING_INDEX_ENABLED') and posting_index.loaded:
+            result = posting_index.facets(filters)
+        else:
+            result = get_available_job_posting_facets(db, filters)
+
+        if result['success']:
+            return True, result['data'], "채용 공고 facet 정보를 성공적으로 조회했습니다.", 200
+        else:
+            return False, None, result['message'], 400
+
+    except Exception as e:
+        return False, None, str(e), 500
+
+def get_application(query_params, poster_id, user_id=None):
     """
     특정 채용 공고를 조회하고, 조회할 때 view_cnts 값을 1 증가시킵니다.
+    조회수 증가분은 view_counter에 모았다가 일괄 반영하므로, 응답의 view_cnts에는 반영 대기 중인 증가분을 더합니다.
     Args:
         query_params (dict): 쿼리 파라미터 (필요 시 사용)
         poster_id (int): 조회할 채용 공고 ID
+        user_id (str): 로그인한 사용자 ID (있으면 is_bookmarked 추가)
     Returns:
         tuple: (bool, dict, str, int) - 성공 여부, 결과 데이터, 메시지, HTTP 상태 코드
     """
     try:
-        db = next(get_db())
-        
-        # view_cnts 값을 1 증가
-        increment_result = increment_view_count(db, poster_id)
-        
-        if not increment_result['success']:
-            return False, None, increment_result['message'], 500
-        
+        db = get_db_session(identity=user_id)
+
         # 특정 채용 공고 ID로 데이터 조회
         result = get_job_posting_by_id(db, poster_id)
-        
+
         if result['success']:
-            return True, result['posting'], "채용 공고를 성공적으로 조회했습니다.", 200
+            # view_cnts 값을 1 증가 (write-behind)
+            view_counter.increment(poster_id)
+            posting = result['posting']
+            posting['view_cnts'] += view_counter.pending(poster_id)
+            if user_id:
+                posting['is_bookmarked'] = poster_id in bookmark_cache.get(db, user_id)
+            return True, posting, "채용 공고를 성공적으로 조회했습니다.", 200
         else:
             return False, None, result['message'], 404
 
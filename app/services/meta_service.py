@@ -1,16 +1,28 @@
-from ..models.database import get_db
-from ..models.sal_code import *
-from ..models.edu_code import *
-from ..models.job_code import *
-from ..models.loc_code import *
+from ..models.database import get_db_session
+from ..models.code_cache import code_table_cache
 
+# 코드 테이블은 DB를 조회하지 않고 code_table_cache(메모리)에서 응답합니다.
+# 코드 테이블이 변경되면 code_table_cache.invalidate()/reload(db)로 갱신합니다.
+
+def _ensure_code_tables():
+    code_table_cache.ensure_loaded(get_db_session)
+
+def get_meta_etag(table, variant=None):
+    """
+    코드 테이블 응답의 강한 ETag를 반환합니다.
+    Args:
+        table (str): sal, edu, job, loc 중 하나
+        variant (str): 같은 테이블의 서로 다른 응답을 구분하는 값 (예: 페이지 번호, 코드)
+    """
+    _ensure_code_tables()
+    return code_table_cache.etag(table, variant)
 
 def get_salary_table(data):
-    db = next(get_db())
     page = int(data.get("page", "1"))
     _data = {}
     try:
-        result = get_sal_codes(db, page)
+        _ensure_code_tables()
+        result = code_table_cache.get_page("sal", page)
         if result['success']:
             _data = result['data']
             return True, _data, "Salary 테이블 조회에 성공했습니다.", 200
@@ -21,11 +33,11 @@ def get_salary_table(data):
 
 
 def get_education_table(data):
-    db = next(get_db())
     page = int(data.get("page", "1"))
     _data = {}
     try:
-        result = get_edu_codes(db, page)
+        _ensure_code_tables()
+        result = code_table_cache.get_page("edu", page)
         if result['success']:
             _data = result['data']
             return True, _data, "Education 테이블 조회에 성공했습니다.", 200
@@ -35,11 +47,11 @@ def get_education_table(data):
         return False, {}, str(e), 500
 
 def get_job_table(data):
-    db = next(get_db())
     page = int(data.get("page", "1"))
     _data = {}
     try:
-        result = get_job_codes(db, page)
+        _ensure_code_tables()
+        result = code_table_cache.get_page("job", page)
         if result['success']:
             _data = result['data']
             return True, _data, "job 테이블 조회에 성공했습니다.", 200
@@ -47,13 +59,12 @@ def get_job_table(data):
             return False, {}, result["message"], 400
     except Exception as e:
         return False, {}, str(e), 500
-    
+
 def get_job_name(job_id):
-    db = next(get_db())
-    
     _data = {}
     try:
-        result = get_job_code_by_id(db, job_id)
+        _ensure_code_tables()
+        result = code_table_cache.get_by_id("job", job_id)
         if result['success']:
             _data = result['job_code']
             return True, _data, "job name 조회에 성공했습니다.", 200
@@ -63,11 +74,11 @@ def get_job_name(job_id):
         return False, {}, str(e), 500
 
 def get_location_table(data):
-    db = next(get_db())
     page = int(data.get("page", "1"))
     _data = {}
     try:
-        result = get_loc_codes(db, page)
+        _ensure_code_tables()
+        result = code_table_cache.get_page("loc", page)
         if result['success']:
             _data = result['data']
             return True, _data, "조회에 성공했습니다.", 200
@@ -75,18 +86,87 @@ def get_location_table(data):
             return False, {}, result["message"], 400
     except Exception as e:
         return False, {}, str(e), 500
-    
+
 
 def get_loc_data(loc_code):
-    db = next(get_db())
-    
     _data = {}
     try:
-        result = get_loc_code_by_id(db, loc_code)
+        _ensure_code_tables()
+        result = code_table_cache.get_by_id("loc", loc_code)
         if result['success']:
             _data = result['loc_code']
             return True, _data, "loc data 조회에 성공했습니다.", 200
         else:
             return False, {}, result["message"], 400
     except Exception as e:
-        return False, {}, str(e), 500
\ No newline at end of file
+        return False, {}, str(e), 500
+
+# 한 번에 조회할 수 있는 최대 코드 개수
+MAX_BATCH_IDS = 200
+
+def parse_ids(ids):
+    """
+    "1,2,3" 형태의 문자열을 중복 없는 정수 리스트로 변환합니다.
+    Raises:
+        ValueError: 정수가 아닌 값이 있거나, 비어 있거나, MAX_BATCH_IDS개를 넘는 경우
+    """
+    codes = []
+    for value in (ids or "").split(","):
+        value = value.strip()
+        if not value:
+            continue
+        code = int(value)
+        if code not in codes:
+            codes.append(code)
+    if not codes:
+        raise ValueError("ids is required.")
+    if len(codes) > MAX_BATCH_IDS:
+        raise ValueError(f"Too many ids, Value should be at most {MAX_BATCH_IDS}.")
+    return codes
+
+def get_job_names(ids):
+    """
+    여러 job_code의 job_name을 한 번에 조회합니다.
+    Args:
+        ids (str): 쉼표로 구분된 job_code 목록 (예: "1,2,3")
+    """
+    try:
+        codes = parse_ids(ids)
+    except ValueError as e:
+        return False, {}, str(e), 400
+    try:
+        _ensure_code_tables()
+        result = code_table_cache.get_by_ids("job", codes)
+        _data = {"job_codes": result["job_codes"], "not_found": result["not_found"]}
+        return True, _data, "job name 조회에 성공했습니다.", 200
+    except Exception as e:
+        return False, {}, str(e), 500
+
+def get_loc_datas(ids):
+    """
+    여러 loc_code의 지역 정보를 한 번에 조회합니다.
+    Args:
+        ids (str): 쉼표로 구분된 loc_code 목록 (예: "101000,101010")
+    """
+    try:
+        codes = parse_ids(ids)
+    except ValueError as e:
+        return False, {}, str(e), 400
+    try:
+        _ensure_code_tables()
+        result = code_table_cache.get_by_ids("loc", codes)
+        _data = {"loc_codes": result["loc_codes"], "not_found": result["not_found"]}
+        return True, _data, "loc data 조회에 성공했습니다.", 200
+    except Exception as e:
+        return False, {}, str(e), 500
+
+def get_location_tree():
+    """
+    1차 지역(loc_mcode)별 하위 지역 트리 전체를 조회합니다. (코드 테이블 적재 시 한 번 생성)
+    """
+    try:
+        _ensure_code_tables()
+        _data = {"loc_tree": code_table_cache.get_loc_tree()}
+        return True, _data, "loc tree 조회에 성공했습니다.", 200
+    except Exception as e:
+        return False, {}, str(e), 500
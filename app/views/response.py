@@ -1,4 +1,6 @@
 # views/response.py
+from flask import current_app, request
+
 class JsonResponse:
     def __init__(self, success, data=None, message=None, status_code=200):
         self.success = success
@@ -20,6 +22,18 @@ class JsonResponse:
     def to_response(self):
         return self.to_dict(), self.status_code # 딕셔너리와 status_code를 함께 반환
 
+    def to_cached_response(self, etag, max_age=0):
+        """
+        ETag/Cache-Control 헤더를 붙여 반환합니다. (성공 응답만)
+        요청의 If-None-Match가 etag와 일치하면 본문 없이 304를 반환합니다.
+        """
+        if not self.success or etag is None:
+            return self.to_response()
+        headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+        if request.if_none_match.contains_weak(etag.strip('"')):
+            return current_app.response_class(status=304, headers=headers)
+        return self.to_dict(), self.status_code, headers
+
 # 알 수 없는 에러 처리
 def fail(message="실패", status_code=500):
     return {
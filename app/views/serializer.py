@@ -0,0 +1,64 @@
+# views/serializer.py
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import make_response
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 모듈 사용
+    orjson = None
+
+JSON_SERIALIZER_AUTO = "auto"      # orjson이 있으면 orjson, 없으면 json
+JSON_SERIALIZER_ORJSON = "orjson"
+JSON_SERIALIZER_JSON = "json"
+JSON_SERIALIZERS = (JSON_SERIALIZER_AUTO, JSON_SERIALIZER_ORJSON, JSON_SERIALIZER_JSON)
+
+def _default(obj):
+    """기본 인코더가 처리하지 못하는 타입 변환 (date/datetime은 ISO 8601 문자열)"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(data) -> bytes:
+    """표준 json 모듈로 직렬화합니다."""
+    return json.dumps(data, ensure_ascii=False, default=_default).encode("utf-8")
+
+def dumps_orjson(data) -> bytes:
+    """
+    orjson으로 직렬화합니다.
+    date/datetime은 orjson이 직접 ISO 8601 문자열로 변환하며, 정수 키(코드 -> 행 매핑 등)도 허용합니다.
+    """
+    return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+def get_serializer(name: str = JSON_SERIALIZER_AUTO):
+    """
+    이름에 해당하는 직렬화 함수(data -> bytes)를 반환합니다.
+    Raises:
+        ValueError: 알 수 없는 이름이거나, orjson을 지정했지만 설치되어 있지 않은 경우
+    """
+    if name not in JSON_SERIALIZERS:
+        raise ValueError(f"Invalid json serializer: {name}, Value should be one of {list(JSON_SERIALIZERS)}.")
+    if name == JSON_SERIALIZER_ORJSON and orjson is None:
+        raise ValueError("orjson is not installed.")
+    if name == JSON_SERIALIZER_JSON or orjson is None:
+        return dumps_json
+    return dumps_orjson
+
+def init_api(api, name: str = JSON_SERIALIZER_AUTO):
+    """flask-restx Api의 application/json 응답 직렬화를 지정한 serializer로 교체합니다."""
+    dumps = get_serializer(name)
+
+    def output_json(data, code, headers=None):
+        response = make_response(dumps(data), code)
+        response.headers.extend(headers or {})
+        response.mimetype = "application/json"
+        return response
+
+    api.representations["application/json"] = output_json
+    return dumps
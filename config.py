@@ -25,11 +25,80 @@ class Config:
     MySQL_DB_PASSWORD = os.getenv('MySQL_DB_PASSWORD', 'root')
     MySQL_DB_NAME = os.getenv('MySQL_DB_NAME', 'WSDa3')
 
-    # Redis Configuration (현재 사용하지 않음)
+    # 읽기 전용 replica 설정 (MySQL_REPLICA_DB_URL이 없으면 모든 쿼리를 primary로 보냄, 계정/DB 이름은 primary와 동일)
+    MySQL_REPLICA_DB_URL = os.getenv('MySQL_REPLICA_DB_URL', '')
+    MySQL_REPLICA_DB_PORT = int(os.getenv('MySQL_REPLICA_DB_PORT', str(MySQL_DB_PORT)))
+    DB_REPLICA_STICKY_SECONDS = float(os.getenv('DB_REPLICA_STICKY_SECONDS', '5'))  # 쓰기 후 해당 사용자의 읽기를 primary로 보내는 시간 (초)
+
+    # SQLAlchemy 엔진/커넥션 풀 설정 (워커 프로세스마다 pool_size + max_overflow 만큼 커넥션을 사용할 수 있음)
+    DB_ECHO = string_to_bool(os.getenv('DB_ECHO', 'False'))  # 실행되는 SQL 출력 여부
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))  # 풀에 유지할 커넥션 수
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))  # pool_size를 넘어 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '30'))  # 커넥션을 얻기 위해 기다리는 최대 시간 (초)
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '3600'))  # 커넥션 재생성 주기 (초, MySQL wait_timeout보다 짧게)
+    DB_POOL_PRE_PING = string_to_bool(os.getenv('DB_POOL_PRE_PING', 'True'))  # checkout 시 커넥션 유효성 검사
+    DB_ISOLATION_LEVEL = os.getenv('DB_ISOLATION_LEVEL', '')  # 예: READ COMMITTED (비어 있으면 DB 기본값)
+    DB_POOL_WARM_UP = string_to_bool(os.getenv('DB_POOL_WARM_UP', 'True'))  # 앱 생성 시 pool_size만큼 커넥션을 미리 열기
+
+    # Redis Configuration (VIEW_COUNTER_BACKEND=redis 또는 REFRESH_TOKEN_CACHE_BACKEND=redis 인 경우 사용)
     REDIS_DB_URL = os.getenv('REDIS_DB_URL', '127.0.0.1')
     REDIS_DB_PORT = int(os.getenv('REDIS_DB_PORT', '6379'))
     REDIS_DB_PASSWORD = os.getenv('REDIS_DB_PASSWORD', '')
 
+    # 채용 공고 목록 인메모리 검색 인덱스 설정
+    POSTING_INDEX_ENABLED = string_to_bool(os.getenv('POSTING_INDEX_ENABLED', 'False'))
+    POSTING_INDEX_REFRESH_SECONDS = int(os.getenv('POSTING_INDEX_REFRESH_SECONDS', '30'))  # 변경분 반영 주기 (초, 백그라운드 스레드에서 실행)
+    POSTING_CHANGE_RETENTION_SECONDS = int(os.getenv('POSTING_CHANGE_RETENTION_SECONDS', '86400'))  # JobPostingChange 변경 로그 보존 기간 (초)
+
+    # 제목 검색(title_contains) 설정
+    TITLE_SEARCH_STRATEGY = os.getenv('TITLE_SEARCH_STRATEGY', '')  # like, fulltext, inverted (비어 있으면 MySQL은 fulltext, 그 외는 inverted)
+    TITLE_RELEVANCE_MAX_CANDIDATES = int(os.getenv('TITLE_RELEVANCE_MAX_CANDIDATES', '1000'))  # like/inverted 전략의 sort_by=relevance에서 점수를 계산할 최대 검색 결과 수 (최근 수정순)
+
+    # 응답 JSON 직렬화 방식 (auto: orjson이 설치되어 있으면 orjson, 없으면 json)
+    JSON_SERIALIZER = os.getenv('JSON_SERIALIZER', 'auto')  # auto, orjson, json
+
+    # 응답 압축 설정 (Accept-Encoding에 따라 brotli(설치된 경우) 또는 gzip)
+    COMPRESSION_ENABLED = string_to_bool(os.getenv('COMPRESSION_ENABLED', 'True'))
+    COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '500'))  # 이 크기(바이트) 미만의 응답은 압축하지 않음
+    COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))  # 매 요청 압축 시 gzip 압축 레벨 (1~9)
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4'))  # 매 요청 압축 시 brotli 품질 (0~11)
+    COMPRESSION_CACHE_SIZE = int(os.getenv('COMPRESSION_CACHE_SIZE', '256'))  # 압축 결과를 재사용하는 응답(코드 테이블, swagger 명세) 캐시 개수
+
+    # 코드 테이블(/metas) 응답의 Cache-Control max-age (초), 만료 후에는 ETag로 재검증(304)
+    META_CACHE_MAX_AGE = int(os.getenv('META_CACHE_MAX_AGE', '3600'))
+
+    # 채용 공고 조회수 write-behind 카운터 설정
+    VIEW_COUNTER_BACKEND = os.getenv('VIEW_COUNTER_BACKEND', 'memory')  # memory 또는 redis
+    VIEW_COUNTER_FLUSH_SECONDS = float(os.getenv('VIEW_COUNTER_FLUSH_SECONDS', '5'))  # 조회수 반영 주기 (초)
+    VIEW_COUNTER_FLUSH_THRESHOLD = int(os.getenv('VIEW_COUNTER_FLUSH_THRESHOLD', '100'))  # 이 개수만큼 쌓이면 주기와 관계없이 반영
+
+    # 사용자별 북마크 집합 캐시 (/jobs 응답의 is_bookmarked)
+    BOOKMARK_CACHE_MAX_USERS = int(os.getenv('BOOKMARK_CACHE_MAX_USERS', '10000'))  # 캐시할 최대 사용자 수 (LRU)
+    BOOKMARK_CACHE_TTL_SECONDS = float(os.getenv('BOOKMARK_CACHE_TTL_SECONDS', '300'))  # 다른 노드의 변경을 반영하기 위해 다시 적재하는 주기 (초)
+
+    # refresh token 폐기 여부 캐시 (Login 테이블 조회를 줄임)
+    REFRESH_TOKEN_CACHE_BACKEND = os.getenv('REFRESH_TOKEN_CACHE_BACKEND', 'memory')  # memory 또는 redis
+    REFRESH_TOKEN_CACHE_TTL_SECONDS = float(os.getenv('REFRESH_TOKEN_CACHE_TTL_SECONDS', '30'))  # 캐시 유지 시간 (초), memory에서 다른 프로세스의 로그아웃이 반영되기까지 걸리는 최대 시간, 0이면 캐시 사용 안 함
+    REFRESH_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv('REFRESH_TOKEN_CACHE_MAX_ENTRIES', '100000'))  # memory 백엔드에서 캐시할 최대 토큰 수 (LRU)
+
+    # 감사 로그(LoginLog) writer 설정
+    AUDIT_LOG_MODE = os.getenv('AUDIT_LOG_MODE', 'async')  # async: 백그라운드 스레드에서 일괄 저장, sync: 요청 중에 바로 저장
+    AUDIT_LOG_QUEUE_SIZE = int(os.getenv('AUDIT_LOG_QUEUE_SIZE', '10000'))  # 저장 대기 중인 로그의 최대 개수
+    AUDIT_LOG_BATCH_SIZE = int(os.getenv('AUDIT_LOG_BATCH_SIZE', '500'))  # INSERT 한 번에 저장할 최대 로그 수
+    AUDIT_LOG_FLUSH_SECONDS = float(os.getenv('AUDIT_LOG_FLUSH_SECONDS', '1'))  # 로그가 없을 때 종료 신호를 확인하는 주기 (초)
+    AUDIT_LOG_PUT_TIMEOUT = float(os.getenv('AUDIT_LOG_PUT_TIMEOUT', '0.5'))  # 큐가 가득 찼을 때 기다리는 시간 (초), 이후에는 요청 중에 바로 저장
+
+    # 만료된 Login 정리 설정 (flask --app run sweep-logins 로도 실행 가능)
+    LOGIN_SWEEPER_ENABLED = string_to_bool(os.getenv('LOGIN_SWEEPER_ENABLED', 'False'))  # True인 경우 애플리케이션에서 주기적으로 실행
+    LOGIN_SWEEP_INTERVAL_SECONDS = float(os.getenv('LOGIN_SWEEP_INTERVAL_SECONDS', '3600'))  # 실행 주기 (초)
+    LOGIN_SWEEP_BATCH_SIZE = int(os.getenv('LOGIN_SWEEP_BATCH_SIZE', '1000'))  # 한 번에(한 커밋으로) 삭제할 행 수
+    LOGIN_MAX_SESSIONS_PER_USER = int(os.getenv('LOGIN_MAX_SESSIONS_PER_USER', '10'))  # 사용자별로 남길 최근 로그인 수, 0이면 제한 없음
+
+    # 마감된 채용 공고 상태 변경 설정 (flask --app run expire-postings 로도 실행 가능)
+    POSTING_EXPIRER_ENABLED = string_to_bool(os.getenv('POSTING_EXPIRER_ENABLED', 'False'))  # True인 경우 애플리케이션에서 주기적으로 실행
+    POSTING_EXPIRE_INTERVAL_SECONDS = float(os.getenv('POSTING_EXPIRE_INTERVAL_SECONDS', '86400'))  # 실행 주기 (초)
+    POSTING_EXPIRE_BATCH_SIZE = int(os.getenv('POSTING_EXPIRE_BATCH_SIZE', '1000'))  # 한 번에(한 커밋으로) 변경할 행 수
+
     # JWT Configuration
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'your-secret-key')
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=int(os.getenv('JWT_ACCESS_TOKEN_EXPIRES', '15')))  # 기본 15분
@@ -787,6 +787,11 @@ class DBInitializer:
             poster_status INT NOT NULL,
             poster_writer_user_id VARCHAR(255) NOT NULL,
             view_cnts INT NOT NULL,
+            FULLTEXT INDEX ft_poster_title (poster_title) WITH PARSER ngram,
+            INDEX ix_job_posting_status_deadline (poster_status, deadline_date),
+            INDEX ix_job_posting_deadline_date (deadline_date),
+            INDEX ix_job_posting_last_updated_date (last_updated_date),
+            INDEX ix_job_posting_poster_title (poster_title),
             FOREIGN KEY (comp_id) REFERENCES Company(comp_id),
             FOREIGN KEY (edu_code) REFERENCES EduCode(edu_code),
             FOREIGN KEY (sal_code) REFERENCES SalCode(sal_code),
@@ -889,6 +894,7 @@ class DBInitializer:
             poster_id VARCHAR(255),
             application TEXT,
             application_status INT,
+            UNIQUE KEY uq_user_applicated_user_poster (user_id, poster_id),
             FOREIGN KEY (user_id) REFERENCES User(user_id) ON DELETE CASCADE,
             FOREIGN KEY (poster_id) REFERENCES JobPosting(poster_id) ON DELETE CASCADE
         ) ENGINE=InnoDB
@@ -907,6 +913,7 @@ class DBInitializer:
             user_id VARCHAR(255),
             poster_id VARCHAR(255),
             applicate_action INT,
+            INDEX ix_user_applicated_log_user_applicated_at (user_id, applicated_at),
             FOREIGN KEY (user_id) REFERENCES User(user_id) ON DELETE CASCADE,
             FOREIGN KEY (poster_id) REFERENCES JobPosting(poster_id) ON DELETE CASCADE
         ) ENGINE=InnoDB
@@ -922,10 +929,13 @@ class DBInitializer:
             refresh_id INT AUTO_INCREMENT PRIMARY KEY,
             user_id VARCHAR(255),
             refresh_token TEXT,
+            refresh_jti VARCHAR(64),
             created_at DATETIME,
             expires_at DATETIME,
             login_device_info TEXT,
             login_ip VARCHAR(255),
+            UNIQUE INDEX uq_login_refresh_jti (refresh_jti),
+            INDEX ix_login_expires_at (expires_at),
             FOREIGN KEY (user_id) REFERENCES User(user_id) ON DELETE CASCADE
         ) ENGINE=InnoDB
         """
@@ -943,14 +953,29 @@ class DBInitializer:
             login_ip VARCHAR(255),
             login_device_info TEXT,
             login_success INT,
+            INDEX ix_login_log_login_id_login_date (login_id, login_date),
             FOREIGN KEY (login_id) REFERENCES User(user_id) ON DELETE CASCADE
         ) ENGINE=InnoDB
         """
         self.create_table("LoginLog", sql_query)
 
+    def _create_job_posting_change_table(self):
+        """
+        JobPostingChange 테이블을 생성합니다. (공고 변경 로그, 외래 키 없음)
+        """
+        sql_query = """
+        CREATE TABLE JobPostingChange (
+            change_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            poster_id VARCHAR(255) NOT NULL,
+            changed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            INDEX ix_job_posting_change_changed_at (changed_at)
+        ) ENGINE=InnoDB
+        """
+        self.create_table("JobPostingChange", sql_query)
+
     def create_all_additional_tables(self):
         """
-        추가된 5개의 테이블을 생성합니다.
+        추가된 6개의 테이블을 생성합니다.
         """
         try:
             self._create_user_bookmark_table()
@@ -958,6 +983,7 @@ class DBInitializer:
             self._create_user_applicated_log_table()
             self._create_login_table()
             self._create_login_log_table()
+            self._create_job_posting_change_table()
             print("추가 테이블들이 성공적으로 생성되었습니다.")
         except pymysql.Error as err:
             print(f"추가 테이블 생성 중 오류 발생: {err}")
@@ -0,0 +1,41 @@
+# migrations/env.py
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app.models import Base, SQLALCHEMY_DATABASE_URI
+# 모든 테이블이 Base.metadata에 등록되도록 모델 모듈을 import (autogenerate 비교용)
+from app.models import (  # noqa: F401
+    company_group, company, user_level, user, edu_code, sal_code, loc_code, job_code,
+    job_posting, job_posting_job, job_posting_loc, job_posting_change, user_bookmark, user_applicated, user_applicated_log, login, login_log,
+)
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def get_url() -> str:
+    """alembic -x db_url=... 로 지정하지 않으면 .env의 MySQL_DB_* 설정으로 접속합니다."""
+    return context.get_x_argument(as_dictionary=True).get("db_url", SQLALCHEMY_DATABASE_URI)
+
+def run_migrations_offline() -> None:
+    """DB에 접속하지 않고 실행할 SQL을 출력합니다. (alembic upgrade head --sql)"""
+    context.configure(url=get_url(), target_metadata=target_metadata, literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    connectable = create_engine(get_url(), poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
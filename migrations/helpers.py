@@ -0,0 +1,65 @@
+# migrations/helpers.py
+"""
+마이그레이션에서 사용하는 스키마 변경 함수
+
+DB_init.py로 새로 만든 DB에는 인덱스가 이미 있고, 이전 버전으로 만든 DB에는 없으므로
+존재 여부를 확인한 뒤 생성/삭제합니다. (--sql 오프라인 모드에서는 확인 없이 SQL을 출력)
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+def _inspector():
+    return None if context.is_offline_mode() else sa.inspect(op.get_bind())
+
+def has_index(table_name: str, index_name: str) -> bool:
+    inspector = _inspector()
+    if inspector is None:
+        return False
+    names = {index["name"] for index in inspector.get_indexes(table_name)}
+    names |= {constraint["name"] for constraint in inspector.get_unique_constraints(table_name)}
+    return index_name in names
+
+def has_table(table_name: str) -> bool:
+    inspector = _inspector()
+    if inspector is None:
+        return False
+    return inspector.has_table(table_name)
+
+def has_column(table_name: str, column_name: str) -> bool:
+    inspector = _inspector()
+    if inspector is None:
+        return False
+    return column_name in {column["name"] for column in inspector.get_columns(table_name)}
+
+def create_index_if_not_exists(index_name: str, table_name: str, columns: list, unique: bool = False):
+    if not has_index(table_name, index_name):
+        op.create_index(index_name, table_name, columns, unique=unique)
+
+def drop_index_if_exists(index_name: str, table_name: str):
+    if context.is_offline_mode() or has_index(table_name, index_name):
+        op.drop_index(index_name, table_name=table_name)
+
+def add_column_if_not_exists(table_name: str, column: sa.Column):
+    if not has_column(table_name, column.name):
+        op.add_column(table_name, column)
+
+def drop_column_if_exists(table_name: str, column_name: str):
+    if context.is_offline_mode() or has_column(table_name, column_name):
+        op.drop_column(table_name, column_name)
+
+def create_fulltext_index_if_not_exists(index_name: str, table_name: str, column_name: str, parser: str = "ngram"):
+    """MySQL은 FULLTEXT 인덱스(WITH PARSER)를, 그 외 DB는 모델 선언과 같은 일반 인덱스를 생성합니다."""
+    if has_index(table_name, index_name):
+        return
+    if op.get_context().dialect.name == "mysql":
+        op.execute(f"CREATE FULLTEXT INDEX {index_name} ON {table_name}({column_name}) WITH PARSER {parser}")
+    else:
+        op.create_index(index_name, table_name, [column_name])
+
+def create_table_if_not_exists(table_name: str, *columns, **kwargs):
+    if not has_table(table_name):
+        op.create_table(table_name, *columns, **kwargs)
+
+def drop_table_if_exists(table_name: str):
+    if context.is_offline_mode() or has_table(table_name):
+        op.drop_table(table_name)
@@ -0,0 +1,29 @@
+"""initial schema
+
+DB_init.py로 생성한 기본 스키마(테이블과 외래 키)입니다.
+테이블은 DB_init.py가 데이터와 함께 생성하므로 이 revision은 변경 사항 없이 기준점 역할만 합니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,43 @@
+"""constraints and login jti
+
+- UserApplicated (user_id, poster_id) 유니크 키 (중복 지원 방지, 중복된 행이 있으면 먼저 정리해야 함)
+- Login.refresh_jti 컬럼과 유니크 인덱스 (refresh token 조회용, 추가 후 flask --app run backfill-login-jti 실행)
+- Login.expires_at 인덱스 (만료된 로그인 정리용)
+- JobPosting (poster_status, deadline_date) 인덱스 (게시 중인 공고 조회/마감 공고 정리용)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_if_not_exists, drop_index_if_exists, add_column_if_not_exists, drop_column_if_exists
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_if_not_exists('uq_user_applicated_user_poster', 'UserApplicated', ['user_id', 'poster_id'], unique=True)
+    add_column_if_not_exists('Login', sa.Column('refresh_jti', sa.String(64), nullable=True))
+    create_index_if_not_exists('uq_login_refresh_jti', 'Login', ['refresh_jti'], unique=True)
+    create_index_if_not_exists('ix_login_expires_at', 'Login', ['expires_at'])
+    create_index_if_not_exists('ix_job_posting_status_deadline', 'JobPosting', ['poster_status', 'deadline_date'])
+
+
+def downgrade() -> None:
+    drop_index_if_exists('ix_job_posting_status_deadline', 'JobPosting')
+    drop_index_if_exists('ix_login_expires_at', 'Login')
+    drop_index_if_exists('uq_login_refresh_jti', 'Login')
+    drop_column_if_exists('Login', 'refresh_jti')
+    # user_id 외래 키가 사용할 인덱스를 먼저 만든 뒤 유니크 키 삭제
+    create_index_if_not_exists('ix_user_applicated_user_id', 'UserApplicated', ['user_id'])
+    drop_index_if_exists('uq_user_applicated_user_poster', 'UserApplicated')
@@ -0,0 +1,44 @@
+"""query path indexes
+
+- UserApplicatedLog (user_id, applicated_at) 인덱스
+- LoginLog (login_id, login_date) 인덱스 (사용자별 로그인 기록 최신순 조회)
+- JobPosting 정렬 컬럼(deadline_date, last_updated_date, poster_title) 인덱스
+  (edu_code, sal_code는 외래 키 인덱스를 사용)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_if_not_exists, drop_index_if_exists
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_if_not_exists('ix_user_applicated_log_user_applicated_at', 'UserApplicatedLog', ['user_id', 'applicated_at'])
+    create_index_if_not_exists('ix_login_log_login_id_login_date', 'LoginLog', ['login_id', 'login_date'])
+    create_index_if_not_exists('ix_job_posting_deadline_date', 'JobPosting', ['deadline_date'])
+    create_index_if_not_exists('ix_job_posting_last_updated_date', 'JobPosting', ['last_updated_date'])
+    create_index_if_not_exists('ix_job_posting_poster_title', 'JobPosting', ['poster_title'])
+
+
+def downgrade() -> None:
+    drop_index_if_exists('ix_job_posting_poster_title', 'JobPosting')
+    drop_index_if_exists('ix_job_posting_last_updated_date', 'JobPosting')
+    drop_index_if_exists('ix_job_posting_deadline_date', 'JobPosting')
+    # 외래 키(user_id, login_id)가 사용할 인덱스를 먼저 만든 뒤 복합 인덱스 삭제
+    create_index_if_not_exists('ix_login_log_login_id', 'LoginLog', ['login_id'])
+    drop_index_if_exists('ix_login_log_login_id_login_date', 'LoginLog')
+    create_index_if_not_exists('ix_user_applicated_log_user_id', 'UserApplicatedLog', ['user_id'])
+    drop_index_if_exists('ix_user_applicated_log_user_applicated_at', 'UserApplicatedLog')
@@ -0,0 +1,32 @@
+"""job posting title fulltext index
+
+- JobPosting.poster_title FULLTEXT 인덱스 ft_poster_title (ngram parser, 제목 검색 fulltext 전략용)
+  DB_init.py로 만든 DB에는 이미 있으므로 없을 때만 생성합니다.
+  MySQL 이외의 DB(SQLite 등)에는 모델 선언과 같은 일반 인덱스를 생성합니다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import create_fulltext_index_if_not_exists, drop_index_if_exists
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_fulltext_index_if_not_exists('ft_poster_title', 'JobPosting', 'poster_title')
+
+
+def downgrade() -> None:
+    drop_index_if_exists('ft_poster_title', 'JobPosting')
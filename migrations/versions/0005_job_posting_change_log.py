@@ -0,0 +1,38 @@
+"""job posting change log
+
+- JobPostingChange 테이블 (공고 생성/수정/삭제/상태 변경 시 poster_id 기록)
+  검색 인덱스(POSTING_INDEX_ENABLED)가 전체 공고를 다시 읽지 않고 변경된 공고만 반영하는 데 사용합니다.
+- changed_at 인덱스 (변경분 조회와 오래된 로그 정리용)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import create_table_if_not_exists, drop_table_if_exists, create_index_if_not_exists
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_table_if_not_exists(
+        'JobPostingChange',
+        sa.Column('change_id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column('poster_id', sa.String(255), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    create_index_if_not_exists('ix_job_posting_change_changed_at', 'JobPostingChange', ['changed_at'])
+
+
+def downgrade() -> None:
+    drop_table_if_exists('JobPostingChange')
@@ -0,0 +1,30 @@
+# tests/conftest.py
+import os
+import sys
+
+# app.models는 import 시 .env의 MySQL_DB_* 값을 읽으므로, 설정이 없을 때 사용할 기본값을 지정
+os.environ.setdefault("MySQL_DB_URL", "localhost")
+os.environ.setdefault("MySQL_DB_PORT", "3306")
+os.environ.setdefault("MySQL_DB_USER", "test")
+os.environ.setdefault("MySQL_DB_PASSWORD", "test")
+os.environ.setdefault("MySQL_DB_NAME", "test")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    """모든 테이블을 만든 파일 기반 SQLite 엔진 (스레드마다 별도 커넥션 사용 가능)"""
+    from sqlalchemy import create_engine
+    from app.models import Base
+    # 모든 테이블이 Base.metadata에 등록되도록 모델 모듈을 import
+    from app.models import (  # noqa: F401
+        company_group, company, user_level, user, edu_code, sal_code, loc_code, job_code,
+        job_posting, job_posting_job, job_posting_loc, job_posting_change, user_bookmark, user_applicated, user_applicated_log, login, login_log,
+    )
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"timeout": 30})
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
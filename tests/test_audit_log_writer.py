@@ -0,0 +1,132 @@
+# tests/test_audit_log_writer.py
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.audit_log_writer import AuditLogWriter, AUDIT_LOG_MODE_ASYNC, AUDIT_LOG_MODE_SYNC
+from app.models.login_log import LoginLog
+
+WRITER_THREAD = "audit-log-writer"
+
+class GatedSessionFactory:
+    """
+    세션을 만든 스레드를 기록하는 세션 팩토리
+    gate가 닫혀 있으면 백그라운드 스레드(audit-log-writer)는 gate가 열릴 때까지 저장하지 못함
+    """
+    def __init__(self, engine):
+        self._factory = sessionmaker(bind=engine)
+        self.threads = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.writer_waiting = threading.Event()
+
+    def __call__(self):
+        name = threading.current_thread().name
+        self.threads.append(name)
+        if name == WRITER_THREAD and not self.gate.is_set():
+            self.writer_waiting.set()
+            self.gate.wait(timeout=5)
+        return self._factory()
+
+@pytest.fixture
+def session_factory(sqlite_engine):
+    return GatedSessionFactory(sqlite_engine)
+
+@pytest.fixture
+def writer():
+    writer = AuditLogWriter()
+    yield writer
+    writer.stop()
+
+def login_log_row(login_id):
+    return {"login_id": login_id, "login_date": datetime.utcnow(), "login_ip": None, "login_device_info": None, "login_success": 1}
+
+def saved_login_ids(session_factory) -> list:
+    db = session_factory._factory()
+    try:
+        return sorted(login_id for (login_id,) in db.query(LoginLog.login_id))
+    finally:
+        db.close()
+
+def wait_until(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+def test_async_writes_in_background_thread(writer, session_factory):
+    writer.configure(session_factory, mode=AUDIT_LOG_MODE_ASYNC, max_queue_size=10, flush_seconds=0.05)
+    writer.start()
+    for i in range(5):
+        writer.write(LoginLog, login_log_row(f"user-{i}"))
+
+    wait_until(lambda: len(saved_login_ids(session_factory)) == 5)
+    assert set(session_factory.threads) == {WRITER_THREAD}
+
+def test_full_queue_falls_back_to_inline_insert(writer, session_factory):
+    writer.configure(session_factory, mode=AUDIT_LOG_MODE_ASYNC, max_queue_size=2, batch_size=1, flush_seconds=0.05, put_timeout=0.05)
+    writer.start()
+    session_factory.gate.clear()
+
+    # 백그라운드 스레드가 첫 행을 저장하려다 멈춘 동안 큐(2개)를 채움
+    writer.write(LoginLog, login_log_row("queued-0"))
+    assert session_factory.writer_waiting.wait(timeout=5)
+    writer.write(LoginLog, login_log_row("queued-1"))
+    writer.write(LoginLog, login_log_row("queued-2"))
+    assert writer.pending() == 2
+
+    # 큐가 가득 차면 put_timeout 후 호출한 스레드에서 바로 저장
+    writer.write(LoginLog, login_log_row("inline"))
+    assert saved_login_ids(session_factory) == ["inline"]
+    assert session_factory.threads.count(threading.current_thread().name) == 1
+
+    session_factory.gate.set()
+    wait_until(lambda: len(saved_login_ids(session_factory)) == 4)
+
+def test_stop_drains_queue(writer, session_factory):
+    writer.configure(session_factory, mode=AUDIT_LOG_MODE_ASYNC, max_queue_size=10, batch_size=1, flush_seconds=0.05)
+    writer.start()
+    session_factory.gate.clear()
+
+    writer.write(LoginLog, login_log_row("user-0"))
+    assert session_factory.writer_waiting.wait(timeout=5)
+    for i in range(1, 4):
+        writer.write(LoginLog, login_log_row(f"user-{i}"))
+    assert writer.pending() == 3
+
+    # 종료 시 백그라운드 스레드를 멈추고 큐에 남은 로그를 모두 저장
+    session_factory.gate.set()
+    writer.stop()
+    assert writer.pending() == 0
+    assert saved_login_ids(session_factory) == ["user-0", "user-1", "user-2", "user-3"]
+
+def test_sync_mode_writes_immediately(writer, session_factory):
+    writer.configure(session_factory, mode=AUDIT_LOG_MODE_SYNC)
+    writer.start()  # sync 모드에서는 백그라운드 스레드를 시작하지 않음
+
+    writer.write(LoginLog, login_log_row("user-1"))
+    assert saved_login_ids(session_factory) == ["user-1"]
+    assert WRITER_THREAD not in session_factory.threads
+    assert writer.pending() == 0
+
+def test_invalid_mode_is_rejected(writer, session_factory):
+    with pytest.raises(ValueError):
+        writer.configure(session_factory, mode="batch")
+
+def test_bad_row_does_not_drop_rest_of_batch(writer, session_factory):
+    writer.configure(session_factory, mode=AUDIT_LOG_MODE_ASYNC, max_queue_size=10, batch_size=100, flush_seconds=0.05)
+    writer.start()
+    session_factory.gate.clear()
+
+    # 백그라운드 스레드가 멈춘 동안 쌓인 행은 stop()에서 한 배치로 저장됨 (login_id가 NULL인 행은 NOT NULL 위반)
+    writer.write(LoginLog, login_log_row("user-0"))
+    assert session_factory.writer_waiting.wait(timeout=5)
+    for login_id in ("user-1", None, "user-2"):
+        writer.write(LoginLog, login_log_row(login_id))
+    session_factory.gate.set()
+    writer.stop()
+
+    assert saved_login_ids(session_factory) == ["user-0", "user-1", "user-2"]
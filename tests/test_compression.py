@@ -0,0 +1,40 @@
+# tests/test_compression.py
+import gzip
+import json
+
+from flask import Flask, jsonify
+
+from app.middlewares.compression import Compression
+
+def make_app():
+    app = Flask(__name__)
+
+    # 두 URL이 같은 ETag를 만드는 경우 (meta 라우트의 job-<ver>-<page> / job-<ver>-<ids> 와 같은 형태)
+    @app.route("/items")
+    def items():
+        response = jsonify({"kind": "page", "values": list(range(300))})
+        response.set_etag("job-1-1")
+        return response
+
+    @app.route("/items/batch")
+    def items_batch():
+        response = jsonify({"kind": "batch", "values": list(range(300, 600))})
+        response.set_etag("job-1-1")
+        return response
+
+    Compression._cache.clear()
+    Compression.init_app(app)
+    return app
+
+def get_json(client, url):
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    return json.loads(gzip.decompress(response.get_data()))
+
+def test_same_etag_on_different_urls_is_not_shared():
+    client = make_app().test_client()
+
+    assert get_json(client, "/items?page=1")["kind"] == "page"
+    assert get_json(client, "/items/batch?ids=1")["kind"] == "batch"
+    # 캐시된 압축 결과도 URL별로 재사용
+    assert get_json(client, "/items?page=1")["kind"] == "page"
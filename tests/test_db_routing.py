@@ -0,0 +1,95 @@
+# tests/test_db_routing.py
+"""
+primary/replica 라우팅(RoutingSession, get_db_session) 테스트
+primary와 replica를 서로 다른 SQLite 파일로 만들고, 같은 행에 다른 값을 넣어 어느 DB에서 읽었는지 확인합니다.
+"""
+import time
+
+import pytest
+from sqlalchemy import create_engine, update
+
+from app.models import Base, database
+from app.models.sal_code import SalCode
+
+STICKY_SECONDS = 0.3
+
+@pytest.fixture
+def routed(tmp_path, monkeypatch):
+    engines = {}
+    for name in ("primary", "replica"):
+        engines[name] = create_engine(f"sqlite:///{tmp_path / f'{name}.db'}")
+        Base.metadata.create_all(engines[name], tables=[SalCode.__table__])
+        with engines[name].begin() as conn:
+            conn.execute(SalCode.__table__.insert(), [{"sal_code": 1, "sal_name": name}])
+
+    monkeypatch.setattr(database, "engine", engines["primary"])
+    monkeypatch.setattr(database, "replica_engine", engines["replica"])
+    monkeypatch.setattr(database.Config, "DB_REPLICA_STICKY_SECONDS", STICKY_SECONDS)
+    monkeypatch.setattr(database, "_recent_writes", {})
+    database.db_session.remove()
+    yield engines
+    database.db_session.remove()
+    for engine in engines.values():
+        engine.dispose()
+
+def read_name(db) -> str:
+    return db.query(SalCode.sal_name).filter(SalCode.sal_code == 1).scalar()
+
+def stored_names(engine) -> list:
+    with engine.connect() as conn:
+        return [row.sal_name for row in conn.execute(SalCode.__table__.select().order_by(SalCode.sal_code))]
+
+def new_request(identity: str = None):
+    """이전 요청의 세션을 정리하고 새 요청의 세션을 반환합니다."""
+    database.remove_db_session()
+    return database.get_db_session(identity=identity)
+
+def test_plain_reads_go_to_replica(routed):
+    db = new_request()
+    assert read_name(db) == "replica"
+    assert read_name(db) == "replica"
+
+def test_flush_goes_to_primary_and_later_reads_follow(routed):
+    db = new_request()
+    assert read_name(db) == "replica"
+    db.add(SalCode(sal_code=2, sal_name="written"))
+    db.flush()
+    # 같은 요청에서 쓰기 이후의 읽기는 primary에서 (방금 쓴 행이 보임)
+    assert read_name(db) == "primary"
+    assert db.query(SalCode).filter(SalCode.sal_code == 2).count() == 1
+    db.commit()
+    assert stored_names(routed["primary"]) == ["primary", "written"]
+    assert stored_names(routed["replica"]) == ["replica"]
+
+def test_update_statement_goes_to_primary(routed):
+    db = new_request()
+    db.execute(update(SalCode).where(SalCode.sal_code == 1).values(sal_name="updated"))
+    db.commit()
+    assert stored_names(routed["primary"]) == ["updated"]
+    assert stored_names(routed["replica"]) == ["replica"]
+    assert read_name(db) == "updated"
+
+def test_primary_flag_routes_reads_to_primary(routed):
+    database.remove_db_session()
+    db = database.get_db_session(primary=True)
+    assert read_name(db) == "primary"
+
+def test_identity_sticks_to_primary_after_write(routed):
+    db = new_request("writer")
+    db.execute(update(SalCode).where(SalCode.sal_code == 1).values(sal_name="primary-2"))
+    db.commit()
+
+    # 같은 사용자의 다음 요청은 복제 지연 동안 primary에서 읽음
+    assert read_name(new_request("writer")) == "primary-2"
+    # 다른 사용자나 익명 요청은 replica에서 읽음
+    assert read_name(new_request("other")) == "replica"
+    assert read_name(new_request()) == "replica"
+
+    time.sleep(STICKY_SECONDS + 0.1)
+    assert read_name(new_request("writer")) == "replica"
+
+def test_read_only_request_does_not_stick(routed):
+    db = new_request("reader")
+    assert read_name(db) == "replica"
+    db.commit()
+    assert read_name(new_request("reader")) == "replica"
@@ -0,0 +1,110 @@
+# tests/test_login_sweep.py
+"""sweep_expired_logins, cap_user_logins가 batch_size개씩 조회/삭제하고 폐기한 jti를 refresh_token_cache에 기록하는지 확인합니다."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.models.login import Login, sweep_expired_logins, cap_user_logins
+from app.models.refresh_token_cache import refresh_token_cache, REVOKED
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+BATCH_SIZE = 3
+
+@pytest.fixture
+def db(sqlite_engine):
+    refresh_token_cache.clear()
+    session = sessionmaker(bind=sqlite_engine)()
+    yield session
+    session.close()
+    refresh_token_cache.clear()
+
+def add_logins(db, user_id: str, count: int, expired: bool = False) -> list:
+    """user_id의 Login을 count개 추가합니다. (created_at은 뒤로 갈수록 최근)"""
+    kind = "expired" if expired else "valid"
+    logins = [
+        Login(
+            user_id=user_id, refresh_token=f"token-{user_id}-{kind}-{i}", refresh_jti=f"jti-{user_id}-{kind}-{i}",
+            created_at=NOW - timedelta(days=30) + timedelta(minutes=i),
+            expires_at=NOW - timedelta(hours=1) if expired else NOW + timedelta(days=1),
+        )
+        for i in range(count)
+    ]
+    db.add_all(logins)
+    db.commit()
+    return [login.refresh_jti for login in logins]
+
+class StatementLog:
+    """엔진에서 실행된 SELECT(Login 행 조회)와 DELETE 문을 기록"""
+    def __init__(self, engine):
+        self.engine = engine
+        self.selects = []
+        self.deletes = 0
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._capture)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._capture)
+
+    def _capture(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("DELETE FROM \"Login\""):
+            self.deletes += 1
+        elif statement.startswith("SELECT \"Login\".refresh_id"):
+            self.selects.append((statement, parameters))
+
+    def all_limited(self, limit: int) -> bool:
+        """Login 행 조회가 모두 LIMIT limit으로 실행되었는지 확인 (SQLite는 OFFSET만 있으면 LIMIT -1로 실행)"""
+        return bool(self.selects) and all("LIMIT" in statement and limit in parameters and -1 not in parameters for statement, parameters in self.selects)
+
+def remaining_jtis(db) -> set:
+    return {jti for (jti,) in db.query(Login.refresh_jti)}
+
+def is_revoked(jti: str) -> bool:
+    """refresh_token_cache에 폐기로 기록되었는지 확인 (캐시에 없으면 loader 결과로 유효하다고 판단)"""
+    return refresh_token_cache.lookup(jti, lambda: ("user", NOW.timestamp())) == REVOKED
+
+def test_sweep_deletes_expired_logins_in_batches(db, sqlite_engine):
+    expired = add_logins(db, "user-a", 5, expired=True) + add_logins(db, "user-b", 3, expired=True)
+    valid = add_logins(db, "user-a", 2)
+
+    with StatementLog(sqlite_engine) as log:
+        result = sweep_expired_logins(db, NOW, batch_size=BATCH_SIZE)
+
+    assert result == {"success": True, "deleted": 8}
+    assert log.deletes == 3  # 8행 / 3개씩
+    assert log.all_limited(BATCH_SIZE)
+    assert remaining_jtis(db) == set(valid)
+    assert all(is_revoked(jti) for jti in expired)
+    assert not any(is_revoked(jti) for jti in valid)
+
+    # 다시 실행해도 이미 삭제된 행은 건너뜀
+    assert sweep_expired_logins(db, NOW, batch_size=BATCH_SIZE) == {"success": True, "deleted": 0}
+
+def test_cap_keeps_latest_sessions_per_user_in_batches(db, sqlite_engine):
+    user_a = add_logins(db, "user-a", 10)
+    user_b = add_logins(db, "user-b", 2)
+    user_c = add_logins(db, "user-c", 4)
+
+    with StatementLog(sqlite_engine) as log:
+        result = cap_user_logins(db, max_sessions=2, batch_size=BATCH_SIZE)
+
+    # user-a: 8개, user-c: 2개 삭제 (가장 최근 2개만 남음)
+    assert result == {"success": True, "deleted": 10}
+    assert remaining_jtis(db) == set(user_a[-2:] + user_b + user_c[-2:])
+    # 삭제할 행은 한 번에 batch_size개까지만 조회하고 배치마다 삭제
+    assert log.all_limited(BATCH_SIZE)
+    assert log.deletes == 4  # user-a: 3 + 3 + 2, user-c: 2
+    assert all(is_revoked(jti) for jti in user_a[:-2] + user_c[:-2])
+
+    assert cap_user_logins(db, max_sessions=2, batch_size=BATCH_SIZE) == {"success": True, "deleted": 0}
+
+def test_cap_pages_through_users_over_limit(db):
+    kept = []
+    for i in range(BATCH_SIZE * 2 + 1):
+        kept += add_logins(db, f"user-{i:02d}", 3)[-1:]
+
+    assert cap_user_logins(db, max_sessions=1, batch_size=BATCH_SIZE) == {"success": True, "deleted": (BATCH_SIZE * 2 + 1) * 2}
+    assert remaining_jtis(db) == set(kept)
@@ -0,0 +1,44 @@
+# tests/test_migrations.py
+"""
+이전 버전 스키마(후속 migration이 추가하는 인덱스가 없는 DB)에 alembic upgrade head를 적용하면
+모델 선언과 같은 스키마가 되는지(alembic check) 확인합니다.
+"""
+import os
+from argparse import Namespace
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect, text
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 0002 이후 migration이 추가하는 인덱스 (JobPostingChange 테이블 제외)
+MIGRATION_INDEXES = (
+    "uq_login_refresh_jti", "ix_login_expires_at", "ix_job_posting_status_deadline",
+    "ix_job_posting_deadline_date", "ix_job_posting_last_updated_date", "ix_job_posting_poster_title", "ft_poster_title",
+)
+
+def make_alembic_config(db_url: str) -> Config:
+    config = Config(os.path.join(ROOT_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(ROOT_DIR, "migrations"))
+    config.cmd_opts = Namespace(x=[f"db_url={db_url}"])
+    return config
+
+def job_posting_indexes(engine) -> set:
+    return {index["name"] for index in inspect(engine).get_indexes("JobPosting")}
+
+def test_upgrade_head_matches_models(sqlite_engine):
+    with sqlite_engine.begin() as conn:
+        for index_name in MIGRATION_INDEXES:
+            conn.execute(text(f"DROP INDEX {index_name}"))
+        conn.execute(text('DROP TABLE "JobPostingChange"'))  # 0005에서 추가
+    config = make_alembic_config(str(sqlite_engine.url))
+
+    command.stamp(config, "0001")
+    command.upgrade(config, "head")
+    command.check(config)  # 모델과 다르면 AutogenerateDiffsDetected 발생
+    assert "ft_poster_title" in job_posting_indexes(sqlite_engine)
+
+    command.downgrade(config, "0003")
+    assert "ft_poster_title" not in job_posting_indexes(sqlite_engine)
+    command.upgrade(config, "head")
+    command.check(config)
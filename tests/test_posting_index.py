@@ -0,0 +1,183 @@
+# tests/test_posting_index.py
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, update
+from sqlalchemy.orm import sessionmaker
+
+from app.models.company import Company
+from app.models.edu_code import EduCode
+from app.models.job_code import JobCode
+from app.models.job_posting import JobPosting, get_available_job_postings, get_available_job_posting_facets, expire_job_postings, update_job_posting, delete_job_posting, facet_cache, POSTER_STATUS_INACTIVE
+from app.models.job_posting_change import JobPostingChange, record_job_posting_changes
+from app.models.job_posting_job import JobPostingJob
+from app.models.job_posting_loc import JobPostingLoc
+from app.models.loc_code import LocCode
+from app.models.pagination import count_cache
+from app.models.posting_index import AvailablePostingIndex, CHANGE_LOG_OVERLAP
+from app.models.sal_code import SalCode
+from app.models.title_search import configure_title_search, TITLE_SEARCH_LIKE
+from app.models.user import User
+from app.models.user_level import UserLevel
+
+POSTING_COUNT = 300
+LOC_CODES = [101000, 101010, 101020, 102000, 102010]
+JOB_CODES = [2225, 2259, 2300]
+TITLE_WORDS = ["정규직", "경력", "신입", "채용", "개발자", "백엔드", "데이터", "회계", "Python"]
+
+FILTER_CASES = [
+    None,
+    {"sal_code_gte": 2},
+    {"edu_code_eq": 1, "sal_code_lte": 3},
+    {"loc_codes": [101000]},
+    {"loc_codes": [101010, 102010], "loc_codes_match": "all"},
+    {"job_codes": [2259], "job_codes_match": "any"},
+    {"title_contains": "데이터"},
+    {"deadline_date_gte": (date.today() + timedelta(days=5)).isoformat()},
+]
+SORT_CASES = [{name: {"sorting_method": method}} for name in ("deadline_date", "last_updated_date", "edu_code", "sal_code") for method in (0, 1)]
+
+def seed(db, seed_value: int = 0):
+    rnd = random.Random(seed_value)
+    for mcode in (101000, 102000):
+        for code in (mcode, mcode + 10, mcode + 20):
+            db.add(LocCode(loc_code=code, loc_name=f"loc-{code}", loc_mcode=mcode, loc_mname=f"loc-{mcode}"))
+    for code in JOB_CODES:
+        db.add(JobCode(job_code=code, job_name=f"job-{code}"))
+    for code in range(5):
+        db.add(SalCode(sal_code=code, sal_name=f"sal-{code}"))
+        db.add(EduCode(edu_code=code, edu_name=f"edu-{code}"))
+    db.add(UserLevel(user_level=10, user_level_name="normal"))
+    db.add(User(user_id="writer", user_email="writer@example.com", user_level=10, user_password="x", created_date=datetime.now(), last_updated_date=datetime.now()))
+    db.add(Company(comp_id=1, comp_name="company"))
+    db.commit()
+
+    today = date.today()
+    for i in range(POSTING_COUNT):
+        loc_codes = sorted(rnd.sample(LOC_CODES, rnd.randint(1, 2)))
+        job_codes = rnd.sample(JOB_CODES, rnd.randint(1, 2))
+        posting = JobPosting(
+            comp_id=1, poster_id=f"rec-{i:05d}", poster_title=" ".join(rnd.choices(TITLE_WORDS, k=4)),
+            edu_code=rnd.randint(0, 4), deadline_date=today + timedelta(days=rnd.randint(-5, 20)),
+            last_updated_date=today - timedelta(days=rnd.randint(0, 30)),
+            job_codes=[str(code) for code in job_codes], loc_codes=[str(code) for code in loc_codes],
+            sal_code=rnd.randint(0, 4), poster_status=rnd.choice([0, 1, 1, 1, 2]), poster_writer_user_id="writer", view_cnts=0,
+        )
+        db.add(posting)
+        db.add_all(JobPostingJob(poster_id=posting.poster_id, job_code=code) for code in job_codes)
+        db.add_all(JobPostingLoc(poster_id=posting.poster_id, loc_code=code) for code in loc_codes)
+    db.commit()
+
+@pytest.fixture
+def db(sqlite_engine):
+    # SQL 경로의 제목 검색은 프로세스 전역 역색인 대신 LIKE로 비교 (테스트에서 직접 변경한 행도 반영되도록)
+    configure_title_search(TITLE_SEARCH_LIKE)
+    count_cache.invalidate()
+    facet_cache.invalidate()
+    session = sessionmaker(bind=sqlite_engine)()
+    seed(session)
+    yield session
+    session.close()
+    configure_title_search()
+
+def assert_same_as_sql(db, index: AvailablePostingIndex):
+    count_cache.invalidate()
+    facet_cache.invalidate()
+    for filters in FILTER_CASES:
+        for sort_criteria in SORT_CASES:
+            for page in (1, 3):
+                expected = get_available_job_postings(db, page, 20, filters, sort_criteria, count_mode="exact")
+                actual = index.search(page, 20, filters, sort_criteria, count_mode="exact")
+                assert expected["success"] and actual["success"], (expected, actual)
+                assert actual["data"] == expected["data"], (filters, sort_criteria, page)
+        expected = get_available_job_posting_facets(db, filters)
+        actual = index.facets(filters)
+        assert expected["success"] and actual["success"], (expected, actual)
+        assert actual["data"] == expected["data"], filters
+
+def test_index_matches_sql_path(db):
+    index = AvailablePostingIndex()
+    index.load(db)
+    assert_same_as_sql(db, index)
+
+def test_refresh_applies_changes_made_by_other_processes(db):
+    index = AvailablePostingIndex()
+    index.load(db)
+    index._get_snapshot()
+
+    # 변경이 없으면 스냅샷을 다시 만들지 않음
+    version = index._version
+    index.refresh(db)
+    assert index._version == version
+
+    # 다른 프로세스에서의 변경: 삭제, 상태 변경, 마감 공고 정리, 새 공고 (모두 변경 로그에 기록됨)
+    db.query(JobPostingJob).filter(JobPostingJob.poster_id == "rec-00000").delete()
+    db.query(JobPostingLoc).filter(JobPostingLoc.poster_id == "rec-00000").delete()
+    db.commit()
+    assert delete_job_posting(db, "rec-00000")["success"]
+    db.execute(update(JobPosting).where(JobPosting.poster_id == "rec-00001").values(poster_status=POSTER_STATUS_INACTIVE))
+    record_job_posting_changes(db, ["rec-00001"])
+    db.commit()
+    assert expire_job_postings(db)["success"]
+    db.add(JobPosting(
+        comp_id=1, poster_id="rec-new", poster_title="신입 데이터 채용", edu_code=1, deadline_date=date.today() + timedelta(days=3),
+        last_updated_date=date.today() - timedelta(days=60), job_codes=["2225"], loc_codes=["101010"],
+        sal_code=2, poster_status=1, poster_writer_user_id="writer", view_cnts=0,
+    ))
+    db.add(JobPostingJob(poster_id="rec-new", job_code=2225))
+    db.add(JobPostingLoc(poster_id="rec-new", loc_code=101010))
+    record_job_posting_changes(db, ["rec-new"])
+    db.commit()
+
+    index.refresh(db)
+    assert index._version > version
+    assert "rec-00000" not in index._records
+    assert index._records["rec-00001"][7] == POSTER_STATUS_INACTIVE
+    assert "rec-new" in index._records
+    assert_same_as_sql(db, index)
+
+def test_refresh_reads_only_logged_changes(db, sqlite_engine):
+    index = AvailablePostingIndex()
+    index.load(db)
+    db.commit()  # update/delete_job_posting은 db.begin()으로 새 트랜잭션을 시작하므로 읽기 트랜잭션을 먼저 종료
+    assert update_job_posting(db, "rec-00002", new_poster_title="경력 백엔드")["success"]
+
+    statements = []
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+    event.listen(sqlite_engine, "before_cursor_execute", capture)
+    try:
+        index.refresh(db)
+    finally:
+        event.remove(sqlite_engine, "before_cursor_execute", capture)
+
+    assert index._records["rec-00002"][1] == "경력 백엔드"
+    # 변경 로그 조회와 변경된 공고 조회만 실행 (JobPosting 전체를 읽지 않음)
+    posting_reads = [(statement, parameters) for statement, parameters in statements if "FROM \"JobPosting\"" in statement]
+    assert len(posting_reads) == 1 and "IN" in posting_reads[0][0] and "rec-00002" in posting_reads[0][1]
+
+    # 겹쳐 읽는 구간(CHANGE_LOG_OVERLAP)이 지난 변경은 다시 읽지 않음
+    db.execute(update(JobPostingChange).values(changed_at=datetime(2000, 1, 1)))
+    db.commit()
+    index._changes_since = datetime(2000, 1, 1) + CHANGE_LOG_OVERLAP
+    statements.clear()
+    event.listen(sqlite_engine, "before_cursor_execute", capture)
+    try:
+        index.refresh(db)
+    finally:
+        event.remove(sqlite_engine, "before_cursor_execute", capture)
+    assert not [statement for statement, _ in statements if "FROM \"JobPosting\"" in statement]
+
+def test_run_once_prunes_old_changes(db, sqlite_engine):
+    index = AvailablePostingIndex(change_retention_seconds=3600)
+    index.configure(sessionmaker(bind=sqlite_engine))
+    index.load(db)
+    db.commit()
+    assert update_job_posting(db, "rec-00003", new_sal_code=4)["success"]
+    db.add(JobPostingChange(poster_id="rec-00004", changed_at=datetime(2000, 1, 1)))
+    db.commit()
+
+    index.run_once()
+    assert index._records["rec-00003"][2] == 4
+    assert [change.poster_id for change in db.query(JobPostingChange).all()] == ["rec-00003"]
@@ -0,0 +1,63 @@
+# tests/test_refresh_token_cache.py
+import time
+
+from app.models.refresh_token_cache import RefreshTokenCache, REVOKED
+
+TTL_SECONDS = 0.2
+
+class StubLoader:
+    """Login 테이블 대신 사용하는 loader (rows에서 jti를 조회하고 호출 횟수를 기록)"""
+    def __init__(self, rows: dict):
+        self.rows = rows
+        self.calls = 0
+
+    def __call__(self, jti):
+        self.calls += 1
+        return self.rows.get(jti)
+
+def make_cache() -> RefreshTokenCache:
+    cache = RefreshTokenCache()
+    cache.configure(ttl_seconds=TTL_SECONDS, max_entries=100)
+    return cache
+
+def test_lookup_caches_loader_result():
+    cache = make_cache()
+    loader = StubLoader({"jti-1": ("user-1", 2000000000.0)})
+
+    assert cache.lookup("jti-1", lambda: loader("jti-1")) == ("user-1", 2000000000.0)
+    assert cache.lookup("jti-1", lambda: loader("jti-1")) == ("user-1", 2000000000.0)
+    assert loader.calls == 1
+
+def test_deleted_jti_is_served_until_ttl_then_rejected():
+    cache = make_cache()
+    loader = StubLoader({"jti-1": ("user-1", 2000000000.0)})
+    cache.lookup("jti-1", lambda: loader("jti-1"))
+
+    # 다른 프로세스에서 로그아웃해 Login 행이 삭제된 경우 (이 프로세스의 캐시는 갱신되지 않음)
+    del loader.rows["jti-1"]
+    assert cache.lookup("jti-1", lambda: loader("jti-1")) == ("user-1", 2000000000.0)
+
+    time.sleep(TTL_SECONDS + 0.05)
+    assert cache.lookup("jti-1", lambda: loader("jti-1")) == REVOKED
+    assert loader.calls == 2
+
+def test_revoke_takes_effect_immediately_in_same_process():
+    cache = make_cache()
+    loader = StubLoader({"jti-1": ("user-1", 2000000000.0)})
+    cache.add("jti-1", "user-1", 2000000000.0)
+
+    cache.revoke("jti-1")
+    assert cache.lookup("jti-1", lambda: loader("jti-1")) == REVOKED
+    assert loader.calls == 0
+
+def test_disabled_cache_always_uses_loader():
+    cache = RefreshTokenCache()
+    cache.configure(ttl_seconds=0)
+    loader = StubLoader({"jti-1": ("user-1", 2000000000.0)})
+    cache.add("jti-1", "user-1", 2000000000.0)
+    cache.revoke("jti-1")
+
+    assert cache.lookup("jti-1", lambda: loader("jti-1")) == ("user-1", 2000000000.0)
+    del loader.rows["jti-1"]
+    assert cache.lookup("jti-1", lambda: loader("jti-1")) == REVOKED
+    assert loader.calls == 2
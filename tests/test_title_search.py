@@ -0,0 +1,68 @@
+# tests/test_title_search.py
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.job_posting import JobPosting, get_available_job_postings
+from app.models.pagination import count_cache
+from app.models.title_search import title_index, configure_title_search, resolve_title_search_strategy, get_relevance_max_candidates, TITLE_SEARCH_LIKE, TITLE_SEARCH_FULLTEXT, TITLE_SEARCH_INVERTED
+
+# (poster_id, poster_title, 오늘 기준 last_updated_date 일수)
+POSTINGS = [
+    ("rec-1", "데이터 데이터 데이터 분석", -1),
+    ("rec-2", "데이터 엔지니어", -2),
+    ("rec-3", "백엔드 개발자 (데이터 플랫폼)", -3),
+    ("rec-4", "데이터", -10),
+    ("rec-5", "회계 담당자", -1),
+]
+
+@pytest.fixture(autouse=True)
+def reset_title_search():
+    yield
+    configure_title_search("", 1000)
+    title_index.clear()  # inverted 전략이 이 테스트의 DB로 적재한 역색인
+
+@pytest.fixture
+def db(sqlite_engine):
+    count_cache.invalidate()
+    session = sessionmaker(bind=sqlite_engine)()
+    today = date.today()
+    for poster_id, title, days in POSTINGS:
+        session.add(JobPosting(
+            comp_id=1, poster_id=poster_id, poster_title=title, edu_code=0, deadline_date=today + timedelta(days=10),
+            last_updated_date=today + timedelta(days=days), job_codes=[], loc_codes=[], sal_code=0, poster_status=1,
+            poster_writer_user_id="writer", view_cnts=0,
+        ))
+    session.commit()
+    yield session
+    session.close()
+
+def test_configure_rejects_unknown_values():
+    with pytest.raises(ValueError):
+        configure_title_search("elasticsearch")
+    with pytest.raises(ValueError):
+        configure_title_search("", 0)
+    # 잘못된 값은 기존 설정을 바꾸지 않음
+    assert resolve_title_search_strategy("mysql") == TITLE_SEARCH_FULLTEXT
+
+def test_strategy_defaults_by_dialect_and_can_be_overridden():
+    assert resolve_title_search_strategy("mysql") == TITLE_SEARCH_FULLTEXT
+    assert resolve_title_search_strategy("sqlite") == TITLE_SEARCH_INVERTED
+    configure_title_search(TITLE_SEARCH_LIKE, 50)
+    assert resolve_title_search_strategy("mysql") == TITLE_SEARCH_LIKE
+    assert get_relevance_max_candidates() == 50
+
+def relevance_ids(db, item_counts: int = 20) -> tuple:
+    result = get_available_job_postings(db, 1, item_counts, {"title_contains": "데이터"}, {"relevance": {"sorting_method": 1}}, count_mode="exact")
+    assert result["success"], result
+    return [posting["poster_id"] for posting in result["data"]["postings"]], result["data"]["total_count"]
+
+@pytest.mark.parametrize("strategy", [TITLE_SEARCH_LIKE, TITLE_SEARCH_INVERTED])
+def test_relevance_sort_ranks_at_most_max_candidates(db, strategy):
+    configure_title_search(strategy, 1000)
+    assert relevance_ids(db) == (["rec-1", "rec-4", "rec-2", "rec-3"], 4)
+
+    # 최근 수정된 3개(rec-1, rec-2, rec-3)만 점수를 계산
+    configure_title_search(strategy, 3)
+    assert relevance_ids(db) == (["rec-1", "rec-2", "rec-3"], 3)
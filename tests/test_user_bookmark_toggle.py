@@ -0,0 +1,65 @@
+# tests/test_user_bookmark_toggle.py
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.models.user_bookmark import UserBookmark, toggle_user_bookmark
+from app.models.bookmark_cache import bookmark_cache
+
+TOGGLE_COUNT = 41
+WORKERS = 8
+
+@pytest.fixture
+def session_factory(sqlite_engine):
+    # SQLite는 외래 키를 검사하지 않으므로 User/JobPosting 행은 만들지 않음
+    bookmark_cache.invalidate()
+    yield sessionmaker(bind=sqlite_engine)
+    bookmark_cache.invalidate()
+
+def toggle(session_factory):
+    db = session_factory()
+    try:
+        return toggle_user_bookmark(db, "user-1", "poster-1")
+    finally:
+        db.close()
+
+def test_parallel_toggles_on_same_pair(session_factory):
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        results = list(executor.map(lambda _: toggle(session_factory), range(TOGGLE_COUNT)))
+
+    assert all(result["success"] for result in results), [result for result in results if not result["success"]]
+
+    db = session_factory()
+    try:
+        rows = db.query(UserBookmark).filter(UserBookmark.user_id == "user-1", UserBookmark.poster_id == "poster-1").count()
+        # 토글은 직렬화되므로 홀수 번 토글하면 등록된 상태
+        assert rows == TOGGLE_COUNT % 2
+        assert sum(result["bookmarked"] for result in results) == (TOGGLE_COUNT + 1) // 2
+        # 북마크 집합 캐시도 DB와 같은 상태
+        assert ("poster-1" in bookmark_cache.get(db, "user-1")) == bool(rows)
+    finally:
+        db.close()
+
+class DeadlockOnce:
+    """첫 번째 INSERT에서 MySQL 교착 상태(1213) 오류를 한 번 발생시키는 execute 래퍼"""
+    def __init__(self, execute):
+        self.execute = execute
+        self.raised = False
+
+    def __call__(self, statement, *args, **kwargs):
+        if not self.raised and statement.is_insert:
+            self.raised = True
+            raise OperationalError(str(statement), {}, Exception(1213, "Deadlock found when trying to get lock; try restarting transaction"))
+        return self.execute(statement, *args, **kwargs)
+
+def test_toggle_retries_after_deadlock(session_factory):
+    db = session_factory()
+    try:
+        db.execute = DeadlockOnce(db.execute)
+        assert toggle_user_bookmark(db, "user-1", "poster-1") == {"success": True, "bookmarked": True}
+        assert db.execute.raised
+        assert db.query(UserBookmark).count() == 1
+    finally:
+        db.close()
@@ -0,0 +1,66 @@
+# tools/bench/serializer_bench.py
+"""
+/jobs/ 응답 직렬화 벤치마크 (flask-restx 기본 json.dumps와 views/serializer.py의 직렬화 함수 비교)
+
+python -m tools.bench.serializer_bench [--repeat 2000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.views.serializer import dumps_json, dumps_orjson, orjson
+
+def make_payload(item_counts: int, with_isoformat: bool) -> dict:
+    today = date.today()
+    postings = []
+    for i in range(item_counts):
+        deadline_date = today + timedelta(days=random.randint(0, 60))
+        postings.append({
+            "comp_id": random.randint(1, 500),
+            "poster_id": f"rec-{49000000 + i}",
+            "poster_title": "[아이디클리닉] 네트워크 마케팅 팀장 채용 " + str(i),
+            "deadline_date": deadline_date.isoformat() if with_isoformat else deadline_date,
+            "edu_code": random.randint(0, 5),
+            "job_codes": ["2225", "2259"],
+            "loc_codes": ["101000", "101010"],
+            "sal_code": random.randint(0, 20),
+            "poster_status": 1,
+        })
+    return {
+        "status": "success",
+        "message": "채용 공고 목록을 성공적으로 조회했습니다.",
+        "data": {"postings": postings, "total_count": 584, "current_page": 1, "total_page": 30, "has_next": True},
+    }
+
+def bench(name, fn, payload, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(payload)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{name:<36} {elapsed * 1000000:10.1f} us/response")
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--repeat", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    random.seed(0)
+    for item_counts in (20, 100):
+        print(f"--- {item_counts} items ---")
+        iso_payload = make_payload(item_counts, with_isoformat=True)
+        native_payload = make_payload(item_counts, with_isoformat=False)
+        # 기존 방식: flask-restx 기본 output_json (json.dumps, ensure_ascii=True)
+        bench("json (flask-restx default)", lambda payload: json.dumps(payload).encode("utf-8"), iso_payload, args.repeat)
+        bench("json (ensure_ascii=False, dates)", dumps_json, native_payload, args.repeat)
+        if orjson is not None:
+            bench("orjson (native dates)", dumps_orjson, native_payload, args.repeat)
+        print(f"{'size (restx default / utf-8)':<36} {len(json.dumps(iso_payload).encode('utf-8'))} / {len(dumps_json(native_payload))} bytes")
+
+if __name__ == "__main__":
+    main()
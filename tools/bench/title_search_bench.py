@@ -0,0 +1,86 @@
+# tools/bench/title_search_bench.py
+"""
+제목 검색 전략 벤치마크
+실제 목록 조회와 같은 조건(create_filter_for_job_postings의 title_contains 필터)으로 JobPosting을 조회합니다.
+fulltext 전략은 FULLTEXT 후보 검색 뒤 LIKE로 다시 확인하는 조건까지 포함해 측정합니다.
+
+python -m tools.bench.title_search_bench [--postings 200000] [--repeat 20] [--mysql]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.models import Base, SQLALCHEMY_DATABASE_URI
+from app.models.job_posting import JobPosting, create_filter_for_job_postings
+from app.models.title_search import title_index, TITLE_SEARCH_LIKE, TITLE_SEARCH_FULLTEXT, TITLE_SEARCH_INVERTED
+# JobPosting 외래 키가 참조하는 테이블 등록
+from app.models import company, edu_code, sal_code, user, user_level  # noqa: F401
+
+WORDS = ["정규직", "경력", "신입", "채용", "개발자", "백엔드", "프론트엔드", "데이터", "엔지니어", "마케팅",
+         "영업", "회계", "재무", "인사", "기획", "디자이너", "Python", "Java", "서버", "모집", "팀장", "인턴"]
+KEYWORDS = ["백엔드 개발자", "데이터", "Python", "회계"]
+
+def make_sqlite_session(postings: int) -> Session:
+    """제목만 임의로 생성한 JobPosting 행을 가진 메모리 SQLite 세션 (외래 키는 검사하지 않음)"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[JobPosting.__table__])
+    random.seed(0)
+    today = date.today()
+    rows = [{
+        "comp_id": 1, "poster_id": f"rec-{i}", "poster_title": f"[회사{i % 997}] " + " ".join(random.choices(WORDS, k=6)),
+        "edu_code": 0, "deadline_date": today, "last_updated_date": today, "job_codes": [], "loc_codes": [],
+        "sal_code": 0, "poster_status": 1, "poster_writer_user_id": "admin", "view_cnts": 0,
+    } for i in range(postings)]
+    with engine.begin() as conn:
+        conn.execute(JobPosting.__table__.insert(), rows)
+    return Session(engine)
+
+def bench(name: str, db: Session, strategy: str, repeat: int):
+    """create_filter_for_job_postings로 만든 조건으로 poster_id를 조회하는 시간을 측정합니다."""
+    def run(keyword):
+        return db.query(JobPosting.poster_id).filter(create_filter_for_job_postings({"title_contains": keyword}, strategy)).all()
+
+    counts = {keyword: len(run(keyword)) for keyword in KEYWORDS}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for keyword in KEYWORDS:
+            run(keyword)
+    elapsed = (time.perf_counter() - start) / (repeat * len(KEYWORDS))
+    print(f"{name:<18} {elapsed * 1000:10.3f} ms/query  matches={counts}")
+
+def bench_inverted(name: str, db: Session, repeat: int):
+    title_index.clear()
+    start = time.perf_counter()
+    title_index.ensure_loaded(lambda: db.query(JobPosting.poster_id, JobPosting.poster_title).all())
+    print(f"inverted index build: {(time.perf_counter() - start) * 1000:.1f} ms")
+    bench(name, db, TITLE_SEARCH_INVERTED, repeat)
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--postings", type=int, default=200000)
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    arg_parser.add_argument("--mysql", action="store_true", help=".env의 MySQL JobPosting 테이블로 like/fulltext/inverted 전략 측정")
+    args = arg_parser.parse_args()
+
+    db = make_sqlite_session(args.postings)
+    bench(f"{TITLE_SEARCH_LIKE}(sqlite)", db, TITLE_SEARCH_LIKE, args.repeat)
+    bench_inverted(f"{TITLE_SEARCH_INVERTED}(sqlite)", db, args.repeat)
+    db.close()
+
+    if args.mysql:
+        db = Session(create_engine(SQLALCHEMY_DATABASE_URI))
+        bench(f"{TITLE_SEARCH_LIKE}(mysql)", db, TITLE_SEARCH_LIKE, args.repeat)
+        bench(f"{TITLE_SEARCH_FULLTEXT}(mysql)", db, TITLE_SEARCH_FULLTEXT, args.repeat)
+        bench_inverted(f"{TITLE_SEARCH_INVERTED}(mysql)", db, args.repeat)
+        db.close()
+
+if __name__ == "__main__":
+    main()